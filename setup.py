@@ -42,6 +42,7 @@ setup(
         'redis': ['redis>=2.10.5'],
         'uwsgi': ['uwsgi>=2.0.0'],
         'cpphash': ['mmh3cffi==0.2.0'],
+        'numpy': ['numpy>=1.16.0'],
     },
     setup_requires=['pytest-runner'],
     classifiers=[
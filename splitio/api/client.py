@@ -1,13 +1,19 @@
 """Synchronous HTTP Client for split API."""
 from __future__ import division
 
+import json
+import os
+import zlib
 from collections import namedtuple
 
 from future.utils import raise_from
 import requests
+from requests.adapters import HTTPAdapter
 
 HttpResponse = namedtuple('HttpResponse', ['status_code', 'body'])
 
+DEFAULT_POOL_SIZE = 10
+
 
 class HttpClientException(Exception):
     """HTTP Client exception."""
@@ -29,7 +35,8 @@ class HttpClient(object):
     EVENTS_URL = 'https://events.split.io/api'
     AUTH_URL = 'https://auth.split.io/api'
 
-    def __init__(self, timeout=None, sdk_url=None, events_url=None, auth_url=None):
+    def __init__(self, timeout=None, sdk_url=None, events_url=None, auth_url=None,  # pylint: disable=too-many-arguments
+                 pool_size=DEFAULT_POOL_SIZE, compression_enabled=False):
         """
         Class constructor.
 
@@ -41,6 +48,10 @@ class HttpClient(object):
         :type events_url: str
         :param auth_url: Optional alternative auth URL.
         :type auth_url: str
+        :param pool_size: Maximum number of connections kept alive per server.
+        :type pool_size: int
+        :param compression_enabled: Whether to gzip bodies of posts that allow it.
+        :type compression_enabled: bool
         """
         self._timeout = timeout/1000 if timeout else None  # Convert ms to seconds.
         self._urls = {
@@ -48,6 +59,28 @@ class HttpClient(object):
             'events': events_url if events_url is not None else self.EVENTS_URL,
             'auth': auth_url if auth_url is not None else self.AUTH_URL,
         }
+        self._compression_enabled = compression_enabled
+        self._pool_size = pool_size
+        self._session = (None, None)
+
+    def _get_session(self):
+        """
+        Return the session of the current process, creating it on first use and after a fork.
+
+        Connection pools are thread-safe, so a single session is shared by all the synchronizers
+        (including the segments worker pool), reusing connections per server. Sockets must not be
+        shared with a parent process though (ie: uWSGI preforking), hence one session per pid.
+
+        :rtype: requests.Session
+        """
+        pid = os.getpid()
+        session_pid, session = self._session
+        if session_pid != pid:
+            session = requests.Session()
+            for prefix in ('https://', 'http://'):
+                session.mount(prefix, HTTPAdapter(pool_maxsize=self._pool_size))
+            self._session = (pid, session)
+        return session
 
     def _build_url(self, server, path):
         """
@@ -76,6 +109,22 @@ class HttpClient(object):
             'Authorization': "Bearer %s" % apikey
         }
 
+    @staticmethod
+    def _gzip(body):
+        """
+        Serialize and gzip a request body.
+
+        :param body: body to send.
+        :type body: object
+
+        :return: gzipped json.
+        :rtype: bytes
+        """
+        # 16 + MAX_WBITS makes zlib write a gzip header and trailer.
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED,
+                                      16 + zlib.MAX_WBITS)
+        return compressor.compress(json.dumps(body).encode('utf-8')) + compressor.flush()
+
     def get(self, server, path, apikey, query=None, extra_headers=None):  # pylint: disable=too-many-arguments
         """
         Issue a get request.
@@ -99,7 +148,7 @@ class HttpClient(object):
             headers.update(extra_headers)
 
         try:
-            response = requests.get(
+            response = self._get_session().get(
                 self._build_url(server, path),
                 params=query,
                 headers=headers,
@@ -109,7 +158,7 @@ class HttpClient(object):
         except Exception as exc:  # pylint: disable=broad-except
             raise_from(HttpClientException('requests library is throwing exceptions'), exc)
 
-    def post(self, server, path, apikey, body, query=None, extra_headers=None):  # pylint: disable=too-many-arguments
+    def post(self, server, path, apikey, body, query=None, extra_headers=None, compress=False):  # pylint: disable=too-many-arguments
         """
         Issue a POST request.
 
@@ -125,6 +174,8 @@ class HttpClient(object):
         :type query: dict
         :param extra_headers: key/value pairs of possible extra headers.
         :type extra_headers: dict
+        :param compress: Whether the body may be gzipped, if compression is enabled.
+        :type compress: bool
 
         :return: Tuple of status_code & response text
         :rtype: HttpResponse
@@ -135,13 +186,23 @@ class HttpClient(object):
             headers.update(extra_headers)
 
         try:
-            response = requests.post(
-                self._build_url(server, path),
-                json=body,
-                params=query,
-                headers=headers,
-                timeout=self._timeout
-            )
+            if compress and self._compression_enabled:
+                headers['Content-Encoding'] = 'gzip'
+                response = self._get_session().post(
+                    self._build_url(server, path),
+                    data=self._gzip(body),
+                    params=query,
+                    headers=headers,
+                    timeout=self._timeout
+                )
+            else:
+                response = self._get_session().post(
+                    self._build_url(server, path),
+                    json=body,
+                    params=query,
+                    headers=headers,
+                    timeout=self._timeout
+                )
             return HttpResponse(response.status_code, response.text)
         except Exception as exc:  # pylint: disable=broad-except
             raise_from(HttpClientException('requests library is throwing exceptions'), exc)
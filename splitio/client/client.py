@@ -4,8 +4,7 @@ from __future__ import absolute_import, division, print_function, \
 
 import logging
 import time
-import six
-from splitio.engine.evaluator import Evaluator, CONTROL
+from splitio.engine.evaluator import Evaluator, EvaluationResult, CONTROL
 from splitio.engine.splitters import Splitter
 from splitio.models.impressions import Impression, Label
 from splitio.models.events import Event, EventWrapper
@@ -67,25 +66,22 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
         """Return whether the factory holding this client has been destroyed."""
         return self._factory.destroyed
 
-    def _evaluate_if_ready(self, matching_key, bucketing_key, feature, attributes=None):
+    def _evaluate_if_ready(self, matching_key, bucketing_key, feature, attributes=None,  # pylint: disable=too-many-arguments
+                           split=None):
         if not self.ready:
-            return {
-                'treatment': CONTROL,
-                'configurations': None,
-                'impression': {
-                    'label': Label.NOT_READY,
-                    'change_number': None
-                }
-            }
+            return EvaluationResult(CONTROL, Label.NOT_READY, None)
 
         return self._evaluator.evaluate_feature(
             feature,
             matching_key,
             bucketing_key,
-            attributes
+            attributes,
+            split
         )
 
-    def _make_evaluation(self, key, feature, attributes, method_name, metric_name):
+    def _make_evaluation(self, key, feature, attributes, method_name, metric_name,  # pylint: disable=too-many-arguments
+                         with_config=True):
+        split = None
         try:
             if self.destroyed:
                 _LOGGER.error("Client has already been destroyed - no calls possible")
@@ -97,7 +93,7 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
             start = int(round(time.time() * 1000))
 
             matching_key, bucketing_key = input_validator.validate_key(key, method_name)
-            feature = input_validator.validate_feature_name(
+            feature, split = input_validator.validate_feature_name_and_fetch(
                 feature,
                 self.ready,
                 self._factory._get_storage('splits'),  # pylint: disable=protected-access
@@ -109,20 +105,21 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
                     or not input_validator.validate_attributes(attributes, method_name):
                 return CONTROL, None
 
-            result = self._evaluate_if_ready(matching_key, bucketing_key, feature, attributes)
+            result = self._evaluate_if_ready(matching_key, bucketing_key, feature, attributes,
+                                             split)
 
             impression = self._build_impression(
                 matching_key,
                 feature,
-                result['treatment'],
-                result['impression']['label'],
-                result['impression']['change_number'],
+                result.treatment,
+                result.label,
+                result.change_number,
                 bucketing_key,
                 utctime_ms(),
             )
 
             self._record_stats([(impression, attributes)], start, metric_name)
-            return result['treatment'], result['configurations']
+            return result.treatment, result.configurations if with_config else None
         except Exception:  # pylint: disable=broad-except
             _LOGGER.error('Error getting treatment for feature')
             _LOGGER.debug('Error: ', exc_info=True)
@@ -132,7 +129,8 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
                     feature,
                     CONTROL,
                     Label.EXCEPTION,
-                    self._split_storage.get_change_number(),
+                    split.change_number if split is not None
+                    else self._split_storage.get_change_number(),
                     bucketing_key,
                     utctime_ms(),
                 )
@@ -142,24 +140,45 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
                 _LOGGER.debug('Error: ', exc_info=True)
             return CONTROL, None
 
-    def _make_evaluations(self, key, features, attributes, method_name, metric_name):
+    @staticmethod
+    def _control_treatments(features, method_name, with_config):
+        """
+        Build the result of evaluations that could not take place.
+
+        :param features: Features requested.
+        :type features: list
+        :param method_name: user operation
+        :type method_name: str
+        :param with_config: Whether to include (null) configurations.
+        :type with_config: bool
+
+        :return: CONTROL treatment for each valid feature name.
+        :rtype: dict
+        """
+        controls = input_validator.generate_control_treatments(features, method_name)
+        if with_config:
+            return controls
+        return {feature: CONTROL for feature in controls}
+
+    def _make_evaluations(self, key, features, attributes, method_name, metric_name,  # pylint: disable=too-many-arguments
+                          with_config=True):
         if self.destroyed:
             _LOGGER.error("Client has already been destroyed - no calls possible")
-            return input_validator.generate_control_treatments(features, method_name)
+            return self._control_treatments(features, method_name, with_config)
         if self._factory._waiting_fork():
             _LOGGER.error("Client is not ready - no calls possible")
-            return input_validator.generate_control_treatments(features, method_name)
+            return self._control_treatments(features, method_name, with_config)
 
         start = int(round(time.time() * 1000))
 
         matching_key, bucketing_key = input_validator.validate_key(key, method_name)
         if matching_key is None and bucketing_key is None:
-            return input_validator.generate_control_treatments(features, method_name)
+            return self._control_treatments(features, method_name, with_config)
 
         if input_validator.validate_attributes(attributes, method_name) is False:
-            return input_validator.generate_control_treatments(features, method_name)
+            return self._control_treatments(features, method_name, with_config)
 
-        features, missing = input_validator.validate_features_get_treatments(
+        features, missing, splits = input_validator.validate_features_and_fetch(
             method_name,
             features,
             self.ready,
@@ -168,31 +187,33 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
         if features is None:
             return {}
 
+        control = (CONTROL, None) if with_config else CONTROL
         bulk_impressions = []
-        treatments = {name: (CONTROL, None) for name in missing}
+        treatments = {name: control for name in missing}
 
         try:
             evaluations = self._evaluate_features_if_ready(matching_key, bucketing_key,
-                                                           list(features), attributes)
+                                                           list(features), attributes, splits)
 
             for feature in features:
                 try:
                     result = evaluations[feature]
                     impression = self._build_impression(matching_key,
                                                         feature,
-                                                        result['treatment'],
-                                                        result['impression']['label'],
-                                                        result['impression']['change_number'],
+                                                        result.treatment,
+                                                        result.label,
+                                                        result.change_number,
                                                         bucketing_key,
                                                         utctime_ms())
 
                     bulk_impressions.append(impression)
-                    treatments[feature] = (result['treatment'], result['configurations'])
+                    treatments[feature] = (result.treatment, result.configurations) \
+                        if with_config else result.treatment
 
                 except Exception:  # pylint: disable=broad-except
                     _LOGGER.error('%s: An exception occured when evaluating '
                                   'feature %s returning CONTROL.' % (method_name, feature))
-                    treatments[feature] = CONTROL, None
+                    treatments[feature] = control
                     _LOGGER.debug('Error: ', exc_info=True)
                     continue
 
@@ -213,25 +234,122 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
         except Exception:  # pylint: disable=broad-except
             _LOGGER.error('Error getting treatment for features')
             _LOGGER.debug('Error: ', exc_info=True)
-        return input_validator.generate_control_treatments(list(features), method_name)
+        return self._control_treatments(list(features), method_name, with_config)
 
-    def _evaluate_features_if_ready(self, matching_key, bucketing_key, features, attributes=None):
+    def _evaluate_features_if_ready(self, matching_key, bucketing_key, features, attributes=None,  # pylint: disable=too-many-arguments
+                                    splits=None):
         if not self.ready:
-            return {
-                feature: {
-                    'treatment': CONTROL,
-                    'configurations': None,
-                    'impression': {'label': Label.NOT_READY, 'change_number': None}
-                }
-                for feature in features
-            }
+            not_ready = EvaluationResult(CONTROL, Label.NOT_READY, None)
+            return {feature: not_ready for feature in features}
 
         return self._evaluator.evaluate_features(
             features,
             matching_key,
             bucketing_key,
-            attributes
+            attributes,
+            splits
+        )
+
+    def _evaluate_features_bulk_if_ready(self, keys, features, attributes_list, splits=None):
+        if not self.ready:
+            not_ready = EvaluationResult(CONTROL, Label.NOT_READY, None)
+            return [{feature: not_ready for feature in features} for _ in keys]
+
+        return self._evaluator.evaluate_features_bulk(features, keys, attributes_list, splits)
+
+    def _make_bulk_evaluations(self, keys, features, attributes_list, method_name, metric_name):  # pylint: disable=too-many-locals
+        if not isinstance(keys, list):
+            _LOGGER.error("%s: keys must be an array.", method_name)
+            return []
+
+        if self.destroyed:
+            _LOGGER.error("Client has already been destroyed - no calls possible")
+            controls = self._control_treatments(features, method_name, False)
+            return [dict(controls) for _ in keys]
+        if self._factory._waiting_fork():
+            _LOGGER.error("Client is not ready - no calls possible")
+            controls = self._control_treatments(features, method_name, False)
+            return [dict(controls) for _ in keys]
+
+        start = int(round(time.time() * 1000))
+
+        if attributes_list is None:
+            attributes_list = [None] * len(keys)
+        elif not isinstance(attributes_list, list) or len(attributes_list) != len(keys):
+            _LOGGER.error("%s: attributes_list must be an array with one entry per key.",
+                          method_name)
+            controls = self._control_treatments(features, method_name, False)
+            return [dict(controls) for _ in keys]
+
+        features, missing, splits = input_validator.validate_features_and_fetch(
+            method_name,
+            features,
+            self.ready,
+            self._factory._get_storage('splits')  # pylint: disable=protected-access
         )
+        if features is None:
+            return [{} for _ in keys]
+
+        features = list(features)
+        controls = {name: CONTROL for name in features}
+        controls.update({name: CONTROL for name in missing})
+        results = [None] * len(keys)
+        valid_rows = []
+        for index, (key, attributes) in enumerate(zip(keys, attributes_list)):
+            matching_key, bucketing_key = input_validator.validate_key(key, method_name)
+            if (matching_key is None and bucketing_key is None) \
+                    or not input_validator.validate_attributes(attributes, method_name):
+                results[index] = dict(controls)
+                continue
+            valid_rows.append((index, matching_key, bucketing_key, attributes))
+
+        try:
+            evaluations = self._evaluate_features_bulk_if_ready(
+                [(matching_key, bucketing_key) for (_, matching_key, bucketing_key, _)
+                 in valid_rows],
+                features,
+                [attributes for (_, _, _, attributes) in valid_rows],
+                splits
+            )
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.error('Error getting treatment for features')
+            _LOGGER.debug('Error: ', exc_info=True)
+            return [dict(controls) for _ in keys]
+
+        imp_time = utctime_ms()
+        bulk_impressions = []
+        for (index, matching_key, bucketing_key, attributes), evaluation in \
+                zip(valid_rows, evaluations):
+            treatments = {name: CONTROL for name in missing}
+            for feature in features:
+                try:
+                    result = evaluation[feature]
+                    bulk_impressions.append((self._build_impression(
+                        matching_key,
+                        feature,
+                        result.treatment,
+                        result.label,
+                        result.change_number,
+                        bucketing_key,
+                        imp_time
+                    ), attributes))
+                    treatments[feature] = result.treatment
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.error('%s: An exception occured when evaluating '
+                                  'feature %s returning CONTROL.' % (method_name, feature))
+                    treatments[feature] = CONTROL
+                    _LOGGER.debug('Error: ', exc_info=True)
+            results[index] = treatments
+
+        try:
+            if bulk_impressions:
+                self._record_stats(bulk_impressions, start, metric_name)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.error('%s: An exception when trying to store '
+                          'impressions.' % method_name)
+            _LOGGER.debug('Error: ', exc_info=True)
+
+        return results
 
     def get_treatment_with_config(self, key, feature, attributes=None):
         """
@@ -269,7 +387,7 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
         :rtype: str
         """
         treatment, _ = self._make_evaluation(key, feature, attributes, 'get_treatment',
-                                             self._METRIC_GET_TREATMENT)
+                                             self._METRIC_GET_TREATMENT, with_config=False)
         return treatment
 
     def get_treatments_with_config(self, key, features, attributes=None):
@@ -307,9 +425,28 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
         :return: Dictionary with the result of all the features provided
         :rtype: dict
         """
-        with_config = self._make_evaluations(key, features, attributes, 'get_treatments',
-                                             self._METRIC_GET_TREATMENTS)
-        return {feature: result[0] for (feature, result) in six.iteritems(with_config)}
+        return self._make_evaluations(key, features, attributes, 'get_treatments',
+                                      self._METRIC_GET_TREATMENTS, with_config=False)
+
+    def get_treatments_bulk(self, keys, features, attributes_list=None):
+        """
+        Evaluate multiple features for many keys at once.
+
+        Split definitions are fetched and features validated only once for the whole batch, and
+        all the generated impressions are recorded together. This method never raises an
+        exception. If there's a problem, the appropriate log message will be generated and the
+        method will return the CONTROL treatment.
+        :param keys: Keys for which to get the treatments
+        :type keys: list
+        :param features: Array of the names of the features for which to get the treatment
+        :type feature: list
+        :param attributes_list: An optional array with a dictionary of attributes for each key
+        :type attributes_list: list
+        :return: List with a dictionary of feature/treatments for each key, in the same order
+        :rtype: list(dict)
+        """
+        return self._make_bulk_evaluations(keys, features, attributes_list,
+                                           'get_treatments_bulk', self._METRIC_GET_TREATMENTS)
 
     def _build_impression(  # pylint: disable=too-many-arguments
             self,
@@ -3,6 +3,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import os.path
 import logging
+from enum import Enum
 
 from splitio.engine.impressions import ImpressionsMode
 
@@ -10,14 +11,25 @@ from splitio.engine.impressions import ImpressionsMode
 _LOGGER = logging.getLogger(__name__)
 
 
+class DropPolicy(Enum):
+    """What to do when the async impressions recorder queue is full."""
+
+    DROP_NEWEST = "DROP_NEWEST"
+    DROP_OLDEST = "DROP_OLDEST"
+    BLOCK = "BLOCK"
+
+
 DEFAULT_CONFIG = {
     'operationMode': 'in-memory',
     'connectionTimeout': 1500,
+    'connectionPoolSize': 10,
+    'compressionEnabled': False,
     'splitSdkMachineName': None,
     'splitSdkMachineIp': None,
     'streamingEnabled': True,
     'featuresRefreshRate': 30,
     'segmentsRefreshRate': 30,
+    'changesCacheDir': None,
     'metricsRefreshRate': 60,
     'impressionsRefreshRate': 5 * 60,
     'impressionsBulkSize': 5000,
@@ -26,11 +38,24 @@ DEFAULT_CONFIG = {
     'eventsBulkSize': 5000,
     'eventsQueueSize': 10000,
     'labelsEnabled': True,
+    'evaluationPlansEnabled': False,
+    'compactSegmentsEnabled': False,
+    'segmentBloomFiltersEnabled': False,
+    'segmentBloomFiltersRefreshRate': 5,
     'IPAddressesEnabled': True,
     'impressionsMode': 'OPTIMIZED',
     'impressionListener': None,
+    'impressionsRecordingAsync': False,
+    'impressionsRecordingQueueSize': 10000,
+    'impressionsRecordingDropPolicy': 'DROP_NEWEST',
     'redisLocalCacheEnabled': True,
     'redisLocalCacheTTL': 5,
+    'redisLocalCacheVersioned': True,
+    'redisLocalCacheRefreshAhead': False,
+    'redisRecorderBatchingEnabled': False,
+    'redisRecorderFlushSize': 1000,
+    'redisRecorderFlushIntervalMs': 500,
+    'redisScriptedWritesEnabled': False,
     'redisHost': 'localhost',
     'redisPort': 6379,
     'redisDb': 0,
@@ -109,6 +134,27 @@ def _sanitize_impressions_mode(mode, refresh_rate=None):
     return mode, refresh_rate
 
 
+def _sanitize_drop_policy(policy):
+    """
+    Check supplied async recorder drop policy.
+
+    :param policy: user supplied drop policy
+    :type policy: str
+
+    :returns: drop policy
+    :rtype: DropPolicy
+    """
+    if isinstance(policy, DropPolicy):
+        return policy
+    try:
+        return DropPolicy(policy.upper())
+    except (ValueError, AttributeError):
+        _LOGGER.warning('You passed an invalid impressionsRecordingDropPolicy, it should be one '
+                        'of the following values: `drop_newest`, `drop_oldest` or `block`. '
+                        'Defaulting to `drop_newest`.')
+        return DropPolicy.DROP_NEWEST
+
+
 def sanitize(apikey, config):
     """
     Look for inconsistencies or ill-formed configs and tune it accordingly.
@@ -129,4 +175,6 @@ def sanitize(apikey, config):
                                                     config.get('impressionsRefreshRate'))
     processed['impressionsMode'] = imp_mode
     processed['impressionsRefreshRate'] = imp_rate
+    processed['impressionsRecordingDropPolicy'] = \
+        _sanitize_drop_policy(processed['impressionsRecordingDropPolicy'])
     return processed
@@ -2,7 +2,9 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 
+import hashlib
 import logging
+import os
 import threading
 from collections import Counter
 
@@ -20,6 +22,7 @@ from splitio.engine.impressions import Manager as ImpressionsManager
 from splitio.storage.inmemmory import InMemorySplitStorage, InMemorySegmentStorage, \
     InMemoryImpressionStorage, InMemoryEventStorage, InMemoryTelemetryStorage
 from splitio.storage.adapters import redis
+from splitio.storage.disk import DiskChangesCache
 from splitio.storage.redis import RedisSplitStorage, RedisSegmentStorage, RedisImpressionsStorage, \
     RedisEventsStorage, RedisTelemetryStorage
 from splitio.storage.adapters.uwsgi_cache import get_uwsgi
@@ -53,7 +56,8 @@ from splitio.sync.event import EventSynchronizer
 from splitio.sync.telemetry import TelemetrySynchronizer
 
 # Recorder
-from splitio.recorder.recorder import StandardRecorder, PipelinedRecorder
+from splitio.recorder.recorder import StandardRecorder, PipelinedRecorder, AsyncRecorder, \
+    BatchedPipelinedRecorder
 
 # Localhost stuff
 from splitio.client.localhost import LocalhostEventsStorage, LocalhostImpressionsStorage, \
@@ -216,6 +220,7 @@ class SplitFactory(object):  # pylint: disable=too-many-instance-attributes
             return
 
         try:
+            self._recorder.flush()
             if self._sync_manager is not None:
                 if destroyed_event is not None:
 
@@ -292,6 +297,47 @@ def _wrap_impression_listener(listener, metadata):
     return None
 
 
+def _build_recorder(cfg, impressions_manager, storages):
+    """
+    Build the recorder for standalone and uwsgi modes.
+
+    :param cfg: sanitized config
+    :type cfg: dict
+    :param impressions_manager: impressions manager instance
+    :type impressions_manager: splitio.engine.impressions.Manager
+    :param storages: storages by name
+    :type storages: dict
+
+    :rtype: splitio.recorder.recorder.StandardRecorder
+    """
+    if cfg.get('impressionsRecordingAsync', False):
+        return AsyncRecorder(impressions_manager, storages['telemetry'], storages['events'],
+                             storages['impressions'], cfg['impressionsRecordingQueueSize'],
+                             cfg['impressionsRecordingDropPolicy'])
+    return StandardRecorder(impressions_manager, storages['telemetry'], storages['events'],
+                            storages['impressions'])
+
+
+def _build_changes_cache(api_key, cfg):
+    """
+    Build the on-disk cache of split & segment changes, if enabled.
+
+    Files are kept in a subdirectory per api key so that environments are never mixed.
+
+    :param api_key: SDK api key.
+    :type api_key: str
+    :param cfg: sanitized config
+    :type cfg: dict
+
+    :rtype: splitio.storage.disk.DiskChangesCache
+    """
+    directory = cfg.get('changesCacheDir')
+    if directory is None:
+        return None
+    namespace = hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+    return DiskChangesCache(os.path.join(directory, namespace))
+
+
 def _build_in_memory_factory(api_key, cfg, sdk_url=None, events_url=None,  # pylint:disable=too-many-arguments,too-many-locals
                              auth_api_base_url=None, streaming_api_base_url=None):
     """Build and return a split factory tailored to the supplied config."""
@@ -302,7 +348,9 @@ def _build_in_memory_factory(api_key, cfg, sdk_url=None, events_url=None,  # pyl
         sdk_url=sdk_url,
         events_url=events_url,
         auth_url=auth_api_base_url,
-        timeout=cfg.get('connectionTimeout')
+        timeout=cfg.get('connectionTimeout'),
+        pool_size=cfg['connectionPoolSize'],
+        compression_enabled=cfg['compressionEnabled']
     )
 
     sdk_metadata = util.get_metadata(cfg)
@@ -319,8 +367,8 @@ def _build_in_memory_factory(api_key, cfg, sdk_url=None, events_url=None,  # pyl
         return None
 
     storages = {
-        'splits': InMemorySplitStorage(),
-        'segments': InMemorySegmentStorage(),
+        'splits': InMemorySplitStorage(cfg['evaluationPlansEnabled']),
+        'segments': InMemorySegmentStorage(cfg['compactSegmentsEnabled']),
         'impressions': InMemoryImpressionStorage(cfg['impressionsQueueSize']),
         'events': InMemoryEventStorage(cfg['eventsQueueSize']),
         'telemetry': InMemoryTelemetryStorage()
@@ -331,9 +379,11 @@ def _build_in_memory_factory(api_key, cfg, sdk_url=None, events_url=None,  # pyl
         True,
         _wrap_impression_listener(cfg['impressionListener'], sdk_metadata))
 
+    changes_cache = _build_changes_cache(api_key, cfg)
     synchronizers = SplitSynchronizers(
-        SplitSynchronizer(apis['splits'], storages['splits']),
-        SegmentSynchronizer(apis['segments'], storages['splits'], storages['segments']),
+        SplitSynchronizer(apis['splits'], storages['splits'], changes_cache),
+        SegmentSynchronizer(apis['segments'], storages['splits'], storages['segments'],
+                            changes_cache),
         ImpressionSynchronizer(apis['impressions'], storages['impressions'],
                                cfg['impressionsBulkSize']),
         EventSynchronizer(apis['events'], storages['events'], cfg['eventsBulkSize']),
@@ -373,12 +423,7 @@ def _build_in_memory_factory(api_key, cfg, sdk_url=None, events_url=None,  # pyl
     storages['events'].set_queue_full_hook(tasks.events_task.flush)
     storages['impressions'].set_queue_full_hook(tasks.impressions_task.flush)
 
-    recorder = StandardRecorder(
-        imp_manager,
-        storages['telemetry'],
-        storages['events'],
-        storages['impressions'],
-    )
+    recorder = _build_recorder(cfg, imp_manager, storages)
 
     if preforked_initialization:
         synchronizer.sync_all()
@@ -400,21 +445,40 @@ def _build_redis_factory(api_key, cfg):
     redis_adapter = redis.build(cfg)
     cache_enabled = cfg.get('redisLocalCacheEnabled', False)
     cache_ttl = cfg.get('redisLocalCacheTTL', 5)
+    cache_versioned = cfg.get('redisLocalCacheVersioned', True)
+    cache_refresh_ahead = cfg.get('redisLocalCacheRefreshAhead', False)
     storages = {
-        'splits': RedisSplitStorage(redis_adapter, cache_enabled, cache_ttl),
-        'segments': RedisSegmentStorage(redis_adapter),
-        'impressions': RedisImpressionsStorage(redis_adapter, sdk_metadata),
-        'events': RedisEventsStorage(redis_adapter, sdk_metadata),
+        'splits': RedisSplitStorage(redis_adapter, cache_enabled, cache_ttl, cache_versioned,
+                                    cache_refresh_ahead),
+        'segments': RedisSegmentStorage(redis_adapter, cfg['segmentBloomFiltersEnabled'],
+                                        cfg['segmentBloomFiltersRefreshRate']),
+        'impressions': RedisImpressionsStorage(redis_adapter, sdk_metadata,
+                                               cfg['redisScriptedWritesEnabled']),
+        'events': RedisEventsStorage(redis_adapter, sdk_metadata,
+                                     cfg['redisScriptedWritesEnabled']),
         'telemetry': RedisTelemetryStorage(redis_adapter, sdk_metadata)
     }
-    recorder = PipelinedRecorder(
-        redis_adapter.pipeline,
-        ImpressionsManager(cfg['impressionsMode'], False,
-                           _wrap_impression_listener(cfg['impressionListener'], sdk_metadata)),
-        storages['telemetry'],
-        storages['events'],
-        storages['impressions'],
-    )
+    impressions_manager = ImpressionsManager(
+        cfg['impressionsMode'], False,
+        _wrap_impression_listener(cfg['impressionListener'], sdk_metadata))
+    if cfg.get('redisRecorderBatchingEnabled', False):
+        recorder = BatchedPipelinedRecorder(
+            redis_adapter.pipeline,
+            impressions_manager,
+            storages['telemetry'],
+            storages['events'],
+            storages['impressions'],
+            cfg['redisRecorderFlushSize'],
+            cfg['redisRecorderFlushIntervalMs'],
+        )
+    else:
+        recorder = PipelinedRecorder(
+            redis_adapter.pipeline,
+            impressions_manager,
+            storages['telemetry'],
+            storages['events'],
+            storages['impressions'],
+        )
     return SplitFactory(
         api_key,
         storages,
@@ -429,17 +493,17 @@ def _build_uwsgi_factory(api_key, cfg):
     uwsgi_adapter = get_uwsgi()
     storages = {
         'splits': UWSGISplitStorage(uwsgi_adapter),
-        'segments': UWSGISegmentStorage(uwsgi_adapter),
+        'segments': UWSGISegmentStorage(uwsgi_adapter, cfg['segmentBloomFiltersEnabled'],
+                                        cfg['segmentBloomFiltersRefreshRate']),
         'impressions': UWSGIImpressionStorage(uwsgi_adapter),
         'events': UWSGIEventStorage(uwsgi_adapter),
         'telemetry': UWSGITelemetryStorage(uwsgi_adapter)
     }
-    recorder = StandardRecorder(
+    recorder = _build_recorder(
+        cfg,
         ImpressionsManager(cfg['impressionsMode'], True,
                            _wrap_impression_listener(cfg['impressionListener'], sdk_metadata)),
-        storages['telemetry'],
-        storages['events'],
-        storages['impressions'],
+        storages
     )
     _LOGGER.warning(
         "Beware: uwsgi-cache based operation mode is soon to be deprecated. Please consider " +
@@ -456,7 +520,7 @@ def _build_uwsgi_factory(api_key, cfg):
 def _build_localhost_factory(cfg):
     """Build and return a localhost factory for testing/development purposes."""
     storages = {
-        'splits': InMemorySplitStorage(),
+        'splits': InMemorySplitStorage(cfg['evaluationPlansEnabled']),
         'segments': InMemorySegmentStorage(),  # not used, just to avoid possible future errors.
         'impressions': LocalhostImpressionsStorage(),
         'events': LocalhostEventsStorage(),
@@ -18,6 +18,13 @@ _LOGGER = logging.getLogger(__name__)
 MAX_LENGTH = 250
 EVENT_TYPE_PATTERN = r'^[a-zA-Z0-9][-_.:a-zA-Z0-9]{0,79}$'
 MAX_PROPERTIES_LENGTH_BYTES = 32768
+_MAX_CACHED_FEATURE_NAMES = 1000
+
+# Exact string types eligible for the fast validation paths (subclasses take the regular ones).
+_STRING_TYPES = (six.text_type, six.binary_type) if six.PY2 else (str,)
+
+# Feature names already known to be non-empty strings without extra whitespace.
+_CLEAN_FEATURE_NAMES = set()
 
 
 def _check_not_null(value, name, operation):
@@ -168,6 +175,8 @@ def _check_valid_object_key(key, name, operation):
     :return: The result of validation
     :rtype: str|None
     """
+    if _is_plain_valid_string(key):
+        return key
     if key is None:
         _LOGGER.error(
             '%s: you passed a null %s, %s must be a non-empty string.',
@@ -182,6 +191,52 @@ def _check_valid_object_key(key, name, operation):
     return key_str
 
 
+def _is_plain_valid_string(value):
+    """
+    Check in a single pass if value is a non-empty string within the length limit.
+
+    Values failing this check must go through the regular validations, which log the problem.
+
+    :param value: value to be checked
+    :type value: object
+    :return: The result of validation
+    :rtype: True|False
+    """
+    return value.__class__ in _STRING_TYPES and 0 < len(value) <= MAX_LENGTH \
+        and not value.isspace()
+
+
+def _is_clean_feature_name(feature_name):
+    """
+    Check if feature_name already passed validation without warnings.
+
+    :param feature_name: feature_name to be checked
+    :type feature_name: object
+    :return: The result of validation
+    :rtype: True|False
+    """
+    return feature_name.__class__ in _STRING_TYPES and feature_name in _CLEAN_FEATURE_NAMES
+
+
+def _clean_feature_name(feature_name, operation):
+    """
+    Trim a valid feature_name, remembering it if it needed no trimming.
+
+    :param feature_name: feature_name to be trimmed
+    :type feature_name: str
+    :param operation: user operation
+    :type operation: str
+    :return: The result of trimming
+    :rtype: str
+    """
+    stripped = _remove_empty_spaces(feature_name, operation)
+    if stripped == feature_name and feature_name.__class__ in _STRING_TYPES:
+        if len(_CLEAN_FEATURE_NAMES) >= _MAX_CACHED_FEATURE_NAMES:
+            _CLEAN_FEATURE_NAMES.clear()
+        _CLEAN_FEATURE_NAMES.add(feature_name)
+    return stripped
+
+
 def _remove_empty_spaces(value, operation):
     """
     Check if an string has whitespaces.
@@ -212,6 +267,9 @@ def validate_key(key, method_name):
     :return: The tuple key
     :rtype: (matching_key,bucketing_key)
     """
+    if _is_plain_valid_string(key):
+        return key, None
+
     matching_key_result = None
     bucketing_key_result = None
     if key is None:
@@ -235,6 +293,39 @@ def validate_key(key, method_name):
     return matching_key_result, bucketing_key_result
 
 
+def _is_valid_feature_name(feature_name, method_name):
+    """
+    Check that feature_name is a non-empty string.
+
+    :param feature_name: feature_name to be checked
+    :type feature_name: str
+    :param method_name: user operation
+    :type method_name: str
+    :return: The result of validation
+    :rtype: True|False
+    """
+    return _check_not_null(feature_name, 'feature_name', method_name) and \
+        _check_is_string(feature_name, 'feature_name', method_name) and \
+        _check_string_not_empty(feature_name, 'feature_name', method_name)
+
+
+def _warn_missing_feature(method_name, feature_name):
+    """
+    Log that a feature does not exist.
+
+    :param method_name: user operation
+    :type method_name: str
+    :param feature_name: missing feature name
+    :type feature_name: str
+    """
+    _LOGGER.warning(
+        "%s: you passed \"%s\" that does not exist in this environment, "
+        "please double check what Splits exist in the web console.",
+        method_name,
+        feature_name
+    )
+
+
 def validate_feature_name(feature_name, should_validate_existance, split_storage, method_name):
     """
     Check if feature_name is valid for get_treatment.
@@ -244,21 +335,36 @@ def validate_feature_name(feature_name, should_validate_existance, split_storage
     :return: feature_name
     :rtype: str|None
     """
-    if (not _check_not_null(feature_name, 'feature_name', method_name)) or \
-       (not _check_is_string(feature_name, 'feature_name', method_name)) or \
-       (not _check_string_not_empty(feature_name, 'feature_name', method_name)):
-        return None
+    return validate_feature_name_and_fetch(feature_name, should_validate_existance,
+                                           split_storage, method_name)[0]
 
-    if should_validate_existance and split_storage.get(feature_name) is None:
-        _LOGGER.warning(
-            "%s: you passed \"%s\" that does not exist in this environment, "
-            "please double check what Splits exist in the web console.",
-            method_name,
-            feature_name
-        )
-        return None
 
-    return _remove_empty_spaces(feature_name, method_name)
+def validate_feature_name_and_fetch(feature_name, should_validate_existance, split_storage,
+                                    method_name):
+    """
+    Check if feature_name is valid for get_treatment, keeping the split fetched to validate it.
+
+    :param feature_name: feature_name to be checked
+    :type feature_name: str
+    :return: Tuple of feature_name (None if invalid) and its split (None if not fetched)
+    :rtype: tuple(str|None, splitio.models.splits.Split|None)
+    """
+    clean = _is_clean_feature_name(feature_name)
+    if not clean and not _is_valid_feature_name(feature_name, method_name):
+        return None, None
+
+    split = None
+    if should_validate_existance:
+        split = split_storage.get(feature_name)
+        if split is None:
+            _warn_missing_feature(method_name, feature_name)
+            return None, None
+
+    if clean:
+        return feature_name, split
+    # The split was looked up with the untrimmed name, so it's fetched again if it was trimmed.
+    trimmed = _clean_feature_name(feature_name, method_name)
+    return trimmed, split if trimmed == feature_name else None
 
 
 def validate_track_key(key):
@@ -386,34 +492,49 @@ def validate_features_get_treatments(  # pylint: disable=invalid-name
     :return: filtered_features
     :rtype: tuple
     """
+    return validate_features_and_fetch(method_name, features, should_validate_existance,
+                                       split_storage)[:2]
+
+
+def validate_features_and_fetch(method_name, features, should_validate_existance=False,
+                                split_storage=None):
+    """
+    Check if features is valid for get_treatments, keeping the splits fetched to validate them.
+
+    :param features: array of features
+    :type features: list
+    :return: Tuple of valid features, missing features and the splits of the valid ones (None
+        if not fetched)
+    :rtype: tuple(set, set, dict|None)
+    """
     if features is None or not isinstance(features, list):
         _LOGGER.error("%s: feature_names must be a non-empty array.", method_name)
-        return None, None
+        return None, None, None
     if not features:
         _LOGGER.error("%s: feature_names must be a non-empty array.", method_name)
-        return None, None
-    filtered_features = set(
-        _remove_empty_spaces(feature, method_name) for feature in features
-        if feature is not None and
-        _check_is_string(feature, 'feature_name', method_name) and
-        _check_string_not_empty(feature, 'feature_name', method_name)
-    )
+        return None, None, None
+    filtered_features = set()
+    for feature in features:
+        if _is_clean_feature_name(feature):
+            filtered_features.add(feature)
+        elif feature is not None and \
+                _check_is_string(feature, 'feature_name', method_name) and \
+                _check_string_not_empty(feature, 'feature_name', method_name):
+            filtered_features.add(_clean_feature_name(feature, method_name))
     if not filtered_features:
         _LOGGER.error("%s: feature_names must be a non-empty array.", method_name)
-        return None, None
+        return None, None, None
 
     if not should_validate_existance:
-        return filtered_features, []
+        return filtered_features, [], None
 
-    valid_missing_features = set(f for f in filtered_features if split_storage.get(f) is None)
+    fetched = split_storage.fetch_many(list(filtered_features))
+    splits = {feature: fetched.get(feature) for feature in filtered_features}
+    valid_missing_features = set(f for f, split in six.iteritems(splits) if split is None)
     for missing_feature in valid_missing_features:
-        _LOGGER.warning(
-            "%s: you passed \"%s\" that does not exist in this environment, "
-            "please double check what Splits exist in the web console.",
-            method_name,
-            missing_feature
-        )
-    return filtered_features - valid_missing_features, valid_missing_features
+        _warn_missing_feature(method_name, missing_feature)
+        del splits[missing_feature]
+    return filtered_features - valid_missing_features, valid_missing_features, splits
 
 
 def generate_control_treatments(features, method_name):
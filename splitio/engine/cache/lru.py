@@ -1,5 +1,6 @@
 """Simple test-and-set LRU Cache."""
 import threading
+from array import array
 
 
 DEFAULT_MAX_SIZE = 5000
@@ -119,3 +120,151 @@ class SimpleLruCache(object):  #pylint: disable=too-many-instance-attributes
             nodes.append('\t<%s: %s>  -->' % (node.key, node.value))
             node = node.previous
         return '<MRU>\n' + '\n'.join(nodes) + '\n<LRU>'
+
+
+DEFAULT_SHARDS = 16
+_MIN_SHARD_SIZE = 1024
+_NONE = -1
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+class _LruShard(object):  #pylint: disable=too-few-public-methods
+    """
+    Array-backed test-and-set LRU cache of 64 bit integer keys and values.
+
+    Keys are stored as unsigned 64 bit integers, so signed ones (ie: hashes) are masked. Entries
+    live in parallel arrays indexed by slot, linked from the MRU (head) to the LRU
+    (tail) through the `_older`/`_newer` slot indexes, so no object is allocated per entry.
+    """
+
+    __slots__ = ('_capacity', '_slots', '_keys', '_values', '_older', '_newer', '_head', '_tail',
+                 'lock')
+
+    def __init__(self, capacity):
+        """
+        Class constructor.
+
+        :param capacity: Maximum number of entries.
+        :type capacity: int
+        """
+        self._capacity = capacity
+        self._slots = {}
+        self._keys = array('Q')
+        self._values = array('q')
+        self._older = array('i')
+        self._newer = array('i')
+        self._head = _NONE
+        self._tail = _NONE
+        self.lock = threading.Lock()
+
+    def test_and_set(self, key, value):
+        """
+        Set an item in the shard if missing and return the stored value. Must hold `lock`.
+
+        :param key: item key
+        :type key: int
+        :param value: item value
+        :type value: int
+
+        :return: previous value if any. None otherwise
+        :rtype: int
+        """
+        key &= _MASK64
+        slot = self._slots.get(key)
+        if slot is not None:
+            # As in SimpleLruCache, a hit keeps the stored value and only refreshes recency.
+            previous = self._values[slot]
+            if slot != self._head:
+                self._unlink(slot)
+                self._link_head(slot)
+            return previous
+
+        if len(self._keys) < self._capacity:
+            slot = len(self._keys)
+            self._keys.append(key)
+            self._values.append(value)
+            self._older.append(_NONE)
+            self._newer.append(_NONE)
+        else:
+            slot = self._tail
+            del self._slots[self._keys[slot]]
+            self._unlink(slot)
+            self._keys[slot] = key
+            self._values[slot] = value
+        self._link_head(slot)
+        self._slots[key] = slot
+        return None
+
+    def _unlink(self, slot):
+        """Remove a slot from the list."""
+        older = self._older[slot]
+        newer = self._newer[slot]
+        if newer != _NONE:
+            self._older[newer] = older
+        else:
+            self._head = older
+        if older != _NONE:
+            self._newer[older] = newer
+        else:
+            self._tail = newer
+
+    def _link_head(self, slot):
+        """Insert a slot as the MRU."""
+        self._older[slot] = self._head
+        self._newer[slot] = _NONE
+        if self._head != _NONE:
+            self._newer[self._head] = slot
+        self._head = slot
+        if self._tail == _NONE:
+            self._tail = slot
+
+    def __len__(self):
+        """Return the number of entries."""
+        return len(self._slots)
+
+
+class ShardedLruCache(object):
+    """
+    Compact test-and-set LRU cache of 64 bit integer keys (ie: hashes) and values.
+
+    Keys are spread over lock-striped shards, each one evicting its own LRU entry, so the
+    eviction order is exact only within a shard. Caches too small to be split use one shard.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, shards=DEFAULT_SHARDS):
+        """
+        Class constructor.
+
+        :param max_size: Maximum number of entries.
+        :type max_size: int
+        :param shards: Maximum number of shards.
+        :type shards: int
+        """
+        shards = max(min(shards, max_size // _MIN_SHARD_SIZE), 1)
+        self._shard_capacity = -(-max_size // shards)
+        self._shards = [_LruShard(self._shard_capacity) for _ in range(shards)]
+
+    def test_and_set(self, key, value):
+        """
+        Set an item in the cache if missing and return the stored value.
+
+        :param key: object key
+        :type key: int
+        :param value: object value
+        :type value: int
+
+        :return: previous value if any. None otherwise
+        :rtype: int
+        """
+        key &= _MASK64  # Shards are picked by the key as stored, ie: unsigned.
+        shard = self._shards[key % len(self._shards)]
+        with shard.lock:
+            return shard.test_and_set(key, value)
+
+    def clear(self):
+        """Clear the cache."""
+        self._shards = [_LruShard(self._shard_capacity) for _ in self._shards]
+
+    def __len__(self):
+        """Return the number of entries."""
+        return sum(len(shard) for shard in self._shards)
@@ -0,0 +1,49 @@
+"""Dependency graph between splits referenced by IN_SPLIT_TREATMENT matchers."""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+
+class DependencyGraph(object):
+    """Immutable graph of the splits each split depends on."""
+
+    def __init__(self, splits):
+        """
+        Class constructor.
+
+        :param splits: Splits to build the graph from.
+        :type splits: list(splitio.models.splits.Split)
+        """
+        self._parents = {
+            split.name: frozenset(split.get_dependency_names())
+            for split in splits
+        }
+
+    def get_dependency_names(self, split_name):
+        """
+        Return the names of the splits a split depends on.
+
+        :param split_name: Name of the split.
+        :type split_name: str
+
+        :rtype: frozenset(str)
+        """
+        return self._parents.get(split_name, frozenset())
+
+    def get_ancestor_names(self, split_name):
+        """
+        Return the names of the splits a split depends on, directly or not.
+
+        Cycles are walked once, so this always ends. They are only detected while evaluating.
+
+        :param split_name: Name of the split.
+        :type split_name: str
+
+        :rtype: set(str)
+        """
+        ancestors = set()
+        pending = list(self.get_dependency_names(split_name))
+        while pending:
+            name = pending.pop()
+            if name not in ancestors:
+                ancestors.add(name)
+                pending.extend(self.get_dependency_names(name))
+        return ancestors
@@ -11,6 +11,105 @@ CONTROL = 'control'
 _LOGGER = logging.getLogger(__name__)
 
 
+class EvaluationResult(object):
+    """
+    Outcome of evaluating a feature.
+
+    Configurations are only looked up when requested. Item access (ie: `result['treatment']`,
+    `result['impression']['label']`) is kept for callers of the former dict results.
+    """
+
+    __slots__ = ('treatment', 'label', 'change_number', '_split')
+
+    def __init__(self, treatment, label, change_number, split=None):
+        """
+        Class constructor.
+
+        :param treatment: Resulting treatment.
+        :type treatment: str
+        :param label: Label of the matching condition or outcome.
+        :type label: str
+        :param change_number: Change number of the split evaluated.
+        :type change_number: int
+        :param split: Split evaluated, used to look up configurations.
+        :type split: splitio.models.splits.Split
+        """
+        self.treatment = treatment
+        self.label = label
+        self.change_number = change_number
+        self._split = split
+
+    @property
+    def configurations(self):
+        """Return the configuration attached to the treatment, if any."""
+        if self._split is None:
+            return None
+        return self._split.get_configurations_for(self.treatment)
+
+    def __getitem__(self, name):
+        """Return a field using the former dict result layout."""
+        if name == 'treatment':
+            return self.treatment
+        if name == 'configurations':
+            return self.configurations
+        if name == 'impression':
+            return {'label': self.label, 'change_number': self.change_number}
+        raise KeyError(name)
+
+
+class BucketCache(object):
+    """Buckets computed during a single evaluation, keyed by (key, seed, algorithm)."""
+
+    def __init__(self, splitter):
+        """
+        Class constructor.
+
+        :param splitter: Splitter used to compute buckets not yet in cache.
+        :type splitter: splitio.engine.splitters.Splitter
+        """
+        self._splitter = splitter
+        self._buckets = {}
+
+    def get_bucket(self, key, seed, algo, hash_fn=None):
+        """
+        Get the bucket for a key, hashing it only the first time.
+
+        :param key: The key to hash
+        :type key: str
+        :param seed: The feature seed
+        :type seed: int
+        :param algo: The hash algorithm
+        :type algo: splitio.models.splits.HashAlgorithm
+        :param hash_fn: Optional hash function already resolved for the algorithm
+        :type hash_fn: callable
+        :return: The bucket for the key
+        :rtype: int
+        """
+        cache_key = (key, seed, algo)
+        bucket = self._buckets.get(cache_key)
+        if bucket is None:
+            bucket = self._splitter.get_bucket(key, seed, algo, hash_fn)
+            self._buckets[cache_key] = bucket
+        return bucket
+
+    def fill(self, keys, seed, algo):
+        """
+        Compute and store the buckets for many keys at once.
+
+        :param keys: The keys to hash
+        :type keys: list(str)
+        :param seed: The feature seed
+        :type seed: int
+        :param algo: The hash algorithm
+        :type algo: splitio.models.splits.HashAlgorithm
+        """
+        missing = list(set(key for key in keys if (key, seed, algo) not in self._buckets))
+        if not missing:
+            return
+        for key, bucket in zip(missing, self._splitter.get_buckets(missing, seed, algo)):
+            self._buckets[(key, seed, algo)] = bucket
+
+
 class Evaluator(object):  # pylint: disable=too-few-public-methods
     """Split Evaluator class."""
 
@@ -28,7 +127,8 @@ class Evaluator(object):  # pylint: disable=too-few-public-methods
         self._segment_storage = segment_storage
         self._splitter = splitter
 
-    def _evaluate_treatment(self, feature, matching_key, bucketing_key, attributes, split):
+    def _evaluate_treatment(self, feature, matching_key, bucketing_key, attributes, split,  # pylint: disable=too-many-arguments
+                            bucket_cache=None, dependencies=None, parents=None):
         """
         Evaluate the user submitted data against a feature and return the resulting treatment.
 
@@ -47,8 +147,17 @@ class Evaluator(object):  # pylint: disable=too-few-public-methods
         :param split: Split object
         :type attributes: splitio.models.splits.Split|None
 
+        :param bucket_cache: Buckets already computed during this evaluation
+        :type bucket_cache: BucketCache
+
+        :param dependencies: Results of the splits already evaluated for this key & attributes
+        :type dependencies: dict
+
+        :param parents: Splits other splits depend on, already fetched during this evaluation
+        :type parents: dict
+
         :return: The treatment for the key and split
-        :rtype: object
+        :rtype: EvaluationResult
         """
         label = ''
         _treatment = CONTROL
@@ -67,7 +176,10 @@ class Evaluator(object):  # pylint: disable=too-few-public-methods
                     split,
                     matching_key,
                     bucketing_key,
-                    attributes
+                    attributes,
+                    bucket_cache,
+                    dependencies,
+                    parents
                 )
                 if treatment is None:
                     label = Label.NO_CONDITION_MATCHED
@@ -75,16 +187,11 @@ class Evaluator(object):  # pylint: disable=too-few-public-methods
                 else:
                     _treatment = treatment
 
-        return {
-            'treatment': _treatment,
-            'configurations': split.get_configurations_for(_treatment) if split else None,
-            'impression': {
-                'label': label,
-                'change_number': _change_number
-            }
-        }
+        # Splits without configurations are not kept, so nothing is looked up for them.
+        return EvaluationResult(_treatment, label, _change_number,
+                                split if split is not None and split.has_configurations else None)
 
-    def evaluate_feature(self, feature, matching_key, bucketing_key, attributes=None):
+    def evaluate_feature(self, feature, matching_key, bucketing_key, attributes=None, split=None):  # pylint: disable=too-many-arguments
         """
         Evaluate the user submitted data against a feature and return the resulting treatment.
 
@@ -100,11 +207,15 @@ class Evaluator(object):  # pylint: disable=too-few-public-methods
         :param attributes: An optional dictionary of attributes
         :type attributes: dict
 
+        :param split: Split already fetched by the caller, if any
+        :type split: splitio.models.splits.Split
+
         :return: The treatment for the key and split
-        :rtype: object
+        :rtype: EvaluationResult
         """
         # Fetching Split definition
-        split = self._split_storage.get(feature)
+        if split is None:
+            split = self._split_storage.get(feature)
 
         # Calling evaluation
         evaluation = self._evaluate_treatment(feature, matching_key,
@@ -112,7 +223,88 @@ class Evaluator(object):  # pylint: disable=too-few-public-methods
 
         return evaluation
 
-    def evaluate_features(self, features, matching_key, bucketing_key, attributes=None):
+    def evaluate_dependency(self, feature, matching_key, bucketing_key, attributes, context):  # pylint: disable=too-many-arguments
+        """
+        Evaluate a split another split depends on, at most once per evaluation.
+
+        The split is fetched along with the splits it depends on, directly or not. A split that
+        depends on itself while being evaluated yields CONTROL.
+
+        :param feature: The feature the dependent split references
+        :type feature:  str
+
+        :param matching_key: The matching_key for which to get the treatment
+        :type matching_key: str
+
+        :param bucketing_key: The bucketing_key for which to get the treatment
+        :type bucketing_key: str
+
+        :param attributes: An optional dictionary of attributes
+        :type attributes: dict
+
+        :param context: Evaluation context of the dependent split
+        :type context: dict
+
+        :return: The treatment for the key and split
+        :rtype: EvaluationResult
+        """
+        dependencies = context.get('dependencies')
+        if dependencies is None:
+            dependencies = {}
+
+        if feature in dependencies:
+            evaluation = dependencies[feature]
+            if evaluation is not None:
+                return evaluation
+            # The feature is still being evaluated further up in the chain.
+            _LOGGER.error('Circular dependency found while evaluating feature %s', feature)
+            return self._evaluate_circular()
+
+        parents = context.get('parents')
+        if parents is None:
+            parents = {}
+
+        dependencies[feature] = None
+        evaluation = self._evaluate_treatment(feature, matching_key, bucketing_key, attributes,
+                                              self._fetch_parent(feature, parents),
+                                              context.get('bucket_cache'), dependencies, parents)
+        dependencies[feature] = evaluation
+        return evaluation
+
+    def _fetch_parent(self, feature, parents):
+        """
+        Get a split other splits depend on, fetching the ones it depends on as well if missing.
+
+        :param feature: The feature other splits depend on
+        :type feature:  str
+
+        :param parents: Splits other splits depend on, already fetched during this evaluation
+        :type parents: dict
+
+        :return: The split, or None if it doesn't exist
+        :rtype: splitio.models.splits.Split
+        """
+        if feature not in parents:
+            names = set([feature])
+            graph = self._split_storage.get_dependency_graph()
+            if graph is not None:
+                names.update(graph.get_ancestor_names(feature))
+            parents.update(self._split_storage.fetch_many(
+                [name for name in names if name not in parents]
+            ))
+        return parents.get(feature)
+
+    @staticmethod
+    def _evaluate_circular():
+        """
+        Build the result of a feature that cannot be evaluated due to circular dependencies.
+
+        :rtype: EvaluationResult
+        """
+        return EvaluationResult(CONTROL, Label.EXCEPTION, -1)
+
+    def evaluate_features(self, features, matching_key, bucketing_key, attributes=None,  # pylint: disable=too-many-arguments
+                          splits=None):
         """
         Evaluate the user submitted data against multiple features and return the resulting
         treatment.
@@ -129,21 +321,131 @@ class Evaluator(object):  # pylint: disable=too-few-public-methods
         :param attributes: An optional dictionary of attributes
         :type attributes: dict
 
+        :param splits: Splits of the features already fetched by the caller, if any
+        :type splits: dict(str, splitio.models.splits.Split)
+
         :return: The treatments for the key and splits
-        :rtype: object
+        :rtype: dict(str, EvaluationResult)
         """
+        if splits is None:
+            splits = self._split_storage.fetch_many(features)
+        bucket_cache = BucketCache(self._splitter)
+        dependencies = {}
+        parents = {}
         return {
-            feature: self._evaluate_treatment(feature, matching_key,
-                                              bucketing_key, attributes, split)
-            for (feature, split) in six.iteritems(self._split_storage.fetch_many(features))
+            feature: self._evaluate_or_reuse(feature, matching_key, bucketing_key, attributes,
+                                             split, bucket_cache, dependencies, parents)
+            for (feature, split) in six.iteritems(splits)
         }
 
-    def _get_treatment_for_split(self, split, matching_key, bucketing_key, attributes=None):
+    def evaluate_features_bulk(self, features, keys, attributes_list, splits=None):
+        """
+        Evaluate many keys against multiple features fetching the split definitions only once.
+
+        :param features: The features for which to get the treatments
+        :type feature:  list(str)
+
+        :param keys: (matching_key, bucketing_key) tuples to evaluate
+        :type keys: list(tuple(str, str))
+
+        :param attributes_list: Dictionary of attributes for each key (or None)
+        :type attributes_list: list(dict)
+
+        :param splits: Splits of the features already fetched by the caller, if any
+        :type splits: dict(str, splitio.models.splits.Split)
+
+        :return: The treatments for each key and split, in the same order as the keys
+        :rtype: list(dict)
+        """
+        if splits is None:
+            splits = self._split_storage.fetch_many(features)
+        fetched = list(six.iteritems(splits))
+        parents = {}  # Splits don't depend on keys, so they're shared by every key.
+        bucket_cache = self._prefill_bucket_cache(
+            [split for (_, split) in fetched],
+            [bucketing_key if bucketing_key is not None else matching_key
+             for (matching_key, bucketing_key) in keys]
+        )
+        return [
+            {
+                feature: self._evaluate_or_reuse(feature, matching_key, bucketing_key, attributes,
+                                                 split, bucket_cache, dependencies, parents)
+                for (feature, split) in fetched
+            }
+            for ((matching_key, bucketing_key), attributes, dependencies)
+            in zip(keys, attributes_list, ({} for _ in keys))
+        ]
+
+    def _evaluate_or_reuse(self, feature, matching_key, bucketing_key, attributes, split,  # pylint: disable=too-many-arguments
+                           bucket_cache, dependencies, parents):
+        """
+        Evaluate a feature unless it was already evaluated as a dependency of another one.
+
+        :param feature: The feature for which to get the treatment
+        :type feature:  str
+
+        :param matching_key: The matching_key for which to get the treatment
+        :type matching_key: str
+
+        :param bucketing_key: The bucketing_key for which to get the treatment
+        :type bucketing_key: str
+
+        :param attributes: An optional dictionary of attributes
+        :type attributes: dict
+
+        :param split: Split object
+        :type attributes: splitio.models.splits.Split|None
+
+        :param bucket_cache: Buckets already computed during this evaluation
+        :type bucket_cache: BucketCache
+
+        :param dependencies: Results of the splits already evaluated for this key & attributes
+        :type dependencies: dict
+
+        :param parents: Splits other splits depend on, already fetched during this evaluation
+        :type parents: dict
+
+        :return: The treatment for the key and split
+        :rtype: EvaluationResult
+        """
+        evaluation = dependencies.get(feature)
+        if evaluation is None:
+            evaluation = self._evaluate_treatment(feature, matching_key, bucketing_key, attributes,
+                                                  split, bucket_cache, dependencies, parents)
+            dependencies[feature] = evaluation
+        return evaluation
+
+    def _prefill_bucket_cache(self, splits, bucketing_keys):
+        """
+        Build a bucket cache holding the buckets of every key for the given splits.
+
+        :param splits: Splits to be evaluated (None for unknown features)
+        :type splits: list(splitio.models.splits.Split)
+
+        :param bucketing_keys: Keys used for hashing
+        :type bucketing_keys: list(str)
+
+        :return: Bucket cache filled in batch
+        :rtype: BucketCache
+        """
+        bucket_cache = BucketCache(self._splitter)
+        for split in splits:
+            if split is None or split.killed:
+                continue
+            if split.traffic_allocation < 100:
+                bucket_cache.fill(bucketing_keys, split.traffic_allocation_seed, split.algo)
+            if any(len(condition.partitions) > 1 for condition in split.conditions):
+                bucket_cache.fill(bucketing_keys, split.seed, split.algo)
+        return bucket_cache
+
+    def _get_treatment_for_split(self, split, matching_key, bucketing_key, attributes=None,  # pylint: disable=too-many-arguments
+                                 bucket_cache=None, dependencies=None, parents=None):
         """
         Evaluate the feature considering the conditions.
 
         If there is a match, it will return the condition and the label.
-        Otherwise, it will return (None, None)
+        Otherwise, it will return (None, None). Splits carrying a precompiled plan
+        are evaluated through it instead of walking the conditions.
 
         :param split: The split for which to get the treatment
         :type split: Split
@@ -157,28 +459,54 @@ class Evaluator(object):  # pylint: disable=too-few-public-methods
         :param attributes: An optional dictionary of attributes
         :type attributes: dict
 
+        :param bucket_cache: Buckets already computed during this evaluation
+        :type bucket_cache: BucketCache
+
+        :param dependencies: Results of the splits already evaluated for this key & attributes
+        :type dependencies: dict
+
+        :param parents: Splits other splits depend on, already fetched during this evaluation
+        :type parents: dict
+
         :return: The resulting treatment and label
         :rtype: tuple
         """
         if bucketing_key is None:
             bucketing_key = matching_key
 
-        roll_out = False
+        if bucket_cache is None:
+            bucket_cache = BucketCache(self._splitter)
+
+        if dependencies is None:
+            dependencies = {}
+
+        if parents is None:
+            parents = {}
 
         context = {
             'segment_storage': self._segment_storage,
             'evaluator': self,
-            'bucketing_key': bucketing_key
+            'bucketing_key': bucketing_key,
+            'bucket_cache': bucket_cache,
+            'dependencies': dependencies,
+            'parents': parents
         }
 
+        if split.plan is not None:
+            return split.plan.evaluate(matching_key, bucketing_key, attributes, context)
+
+        roll_out = False
+        hash_fn = self._splitter.get_split_hash_fn(split)
+
         for condition in split.conditions:
             if (not roll_out and
                     condition.condition_type == ConditionType.ROLLOUT):
                 if split.traffic_allocation < 100:
-                    bucket = self._splitter.get_bucket(
+                    bucket = bucket_cache.get_bucket(
                         bucketing_key,
                         split.traffic_allocation_seed,
-                        split.algo
+                        split.algo,
+                        hash_fn
                     )
                     if bucket > split.traffic_allocation:
                         return split.default_treatment, Label.NOT_IN_SPLIT
@@ -195,7 +523,10 @@ class Evaluator(object):  # pylint: disable=too-few-public-methods
                     bucketing_key,
                     split.seed,
                     condition.partitions,
-                    split.algo
+                    split.algo,
+                    bucket_cache,
+                    condition.bucket_treatments,
+                    hash_fn
                 ), condition.label
 
         # No condition matches
@@ -3,13 +3,14 @@ Hash functions module.
 
 This module contains hash functions implemented in pure python
 as well as the optional import (if installed) of a C compiled murmur hash
-function with python bindings.
+function with python bindings, and of numpy-based functions to compute
+buckets for many keys at once.
 """
 from __future__ import absolute_import, division, print_function, \
     unicode_literals
 
 from splitio.models.splits import HashAlgorithm
-from splitio.engine.hashfns import legacy
+from splitio.engine.hashfns import legacy, fields
 
 try:
     # First attempt to import module with C++ core (faster)
@@ -28,12 +29,27 @@ except ImportError:
     _murmur_hash128 = lambda k, s: murmur3py.hash128_x64(k, s)[0] #pylint: disable=invalid-name
 
 
+try:
+    # Bulk bucketing backed by numpy if installed.
+    from splitio.engine.hashfns import vectorized
+
+    _BUCKETS_ALGORITHMS = {
+        HashAlgorithm.LEGACY: lambda k, s: vectorized.legacy_buckets(k, s).tolist(),
+        HashAlgorithm.MURMUR: lambda k, s: vectorized.murmur32_buckets(k, s).tolist()
+    }
+
+except ImportError:
+    # Fallback to hashing one key at a time
+    _BUCKETS_ALGORITHMS = {}
+
+
 _HASH_ALGORITHMS = {
     HashAlgorithm.LEGACY: legacy.legacy_hash,
     HashAlgorithm.MURMUR: _murmur_hash
 }
 
 murmur_128 = _murmur_hash128  #pylint: disable=invalid-name
+hash64_fields = fields.hash64_fields  #pylint: disable=invalid-name
 
 def get_hash_fn(algo):
     """
@@ -45,3 +61,20 @@ def get_hash_fn(algo):
     :rtype: function
     """
     return _HASH_ALGORITHMS.get(algo, legacy.legacy_hash)
+
+
+def get_buckets_fn(algo):
+    """
+    Return a function computing the buckets of many keys at once for requested algorithm.
+
+    :param algo: Algoritm to use
+    :type algo: int
+    :return: Function (keys, seed) -> list of buckets
+    :rtype: function
+    """
+    buckets_fn = _BUCKETS_ALGORITHMS.get(algo)
+    if buckets_fn is not None:
+        return buckets_fn
+
+    hash_fn = get_hash_fn(algo)
+    return lambda keys, seed: [abs(hash_fn(key, seed)) % 100 + 1 for key in keys]
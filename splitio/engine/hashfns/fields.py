@@ -0,0 +1,48 @@
+"""Field hash function module."""
+from __future__ import absolute_import, division, print_function, \
+    unicode_literals
+
+import binascii
+
+import six
+
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_PRIME = (1 << 61) - 1
+_MULTIPLIER = 0x87c37b91114253d5
+
+
+def hash64_fields(fields, seed):
+    """
+    Generate a 64 bit hash for a sequence of fields without joining them into a single string.
+
+    Each field is read as one integer (strings from their utf-8 bytes) and folded into a
+    polynomial hash modulo 2^61 - 1 along with its length, so that field boundaries are part of
+    the hash. The result goes through the murmurhash3 64 bit finalizer to spread it over 64 bits.
+    It only depends on its input, so it's stable across processes and platforms.
+
+    :param fields: Strings or integers to hash.
+    :type fields: iterable
+    :param seed: Seed to use when hashing
+    :type seed: int
+    :return: unsigned 64 bit hashed value
+    :rtype: int
+    """
+    current_hash = seed % _PRIME
+    for field in fields:
+        if isinstance(field, six.integer_types):
+            size = 8
+            value = field & _MASK64
+        else:
+            data = field.encode('utf-8')
+            size = len(data)
+            value = int(binascii.hexlify(data), 16) if size else 0
+        value += (size + 1) << 56
+        current_hash = (current_hash * _MULTIPLIER + value % _PRIME) % _PRIME
+
+    current_hash ^= current_hash >> 33
+    current_hash = (current_hash * 0xff51afd7ed558ccd) & _MASK64
+    current_hash ^= current_hash >> 33
+    current_hash = (current_hash * 0xc4ceb9fe1a85ec53) & _MASK64
+    current_hash ^= current_hash >> 33
+    return current_hash
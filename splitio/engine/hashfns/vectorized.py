@@ -0,0 +1,145 @@
+"""
+Vectorized hash functions module.
+
+NumPy implementations of the murmur3 x86_32 and legacy hash functions that compute the buckets
+for many keys at once. Results are bit-identical to `murmur3py.murmur32_py` and
+`legacy.legacy_hash`. Importing this module raises ImportError if numpy is not installed.
+"""
+from __future__ import absolute_import, division, print_function, \
+    unicode_literals
+
+import numpy as np
+
+
+_C1 = np.uint32(0xcc9e2d51)
+_C2 = np.uint32(0x1b873593)
+_M5 = np.uint32(5)
+_N1 = np.uint32(0xe6546b64)
+_F1 = np.uint32(0x85ebca6b)
+_F2 = np.uint32(0xc2b2ae35)
+_MASK32 = 0xFFFFFFFF
+
+
+def _rotl32(values, shift):
+    """Rotate left an array of 32 bit unsigned integers."""
+    return (values << np.uint32(shift)) | (values >> np.uint32(32 - shift))
+
+
+def _pad(encoded, width, dtype):
+    """
+    Build a zero-padded matrix with one row per encoded key.
+
+    :param encoded: Encoded keys.
+    :type encoded: list(bytes)
+    :param width: Row width in bytes.
+    :type width: int
+    :param dtype: Type of each matrix element.
+    :type dtype: numpy.dtype
+
+    :return: Matrix of shape (len(encoded), width / dtype.itemsize)
+    :rtype: numpy.ndarray
+    """
+    buff = b''.join(item.ljust(width, b'\x00') for item in encoded)
+    return np.frombuffer(buff, dtype=dtype).reshape(len(encoded), -1)
+
+
+def murmur32(keys, seed):
+    """
+    Compute murmur3 x86_32 hashes for many keys.
+
+    :param keys: Keys to hash.
+    :type keys: list(str)
+    :param seed: Seed to use when hashing.
+    :type seed: int
+
+    :return: Unsigned 32 bit hashes, one per key.
+    :rtype: numpy.ndarray
+    """
+    encoded = [key.encode('utf-8') for key in keys]
+    lengths = np.fromiter((len(item) for item in encoded), dtype=np.uint32, count=len(encoded))
+    if not encoded:
+        return lengths
+
+    # Leave room for a trailing block so that the tail of every key can be read as a block.
+    max_blocks = int(lengths.max()) // 4 + 1
+    blocks = _pad(encoded, max_blocks * 4, np.dtype('<u4'))
+    nblocks = lengths // np.uint32(4)
+
+    hashes = np.full(len(encoded), seed & _MASK32, dtype=np.uint32)
+    for index in range(max_blocks - 1):
+        key1 = _rotl32(blocks[:, index] * _C1, 15) * _C2
+        updated = _rotl32(hashes ^ key1, 13) * _M5 + _N1
+        hashes = np.where(nblocks > index, updated, hashes)
+
+    # Bytes past each key's length are zero, so the block following the last full one is the tail.
+    tail = _rotl32(blocks[np.arange(len(encoded)), nblocks] * _C1, 15) * _C2
+    hashes = np.where(lengths & np.uint32(3), hashes ^ tail, hashes)
+
+    hashes ^= lengths
+    hashes ^= hashes >> np.uint32(16)
+    hashes *= _F1
+    hashes ^= hashes >> np.uint32(13)
+    hashes *= _F2
+    hashes ^= hashes >> np.uint32(16)
+    return hashes
+
+
+def legacy(keys, seed):
+    """
+    Compute legacy hashes for many keys.
+
+    :param keys: Keys to hash.
+    :type keys: list(str)
+    :param seed: Seed to use when hashing.
+    :type seed: int
+
+    :return: Signed 32 bit hashes, one per key.
+    :rtype: numpy.ndarray
+    """
+    encoded = [key.encode('utf-32-le', 'surrogatepass') for key in keys]
+    lengths = np.fromiter((len(item) // 4 for item in encoded), dtype=np.int64,
+                          count=len(encoded))
+    if not encoded:
+        return lengths.astype(np.int32)
+
+    max_length = int(lengths.max())
+    code_points = _pad(encoded, max(max_length, 1) * 4, np.dtype('<u4'))
+
+    hashes = np.zeros(len(encoded), dtype=np.uint32)
+    multiplier = np.uint32(31)
+    for index in range(max_length):
+        updated = hashes * multiplier + code_points[:, index]
+        hashes = np.where(lengths > index, updated, hashes)
+
+    hashes ^= np.uint32(seed & _MASK32)
+    return hashes.view(np.int32)
+
+
+def murmur32_buckets(keys, seed):
+    """
+    Compute buckets for many keys using murmur3 x86_32.
+
+    :param keys: Keys to hash.
+    :type keys: list(str)
+    :param seed: Seed to use when hashing.
+    :type seed: int
+
+    :return: Buckets (1 to 100), one per key.
+    :rtype: numpy.ndarray
+    """
+    return (murmur32(keys, seed) % np.uint32(100)).astype(np.int64) + 1
+
+
+def legacy_buckets(keys, seed):
+    """
+    Compute buckets for many keys using the legacy hash.
+
+    :param keys: Keys to hash.
+    :type keys: list(str)
+    :param seed: Seed to use when hashing.
+    :type seed: int
+
+    :return: Buckets (1 to 100), one per key.
+    :rtype: numpy.ndarray
+    """
+    return np.abs(legacy(keys, seed).astype(np.int64)) % 100 + 1
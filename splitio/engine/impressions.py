@@ -6,9 +6,8 @@ from enum import Enum
 
 import six
 
-from splitio.models.impressions import Impression
-from splitio.engine.hashfns import murmur_128
-from splitio.engine.cache.lru import SimpleLruCache
+from splitio.engine.hashfns import hash64_fields
+from splitio.engine.cache.lru import ShardedLruCache
 from splitio.client.listener import ImpressionListenerException
 from splitio import util
 
@@ -38,15 +37,21 @@ def truncate_time(timestamp_ms):
 
 
 class Hasher(object):  # pylint:disable=too-few-public-methods
-    """Impression hasher."""
+    """
+    Impression hasher.
+
+    By default the relevant fields are hashed one at a time into 64 bits. When a string hash
+    function is supplied (ie: murmur_128), impressions are stringified using _PATTERN and hashed
+    with it instead.
+    """
 
     _PATTERN = "%s:%s:%s:%s:%d"
 
-    def __init__(self, hash_fn=murmur_128, seed=0):
+    def __init__(self, hash_fn=None, seed=0):
         """
         Class constructor.
 
-        :param hash_fn: Hash function to apply (str, int) -> int
+        :param hash_fn: Hash function to apply (str, int) -> int, or None to hash the fields.
         :type hash_fn: callable
 
         :param seed: seed to be provided when hashing
@@ -54,6 +59,25 @@ class Hasher(object):  # pylint:disable=too-few-public-methods
         """
         self._hash_fn = hash_fn
         self._seed = seed
+        if hash_fn is None:
+            self.process = self._process_fields
+
+    @staticmethod
+    def _fields(impression):
+        """
+        Get the relevant fields of an impression, replacing missing ones.
+
+        :param impression: Impression to get the fields from.
+        :type impression: splitio.models.impressions.Impression
+
+        :returns: matching key, feature name, treatment, label and change number.
+        :rtype: tuple
+        """
+        return (impression.matching_key if impression.matching_key else 'UNKNOWN',
+                impression.feature_name if impression.feature_name else 'UNKNOWN',
+                impression.treatment if impression.treatment else 'UNKNOWN',
+                impression.label if impression.label else 'UNKNOWN',
+                impression.change_number if impression.change_number else 0)
 
     def _stringify(self, impression):
         """
@@ -65,11 +89,7 @@ class Hasher(object):  # pylint:disable=too-few-public-methods
         :returns: a string representation of the impression
         :rtype: str
         """
-        return self._PATTERN % (impression.matching_key if impression.matching_key else 'UNKNOWN',
-                                impression.feature_name if impression.feature_name else 'UNKNOWN',
-                                impression.treatment if impression.treatment else 'UNKNOWN',
-                                impression.label if impression.label else 'UNKNOWN',
-                                impression.change_number if impression.change_number else 0)
+        return self._PATTERN % self._fields(impression)
 
     def process(self, impression):
         """
@@ -83,6 +103,18 @@ class Hasher(object):  # pylint:disable=too-few-public-methods
         """
         return self._hash_fn(self._stringify(impression), self._seed)
 
+    def _process_fields(self, impression):
+        """
+        Hash an impression's relevant fields without stringifying it.
+
+        :param impression: Impression to hash.
+        :type impression: splitio.models.impressions.Impression
+
+        :returns: an unsigned 64 bit hash of the supplied impression's relevant fields.
+        :rtype: int
+        """
+        return hash64_fields(self._fields(impression), self._seed)
+
 
 class Observer(object):  # pylint:disable=too-few-public-methods
     """Observe impression and add a previous time if applicable."""
@@ -90,7 +122,7 @@ class Observer(object):  # pylint:disable=too-few-public-methods
     def __init__(self, size):
         """Class constructor."""
         self._hasher = Hasher()
-        self._cache = SimpleLruCache(size)
+        self._cache = ShardedLruCache(size)
 
     def test_and_set(self, impression):
         """
@@ -103,14 +135,9 @@ class Observer(object):  # pylint:disable=too-few-public-methods
         :rtype: splitio.models.impressions.Impression
         """
         previous_time = self._cache.test_and_set(self._hasher.process(impression), impression.time)
-        return Impression(impression.matching_key,
-                          impression.feature_name,
-                          impression.treatment,
-                          impression.label,
-                          impression.change_number,
-                          impression.bucketing_key,
-                          impression.time,
-                          previous_time)
+        if previous_time == impression.previous_time:
+            return impression
+        return impression._replace(previous_time=previous_time)
 
 
 class Counter(object):
@@ -0,0 +1,181 @@
+"""Precompiled split evaluation plans."""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from bisect import bisect_left
+from collections import namedtuple
+
+from splitio.engine.evaluator import CONTROL
+from splitio.engine.hashfns import get_hash_fn
+from splitio.models.grammar.condition import ConditionType
+from splitio.models.grammar.matchers import AllKeysMatcher, DependencyMatcher
+from splitio.models.impressions import Label
+
+
+# Matchers that don't read their input from attributes, and therefore cannot be short-circuited
+# when the attribute they reference is missing.
+_ATTRIBUTE_INDEPENDENT_MATCHERS = (AllKeysMatcher, DependencyMatcher)
+
+
+TrafficAllocationCheck = namedtuple('TrafficAllocationCheck', ['seed', 'allocation'])
+ConditionCheck = namedtuple(
+    'ConditionCheck',
+    ['matchers', 'label', 'treatment', 'boundaries', 'treatments']
+)
+MatcherCheck = namedtuple('MatcherCheck', ['evaluate', 'attribute_name', 'negate'])
+
+
+class EvaluationPlan(object):  # pylint: disable=too-few-public-methods
+    """Flat, precomputed list of checks equivalent to walking a split's conditions."""
+
+    def __init__(self, default_treatment, algo, seed, checks):
+        """
+        Class constructor.
+
+        :param default_treatment: Treatment to return when the key falls out of the allocation.
+        :type default_treatment: str
+        :param algo: The split's hash algorithm.
+        :type algo: splitio.models.splits.HashAlgorithm
+        :param seed: Split seed used to select a partition.
+        :type seed: int
+        :param checks: Ordered traffic allocation & condition checks.
+        :type checks: tuple
+        """
+        self._default_treatment = default_treatment
+        self._algo = algo
+        self._hash_fn = get_hash_fn(algo)
+        self._seed = seed
+        self._checks = checks
+
+    @property
+    def checks(self):
+        """Return the ordered checks of this plan."""
+        return self._checks
+
+    def _bucket(self, key, seed, context):
+        """Return the bucket for a key & seed, reusing the evaluation's bucket cache if any."""
+        bucket_cache = context.get('bucket_cache')
+        if bucket_cache is not None:
+            return bucket_cache.get_bucket(key, seed, self._algo)
+        return abs(self._hash_fn(key, seed)) % 100 + 1
+
+    def _matches(self, matcher_checks, matching_key, attributes, context):
+        """Return whether all the matchers of a condition match the supplied input."""
+        for check in matcher_checks:
+            if check.attribute_name is not None \
+                    and (attributes is None or attributes.get(check.attribute_name) is None):
+                if not check.negate:
+                    return False
+                continue
+            if not check.evaluate(matching_key, attributes, context):
+                return False
+        return True
+
+    def evaluate(self, matching_key, bucketing_key, attributes, context):
+        """
+        Run the plan against user submitted data.
+
+        :param matching_key: The key for which to get the treatment
+        :type matching_key: str
+        :param bucketing_key: The key used for hashing
+        :type bucketing_key: str
+        :param attributes: An optional dictionary of attributes
+        :type attributes: dict
+        :param context: Evaluation context
+        :type context: dict
+
+        :return: The resulting treatment and label, or (None, None) if no condition matched.
+        :rtype: tuple
+        """
+        for check in self._checks:
+            if isinstance(check, TrafficAllocationCheck):
+                if self._bucket(bucketing_key, check.seed, context) > check.allocation:
+                    return self._default_treatment, Label.NOT_IN_SPLIT
+                continue
+
+            if not self._matches(check.matchers, matching_key, attributes, context):
+                continue
+
+            if check.treatment is not None:
+                return check.treatment, check.label
+
+            index = bisect_left(check.boundaries, self._bucket(bucketing_key, self._seed, context))
+            if index < len(check.treatments):
+                return check.treatments[index], check.label
+            return CONTROL, check.label
+
+        return None, None
+
+
+def _compile_matcher(matcher):
+    """
+    Build a matcher check with its attribute name resolved upfront.
+
+    :param matcher: Matcher to compile.
+    :type matcher: splitio.models.grammar.matchers.base.Matcher
+
+    :rtype: MatcherCheck
+    """
+    attribute_name = None if isinstance(matcher, _ATTRIBUTE_INDEPENDENT_MATCHERS) \
+        else matcher.attribute_name
+    return MatcherCheck(matcher.evaluate, attribute_name, matcher.negate)
+
+
+def _compile_condition(condition):
+    """
+    Build a condition check with cumulative partition boundaries.
+
+    :param condition: Condition to compile.
+    :type condition: splitio.models.grammar.condition.Condition
+
+    :rtype: ConditionCheck
+    """
+    partitions = condition.partitions
+    treatment = None
+    if not partitions:
+        treatment = CONTROL
+    elif len(partitions) == 1 and partitions[0].size == 100:
+        treatment = partitions[0].treatment
+
+    boundaries = []
+    covered_buckets = 0
+    for partition in partitions:
+        covered_buckets += partition.size
+        boundaries.append(covered_buckets)
+
+    return ConditionCheck(
+        tuple(_compile_matcher(matcher) for matcher in condition.matchers),
+        condition.label,
+        treatment,
+        tuple(boundaries),
+        tuple(partition.treatment for partition in partitions)
+    )
+
+
+def compile_split(split):
+    """
+    Build an evaluation plan for a split.
+
+    :param split: Split to compile.
+    :type split: splitio.models.splits.Split
+
+    :return: Evaluation plan equivalent to the split's conditions.
+    :rtype: EvaluationPlan
+    """
+    checks = []
+    roll_out = False
+    for condition in split.conditions:
+        if not roll_out and condition.condition_type == ConditionType.ROLLOUT:
+            if split.traffic_allocation < 100:
+                checks.append(TrafficAllocationCheck(
+                    split.traffic_allocation_seed,
+                    split.traffic_allocation
+                ))
+            roll_out = True
+        checks.append(_compile_condition(condition))
+
+    return EvaluationPlan(
+        split.default_treatment,
+        split.algo,
+        split.seed,
+        tuple(checks)
+    )
@@ -3,13 +3,14 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 
 from splitio.engine.evaluator import CONTROL
-from splitio.engine.hashfns import get_hash_fn
+from splitio.engine.hashfns import get_hash_fn, get_buckets_fn
 
 
 class Splitter(object):
     """Class responsible for choosing the right partition."""
 
-    def get_treatment(self, key, seed, partitions, algo):
+    def get_treatment(self, key, seed, partitions, algo, bucket_cache=None,  # pylint: disable=too-many-arguments
+                      bucket_treatments=None, hash_fn=None):
         """
         Return the appropriate treatment or CONTROL if no partitions are found.
 
@@ -19,6 +20,12 @@ class Splitter(object):
         :type seed: int
         :param partitions: The condition partitions
         :type partitions: list
+        :param bucket_cache: Optional evaluation-scoped bucket cache
+        :type bucket_cache: splitio.engine.evaluator.BucketCache
+        :param bucket_treatments: Optional precomputed treatment for each bucket
+        :type bucket_treatments: tuple
+        :param hash_fn: Optional hash function already resolved for the algorithm
+        :type hash_fn: callable
         :return: The treatment
         :rtype: str
         """
@@ -28,25 +35,61 @@ class Splitter(object):
         if len(partitions) == 1 and partitions[0].size == 100:
             return partitions[0].treatment
 
-        return self.get_treatment_for_bucket(
-            self.get_bucket(key, seed, algo),
-            partitions
-        )
+        bucket = bucket_cache.get_bucket(key, seed, algo, hash_fn) if bucket_cache is not None \
+            else self.get_bucket(key, seed, algo, hash_fn)
+        if bucket_treatments is not None:
+            treatment = bucket_treatments[bucket - 1]
+            return treatment if treatment is not None else CONTROL
+        return self.get_treatment_for_bucket(bucket, partitions)
 
     @staticmethod
-    def get_bucket(key, seed, algo):
+    def get_bucket(key, seed, algo, hash_fn=None):
         """
         Get the bucket for a key hash.
 
         :param key_hash: The hash for a key
         :type key_hash: int
+        :param hash_fn: Optional hash function already resolved for the algorithm
+        :type hash_fn: callable
         :return: The bucked for a hash
         :rtype: int
         """
-        hashfn = get_hash_fn(algo)
+        hashfn = hash_fn if hash_fn is not None else get_hash_fn(algo)
         key_hash = hashfn(key, seed)
         return abs(key_hash) % 100 + 1
 
+    @staticmethod
+    def get_split_hash_fn(split):
+        """
+        Return the hash function of a split, resolving it only the first time.
+
+        :param split: The split
+        :type split: splitio.models.splits.Split
+        :return: Hash function for the split's algorithm
+        :rtype: callable
+        """
+        hash_fn = split.hash_fn
+        if hash_fn is None:
+            hash_fn = get_hash_fn(split.algo)
+            split.hash_fn = hash_fn
+        return hash_fn
+
+    @staticmethod
+    def get_buckets(keys, seed, algo):
+        """
+        Get the buckets for many keys at once.
+
+        :param keys: The keys to hash
+        :type keys: list(str)
+        :param seed: The feature seed
+        :type seed: int
+        :param algo: The hash algorithm
+        :type algo: splitio.models.splits.HashAlgorithm
+        :return: The buckets for the keys, in the same order
+        :rtype: list(int)
+        """
+        return get_buckets_fn(algo)(keys, seed)
+
     @staticmethod
     def get_treatment_for_bucket(bucket, partitions):
         """
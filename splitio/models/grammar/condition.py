@@ -39,9 +39,30 @@ class Condition(object):
         self._matchers = matcher_list
         self._combiner = combiner
         self._partitions = tuple(parts)
+        self._bucket_treatments = self._build_bucket_treatments(self._partitions)
         self._label = label
         self._condition_type = condition_type
 
+    @staticmethod
+    def _build_bucket_treatments(parts):
+        """
+        Build the table of treatments for each bucket (1 to 100).
+
+        :param parts: Condition partitions.
+        :type parts: tuple
+
+        :return: Treatment for each bucket at index bucket - 1, None if no partition covers it.
+        :rtype: tuple
+        """
+        table = []
+        covered_buckets = 0
+        for partition in parts:
+            covered_buckets += partition.size
+            while len(table) < min(covered_buckets, 100):
+                table.append(partition.treatment)
+        table.extend([None] * (100 - len(table)))
+        return tuple(table)
+
     @property
     def matchers(self):
         """Return the list of matchers associated to the condition."""
@@ -52,6 +73,11 @@ class Condition(object):
         """Return the list of partitions associated with the condition."""
         return self._partitions
 
+    @property
+    def bucket_treatments(self):
+        """Return the treatment for each bucket, at index bucket - 1 (None if not covered)."""
+        return self._bucket_treatments
+
     @property
     def label(self):
         """Return the label of this condition."""
@@ -87,6 +113,18 @@ class Condition(object):
             if isinstance(matcher, matchers.UserDefinedSegmentMatcher)
         ]
 
+    def get_dependency_names(self):
+        """
+        Fetch split names for all IN_SPLIT_TREATMENT matchers.
+
+        :return: List of split names
+        :rtype: list(str)
+        """
+        return [
+            matcher._split_name for matcher in self.matchers  #pylint: disable=protected-access
+            if isinstance(matcher, matchers.DependencyMatcher)
+        ]
+
     @python_2_unicode_compatible
     def __str__(self):
         """Return the string representation of the condition."""
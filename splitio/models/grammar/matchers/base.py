@@ -29,6 +29,16 @@ class Matcher(object):
             self._attribute_name = None
         self._build(raw_matcher)
 
+    @property
+    def attribute_name(self):
+        """Return the name of the attribute used as input, or None if the key is used."""
+        return self._attribute_name
+
+    @property
+    def negate(self):
+        """Return whether the result of this matcher is negated."""
+        return self._negate
+
     def _get_matcher_input(self, key, attributes=None):
         """
         Examine split, attributes & key, and return the appropriate matching input.
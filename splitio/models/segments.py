@@ -1,4 +1,15 @@
 """Segment module."""
+from array import array
+from bisect import bisect_left
+import heapq
+
+from splitio.engine.hashfns import murmur_128
+
+
+# Pending changes of a compact segment are merged once they reach this fraction of its size.
+_COMPACT_MERGE_RATIO = 0.05
+_COMPACT_MIN_PENDING = 1024
+_MASK64 = 0xFFFFFFFFFFFFFFFF
 
 
 class Segment(object):
@@ -44,7 +55,8 @@ class Segment(object):
         :param to_remove: List of keys to remove.
         :type to_remove: list
         """
-        self._keys = self._keys.union(set(to_add)).difference(to_remove)
+        self._keys.update(to_add)
+        self._keys.difference_update(to_remove)
 
     @property
     def keys(self):
@@ -72,6 +84,164 @@ class Segment(object):
         self._change_number = new_value
 
 
+def _hash_key(key):
+    """
+    Return a stable 64 bit hash of a key: the first half of its murmur3 128 bit hash.
+
+    :param key: Key to hash.
+    :type key: str
+
+    :rtype: int
+    """
+    return murmur_128(key, 0) & _MASK64
+
+
+def _sorted_array(hashes):
+    """
+    Build a sorted array of unsigned 64 bit integers.
+
+    :param hashes: Hashes to store.
+    :type hashes: iterable
+
+    :rtype: array.array
+    """
+    return array('Q', sorted(hashes))
+
+
+def _array_contains(hashes, hashed):
+    """
+    Return whether a sorted array holds a hash.
+
+    :param hashes: Sorted hashes.
+    :type hashes: array.array
+    :param hashed: Hash to look for.
+    :type hashed: int
+
+    :rtype: bool
+    """
+    index = bisect_left(hashes, hashed)
+    return index < len(hashes) and hashes[index] == hashed
+
+
+class CompactSegment(object):
+    """
+    Segment object class storing a 64 bit hash per key instead of the keys themselves.
+
+    Hashes are kept in a sorted array, using 8 bytes per member. Incremental changes are
+    recorded in small added/removed sets that get merged into a new array once they grow large
+    enough. Keys are hashed with murmur3 (truncated to 64 bits), so membership is the same in
+    every process, and a non-member colliding with a member is possible though negligible (about
+    n / 2**64 per lookup). Since hashes can't be turned back into keys, `keys` is not available.
+    """
+
+    def __init__(self, name, keys, change_number):
+        """
+        Class constructor.
+
+        :param name: Segment name.
+        :type name: str
+
+        :param keys: List of keys belonging to the segment.
+        :type keys: List
+        """
+        self._name = name
+        self._change_number = change_number
+        self._state = (_sorted_array(set(_hash_key(key) for key in keys)), set(), set())
+
+    @property
+    def name(self):
+        """Return segment name."""
+        return self._name
+
+    def contains(self, key):
+        """
+        Return whether the supplied key belongs to the segment.
+
+        :param key: User key.
+        :type key: str
+
+        :return: True if the user is in the segment. False otherwise.
+        :rtype: bool
+        """
+        hashes, added, removed = self._state
+        hashed = _hash_key(key)
+        if hashed in added:
+            return True
+        if hashed in removed:
+            return False
+        return _array_contains(hashes, hashed)
+
+    def update(self, to_add, to_remove):
+        """
+        Add supplied keys to the segment.
+
+        Every intermediate state seen by concurrent readers is either the previous or the new
+        membership of each key.
+
+        :param to_add: List of keys to add.
+        :type to_add: list
+        :param to_remove: List of keys to remove.
+        :type to_remove: list
+        """
+        hashes, added, removed = self._state
+        for key in to_add:
+            hashed = _hash_key(key)
+            removed.discard(hashed)
+            if not _array_contains(hashes, hashed):
+                added.add(hashed)
+
+        for key in to_remove:
+            hashed = _hash_key(key)
+            added.discard(hashed)
+            if _array_contains(hashes, hashed):
+                removed.add(hashed)
+
+        if len(added) + len(removed) > max(_COMPACT_MIN_PENDING,
+                                           len(hashes) * _COMPACT_MERGE_RATIO):
+            self._merge()
+
+    def _merge(self):
+        """Publish a new sorted array including all pending changes."""
+        hashes, added, removed = self._state
+        merged = array('Q', heapq.merge(
+            (hashed for hashed in hashes if hashed not in removed),
+            sorted(added)
+        ))
+        self._state = (merged, set(), set())
+
+    def __len__(self):
+        """Return the number of members in the segment."""
+        hashes, added, removed = self._state
+        return len(hashes) + len(added) - len(removed)
+
+    @property
+    def keys(self):
+        """
+        Fail, since only key hashes are stored.
+
+        Callers needing the members must keep segments uncompacted (ie: `compactSegmentsEnabled`
+        disabled). Use `contains` to check membership and `len` to count members.
+
+        :raises NotImplementedError: always.
+        """
+        raise NotImplementedError('Compact segments only store key hashes, not the keys.')
+
+    @property
+    def change_number(self):
+        """Return segment change number."""
+        return self._change_number
+
+    @change_number.setter
+    def change_number(self, new_value):
+        """
+        Set new change number.
+
+        :param new_value: New change number.
+        :type new_value: int
+        """
+        self._change_number = new_value
+
+
 def from_raw(raw_segment):
     """
     Parse a new segment from a raw segment_changes response.
@@ -1,6 +1,7 @@
 """Splits module."""
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import types
 from enum import Enum
 from collections import namedtuple
 from future.utils import python_2_unicode_compatible
@@ -8,6 +9,12 @@ from future.utils import python_2_unicode_compatible
 from splitio.models.grammar import condition
 
 
+# Read-only view of a dict (a plain copy in python 2, where no such type exists).
+_frozen_mapping = getattr(types, 'MappingProxyType', dict)  # pylint: disable=invalid-name
+
+_NO_CONFIGURATIONS = _frozen_mapping({})
+
+
 SplitView = namedtuple(
     'SplitView',
     ['name', 'traffic_type', 'killed', 'treatments', 'change_number', 'configs']
@@ -65,6 +72,8 @@ class Split(object):  # pylint: disable=too-many-instance-attributes
         :type traffic_allocation: int
         :pram traffic_allocation_seed: Seed used to hash traffic allocation.
         :type traffic_allocation_seed: int
+        :param configurations: Configuration for each treatment.
+        :type configurations: dict
         """
         self._name = name
         self._seed = seed
@@ -93,6 +102,11 @@ class Split(object):  # pylint: disable=too-many-instance-attributes
             self._algo = HashAlgorithm.LEGACY
 
         self._configurations = configurations
+        self._configurations_by_treatment = _frozen_mapping(dict(configurations)) \
+            if configurations else _NO_CONFIGURATIONS
+        self._has_configurations = bool(self._configurations_by_treatment)
+        self._plan = None
+        self._hash_fn = None
 
     @property
     def name(self):
@@ -149,9 +163,44 @@ class Split(object):  # pylint: disable=too-many-instance-attributes
         """Return the traffic allocation seed of the split."""
         return self._traffic_allocation_seed
 
+    @property
+    def plan(self):
+        """Return the precompiled evaluation plan of the split, if any."""
+        return self._plan
+
+    @plan.setter
+    def plan(self, new_plan):
+        """
+        Set the precompiled evaluation plan.
+
+        :param new_plan: Evaluation plan built from this split's conditions.
+        :type new_plan: splitio.engine.plans.EvaluationPlan
+        """
+        self._plan = new_plan
+
+    @property
+    def has_configurations(self):
+        """Return whether any treatment has a configuration attached."""
+        return self._has_configurations
+
+    @property
+    def hash_fn(self):
+        """Return the hash function of the split's algorithm, if already resolved."""
+        return self._hash_fn
+
+    @hash_fn.setter
+    def hash_fn(self, new_hash_fn):
+        """
+        Set the hash function resolved for the split's algorithm.
+
+        :param new_hash_fn: Hash function.
+        :type new_hash_fn: callable
+        """
+        self._hash_fn = new_hash_fn
+
     def get_configurations_for(self, treatment):
         """Return the mapping of treatments to configurations."""
-        return self._configurations.get(treatment) if self._configurations else None
+        return self._configurations_by_treatment.get(treatment)
 
     def get_segment_names(self):
         """
@@ -162,6 +211,15 @@ class Split(object):  # pylint: disable=too-many-instance-attributes
         """
         return [name for cond in self.conditions for name in cond.get_segment_names()]
 
+    def get_dependency_names(self):
+        """
+        Return a list of split names this split depends on through IN_SPLIT_TREATMENT matchers.
+
+        :return: List of split names.
+        :rtype: list(str)
+        """
+        return [name for cond in self.conditions for name in cond.get_dependency_names()]
+
     def to_json(self):
         """Return a JSON representation of this split."""
         return {
@@ -1,14 +1,26 @@
 """Stats Recorder."""
 import abc
 import logging
+import threading
+from collections import deque, defaultdict
 
 
 from six import add_metaclass
 
+from splitio.client.config import DropPolicy
+
 
 _LOGGER = logging.getLogger(__name__)
 
 
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_SECONDS = 1
+DEFAULT_PIPELINE_FLUSH_SIZE = 1000
+DEFAULT_PIPELINE_FLUSH_MS = 500
+_BLOCK_TIMEOUT_SECONDS = 1
+
+
 @add_metaclass(abc.ABCMeta)
 class StatsRecorder(object):
     """StatsRecorder interface."""
@@ -37,6 +49,10 @@ class StatsRecorder(object):
         """
         pass
 
+    def flush(self):
+        """Write any buffered stats to the storages."""
+        pass
+
 
 class StandardRecorder(StatsRecorder):
     """StandardRecorder class."""
@@ -88,6 +104,173 @@ class StandardRecorder(StatsRecorder):
         return self._event_sotrage.put(event)
 
 
+class AsyncRecorder(StandardRecorder):  #pylint: disable=too-many-instance-attributes
+    """
+    Recorder that processes impressions and latencies in a background thread.
+
+    Request threads only append (impressions, latency, operation) tuples to a bounded queue. A
+    worker drains it in batches, deduping, counting, notifying the listener and writing to
+    storage once per batch. When the queue is full, the drop policy tells whether the new item
+    is discarded, the oldest queued one is discarded, or the caller waits (up to a second) for
+    the worker to make room.
+
+    The worker is a python thread, started on first use and again after a fork. uWSGI disables
+    threads in workers by default, so it must run with `enable-threads` for impressions to be
+    recorded.
+    """
+
+    def __init__(self, impressions_manager, telemetry_storage, event_storage, impression_storage,  #pylint: disable=too-many-arguments
+                 queue_size=DEFAULT_QUEUE_SIZE, drop_policy=DropPolicy.DROP_NEWEST,
+                 batch_size=DEFAULT_BATCH_SIZE, flush_seconds=DEFAULT_FLUSH_SECONDS):
+        """
+        Class constructor.
+
+        :param impressions_manager: impression manager instance
+        :type impressions_manager: splitio.engine.impressions.Manager
+        :param telemetry_storage: telemetry storage instance
+        :type telemetry_storage: splitio.storage.TelemetryStorage
+        :param event_storage: event storage instance
+        :type event_storage: splitio.storage.EventStorage
+        :param impression_storage: impression storage instance
+        :type impression_storage: splitio.storage.ImpressionStorage
+        :param queue_size: maximum number of queued evaluations.
+        :type queue_size: int
+        :param drop_policy: what to do when the queue is full.
+        :type drop_policy: splitio.client.config.DropPolicy
+        :param batch_size: number of queued evaluations that wakes the worker up.
+        :type batch_size: int
+        :param flush_seconds: maximum seconds an evaluation waits in the queue.
+        :type flush_seconds: float
+        """
+        StandardRecorder.__init__(self, impressions_manager, telemetry_storage, event_storage,
+                                  impression_storage)
+        self._queue_size = queue_size
+        self._drop_policy = drop_policy
+        self._batch_size = batch_size
+        self._flush_seconds = flush_seconds
+        # With DROP_OLDEST the deque itself discards the oldest item on append.
+        self._queue = deque(maxlen=queue_size if drop_policy == DropPolicy.DROP_OLDEST else None)
+        self._wakeup = threading.Event()
+        self._drained = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._queue_lock = threading.Lock()
+        self._worker = None
+        self._dropped = 0
+
+    @property
+    def dropped(self):
+        """Return the number of evaluations discarded because the queue was full."""
+        return self._dropped
+
+    @property
+    def pending(self):
+        """Return the number of queued evaluations."""
+        return len(self._queue)
+
+    def record_treatment_stats(self, impressions, latency, operation):
+        """
+        Queue stats for treatment evaluation.
+
+        :param impressions: impressions generated for each evaluation performed
+        :type impressions: array
+        :param latency: time took for doing evaluation
+        :type latency: int
+        :param operation: operation type
+        :type operation: str
+        """
+        if self._worker is None or not self._worker.is_alive():
+            self._start_worker()
+
+        item = (impressions, latency, operation)
+        if not self._enqueue(item, self._drop_policy != DropPolicy.BLOCK):
+            self._wait_for_room()
+            self._enqueue(item, True)
+
+    def _enqueue(self, item, drop_if_full):
+        """
+        Queue an evaluation, applying the drop policy if the queue is full.
+
+        :param item: (impressions, latency, operation) tuple.
+        :type item: tuple
+        :param drop_if_full: Whether to drop an item if the queue is full. Otherwise nothing is
+            queued and False returned.
+        :type drop_if_full: bool
+
+        :return: False if the queue was full and nothing was queued or dropped. True otherwise.
+        :rtype: bool
+        """
+        with self._queue_lock:
+            if len(self._queue) >= self._queue_size:
+                if not drop_if_full:
+                    return False
+                self._dropped += 1
+                if self._drop_policy == DropPolicy.DROP_NEWEST:
+                    return True
+                if self._drop_policy == DropPolicy.BLOCK:
+                    _LOGGER.warning('Impressions recording queue is full. Dropping oldest item.')
+                    self._queue.popleft()
+                # With DROP_OLDEST the deque discards the oldest item on append.
+            self._queue.append(item)
+            batch_ready = len(self._queue) >= self._batch_size
+
+        if batch_ready:
+            self._wakeup.set()
+        return True
+
+    def _wait_for_room(self):
+        """Wake the worker up and wait (up to a timeout) until it drains the queue."""
+        self._drained.clear()
+        self._wakeup.set()
+        self._drained.wait(_BLOCK_TIMEOUT_SECONDS)
+
+    def _start_worker(self):
+        """Start the background worker. Threads don't survive a fork, so it may be restarted."""
+        with self._flush_lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run, name='ImpressionsRecorder')
+            self._worker.daemon = True
+            self._worker.start()
+
+    def _run(self):
+        """Drain the queue whenever a batch is ready or the flush period elapses."""
+        while True:
+            self._wakeup.wait(self._flush_seconds)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        """Process every queued evaluation."""
+        with self._flush_lock:
+            while self._queue:
+                batch = []
+                try:
+                    while len(batch) < self._batch_size:
+                        batch.append(self._queue.popleft())
+                except IndexError:
+                    pass
+                self._record_batch(batch)
+            self._drained.set()
+
+    def _record_batch(self, batch):
+        """
+        Record stats for a batch of evaluations.
+
+        :param batch: (impressions, latency, operation) tuples.
+        :type batch: list(tuple)
+        """
+        try:
+            impressions = self._impressions_manager.process_impressions(
+                [impression for item in batch for impression in item[0]]
+            )
+            if self._impression_storage.put(impressions):
+                for _, latency, operation in batch:
+                    self._telemetry_storage.inc_latency(operation, latency)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.error('Error recording impressions and metrics')
+            _LOGGER.debug('Error: ', exc_info=True)
+
+
 class PipelinedRecorder(StatsRecorder):
     """PipelinedRecorder class."""
 
@@ -126,11 +309,11 @@ class PipelinedRecorder(StatsRecorder):
         try:
             impressions = self._impressions_manager.process_impressions(impressions)
             pipe = self._make_pipe()
-            self._impression_storage.add_impressions_to_pipe(impressions, pipe)
+            pushed = self._impression_storage.add_impressions_to_pipe(impressions, pipe)
             self._telemetry_storage.add_latency_to_pipe(operation, latency, pipe)
             result = pipe.execute()
-            if len(result) == 2:
-                self._impression_storage.expire_key(result[0], len(impressions))
+            if pushed:
+                self._impression_storage.expire_key(result[0], pushed)
         except Exception:  # pylint: disable=broad-except
             _LOGGER.error('Error recording impressions and metrics')
             _LOGGER.debug('Error: ', exc_info=True)
@@ -143,3 +326,108 @@ class PipelinedRecorder(StatsRecorder):
         :type event: splitio.models.events.EventWrapper
         """
         return self._event_sotrage.put(event)
+
+
+class BatchedPipelinedRecorder(PipelinedRecorder):  #pylint: disable=too-many-instance-attributes
+    """
+    Pipelined recorder that buffers impressions and latencies and writes them in batches.
+
+    Impressions are queued in memory and latencies are aggregated per (operation, bucket). A
+    background thread sends everything in a single pipeline every `flush_ms` milliseconds, or
+    as soon as `flush_size` impressions are buffered, using one INCRBY per latency bucket.
+    """
+
+    def __init__(self, pipe, impressions_manager, telemetry_storage, event_storage,  #pylint: disable=too-many-arguments
+                 impression_storage, flush_size=DEFAULT_PIPELINE_FLUSH_SIZE,
+                 flush_ms=DEFAULT_PIPELINE_FLUSH_MS):
+        """
+        Class constructor.
+
+        :param pipe: redis pipeline function
+        :type pipe: callable
+        :param impressions_manager: impression manager instance
+        :type impressions_manager: splitio.engine.impressions.Manager
+        :param telemetry_storage: telemetry storage instance
+        :type telemetry_storage: splitio.storage.redis.RedisTelemetryStorage
+        :param event_storage: event storage instance
+        :type event_storage: splitio.storage.EventStorage
+        :param impression_storage: impression storage instance
+        :type impression_storage: splitio.storage.redis.RedisImpressionsStorage
+        :param flush_size: number of buffered impressions that triggers a flush.
+        :type flush_size: int
+        :param flush_ms: maximum milliseconds stats are buffered.
+        :type flush_ms: int
+        """
+        PipelinedRecorder.__init__(self, pipe, impressions_manager, telemetry_storage,
+                                   event_storage, impression_storage)
+        self._flush_size = flush_size
+        self._flush_seconds = flush_ms / 1000.0
+        self._impressions = []
+        self._latencies = defaultdict(int)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker = None
+
+    def record_treatment_stats(self, impressions, latency, operation):
+        """
+        Buffer stats for treatment evaluation.
+
+        :param impressions: impressions generated for each evaluation performed
+        :type impressions: array
+        :param latency: time took for doing evaluation
+        :type latency: int
+        :param operation: operation type
+        :type operation: str
+        """
+        if self._worker is None or not self._worker.is_alive():
+            self._start_worker()
+        try:
+            impressions = self._impressions_manager.process_impressions(impressions)
+            with self._lock:
+                self._impressions.extend(impressions)
+                self._latencies[(operation, latency)] += 1
+                full = len(self._impressions) >= self._flush_size
+            if full:
+                self._wakeup.set()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.error('Error recording impressions and metrics')
+            _LOGGER.debug('Error: ', exc_info=True)
+
+    def _start_worker(self):
+        """Start the background worker. Threads don't survive a fork, so it may be restarted."""
+        with self._flush_lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run, name='PipelinedRecorder')
+            self._worker.daemon = True
+            self._worker.start()
+
+    def _run(self):
+        """Flush whenever enough impressions are buffered or the flush period elapses."""
+        while True:
+            self._wakeup.wait(self._flush_seconds)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        """Send buffered impressions and latencies in a single pipeline."""
+        with self._flush_lock:
+            with self._lock:
+                impressions, self._impressions = self._impressions, []
+                latencies, self._latencies = self._latencies, defaultdict(int)
+            if not impressions and not latencies:
+                return
+
+            try:
+                pipe = self._make_pipe()
+                pushed = self._impression_storage.add_impressions_to_pipe(impressions, pipe) \
+                    if impressions else 0
+                for (operation, latency), count in latencies.items():
+                    self._telemetry_storage.add_latency_to_pipe(operation, latency, pipe, count)
+                result = pipe.execute()
+                if pushed:
+                    self._impression_storage.expire_key(result[0], pushed)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.error('Error recording impressions and metrics')
+                _LOGGER.debug('Error: ', exc_info=True)
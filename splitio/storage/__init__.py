@@ -57,6 +57,24 @@ class SplitStorage(object):
         """
         pass
 
+    def update(self, to_add, to_delete, new_change_number):
+        """
+        Remove and store many splits, then set the change number if one is supplied.
+
+        :param to_add: Splits to store.
+        :type to_add: list(splitio.models.splits.Split)
+        :param to_delete: Names of the features to remove.
+        :type to_delete: list(str)
+        :param new_change_number: New change number, or None to keep the current one.
+        :type new_change_number: int
+        """
+        for split_name in to_delete:
+            self.remove(split_name)
+        for split in to_add:
+            self.put(split)
+        if new_change_number is not None:
+            self.set_change_number(new_change_number)
+
     @abc.abstractmethod
     def get_change_number(self):
         """
@@ -118,6 +136,15 @@ class SplitStorage(object):
         """
         return set([name for spl in self.get_all_splits() for name in spl.get_segment_names()])
 
+    def get_dependency_graph(self):  # pylint: disable=no-self-use
+        """
+        Return the dependency graph of the splits in storage, if this storage keeps one.
+
+        :return: Dependency graph or None.
+        :rtype: splitio.engine.dependencies.DependencyGraph
+        """
+        return None
+
     @abc.abstractmethod
     def kill_locally(self, split_name, default_treatment, change_number):
         """
@@ -258,6 +285,9 @@ class ImpressionPipelinedStorage(object):
         :type impressions: list
         :param pipe: Redis pipe.
         :type pipe: redis.pipe
+
+        :return: Number of impressions added to the pipeline.
+        :rtype: int
         """
         pass
 
@@ -373,7 +403,7 @@ class TelemetryPipelinedStorage(object):
     """Telemetry Pipelined Storage interface."""
 
     @abc.abstractmethod
-    def add_latency_to_pipe(self, latency, operation, pipe):
+    def add_latency_to_pipe(self, latency, operation, pipe, count=1):
         """
         Add latency operation to pipeline
 
@@ -383,5 +413,7 @@ class TelemetryPipelinedStorage(object):
         :type operation: str
         :param pipe: Redis pipe.
         :type pipe: redis.pipe
+        :param count: Number of times the latency was seen.
+        :type count: int
         """
         pass
@@ -1,16 +1,21 @@
 """Caching trait module."""
 
+import logging
 import threading
 import time
 from functools import update_wrapper
 
 import six
+from six.moves import queue
 
 
 DEFAULT_MAX_AGE = 5
 DEFAULT_MAX_SIZE = 100
 
 
+_LOGGER = logging.getLogger(__name__)
+
+
 class LocalMemoryCache(object):  #pylint: disable=too-many-instance-attributes
     """
     Key/Value local memory cache. with expiration & LRU eviction.
@@ -154,7 +159,144 @@ class LocalMemoryCache(object):  #pylint: disable=too-many-instance-attributes
         return '<MRU>\n' + '\n'.join(nodes) + '\n<LRU>'
 
 
-def decorate(key_func, max_age_seconds=DEFAULT_MAX_AGE, max_size=DEFAULT_MAX_SIZE):
+class RefreshAheadCache(LocalMemoryCache):
+    """
+    Local memory cache that keeps serving expired items while they are reloaded in background.
+
+    The user function is never called while holding the cache lock: misses for different keys
+    load concurrently, concurrent misses for the same key wait for a single load, and expired
+    items are reloaded by one background thread.
+    """
+
+    class _PendingLoad(object):  #pylint: disable=too-few-public-methods
+        """Result of an in-flight load shared by every thread missing the same key."""
+
+        def __init__(self):
+            """Class constructor."""
+            self.event = threading.Event()
+            self.value = None
+            self.error = None
+
+    def __init__(
+            self,
+            key_func,
+            user_func,
+            max_age_seconds=DEFAULT_MAX_AGE,
+            max_size=DEFAULT_MAX_SIZE
+    ):
+        """Class constructor."""
+        LocalMemoryCache.__init__(self, key_func, user_func, max_age_seconds, max_size)
+        self._pending = {}
+        self._refreshing = set()
+        self._refresh_queue = queue.Queue()
+        self._refresher = None
+
+    def get(self, *args, **kwargs):
+        """
+        Fetch an item from the cache. If it's a miss, call user function to fill it.
+
+        :param args: User supplied positional arguments
+        :type args: list
+        :param kwargs: User supplied keyword arguments
+        :type kwargs: dict
+
+        :return: Cached/Fetched object
+        :rtype: object
+        """
+        key = self._key_func(*args, **kwargs)
+        with self._lock:
+            node = self._data.get(key)
+            if node is not None:
+                if self._is_expired(node) and key not in self._refreshing:
+                    self._refreshing.add(key)
+                    self._schedule_refresh(key, args, kwargs)
+                self._bubble_up(node)
+                return node.value
+
+            pending = self._pending.get(key)
+            loader = pending is None
+            if loader:
+                pending = RefreshAheadCache._PendingLoad()
+                self._pending[key] = pending
+
+        if not loader:
+            pending.event.wait()
+            if pending.error is not None:
+                raise pending.error  #pylint: disable=raising-bad-type
+            return pending.value
+
+        try:
+            pending.value = self._user_func(*args, **kwargs)
+            self._store(key, pending.value)
+            return pending.value
+        except Exception as exc:  #pylint: disable=broad-except
+            pending.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            pending.event.set()
+
+    def _store(self, key, value):
+        """
+        Insert or update an item, marking it as the MRU.
+
+        :param key: Item key.
+        :type key: object
+        :param value: Item value.
+        :type value: object
+        """
+        with self._lock:
+            node = self._data.get(key)
+            if node is not None:
+                node.value = value
+                node.last_update = time.time()
+            else:
+                node = LocalMemoryCache._Node(key, value, time.time(), None, None)
+            node = self._bubble_up(node)
+            self._data[key] = node
+            self._rollover()
+
+    def _schedule_refresh(self, key, args, kwargs):
+        """
+        Queue an expired item to be reloaded, starting the refresher thread if needed.
+
+        :param key: Item key.
+        :type key: object
+        :param args: User supplied positional arguments
+        :type args: list
+        :param kwargs: User supplied keyword arguments
+        :type kwargs: dict
+        """
+        self._refresh_queue.put((key, args, kwargs))
+        # Threads don't survive a fork, so the refresher is restarted if it's not running.
+        if self._refresher is None or not self._refresher.is_alive():
+            self._refresher = threading.Thread(target=self._refresh_items,
+                                               name='LocalMemoryCacheRefresher')
+            self._refresher.daemon = True
+            self._refresher.start()
+
+    def _refresh_items(self):
+        """Reload queued items, keeping the stale value if the user function fails."""
+        while True:
+            key, args, kwargs = self._refresh_queue.get()
+            try:
+                value = self._user_func(*args, **kwargs)
+                with self._lock:
+                    node = self._data.get(key)
+                    if node is not None:
+                        node.value = value
+                        node.last_update = time.time()
+            except Exception:  #pylint: disable=broad-except
+                _LOGGER.error('Error refreshing cached item')
+                _LOGGER.debug('Error: ', exc_info=True)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+
+def decorate(key_func, max_age_seconds=DEFAULT_MAX_AGE, max_size=DEFAULT_MAX_SIZE,
+             refresh_ahead=False):
     """
     Decorate a function or method to cache results up  to `max_age_seconds`.
 
@@ -162,6 +304,8 @@ def decorate(key_func, max_age_seconds=DEFAULT_MAX_AGE, max_size=DEFAULT_MAX_SIZ
     :type key_func: callable
     :param max_age_seconds: Maximum number of seconds during which the cached value is valid.
     :type max_age_seconds: int
+    :param refresh_ahead: Whether to serve expired values while they're reloaded in background.
+    :type refresh_ahead: bool
 
     :return: Decorating function wrapper.
     :rtype: callable
@@ -185,7 +329,8 @@ def decorate(key_func, max_age_seconds=DEFAULT_MAX_AGE, max_size=DEFAULT_MAX_SIZ
         :return: A function that looks exactly the same but with cacheable results.
         :rtype: callable
         """
-        _cache = LocalMemoryCache(key_func, user_function, max_age_seconds, max_size)
+        cache_class = RefreshAheadCache if refresh_ahead else LocalMemoryCache
+        _cache = cache_class(key_func, user_function, max_age_seconds, max_size)
         # The lambda below IS necessary, otherwise update_wrapper fails since the function
         # is an instance method and has no reference to the __module__ namespace.
         wrapper = lambda *args, **kwargs: _cache.get(*args, **kwargs)  #pylint: disable=unnecessary-lambda
@@ -152,6 +152,23 @@ class RedisAdapter(object):  # pylint: disable=too-many-public-methods
         except RedisError as exc:
             raise_from(RedisAdapterException('Failed to execute keys operation'), exc)
 
+    def scan_iter(self, match=None, count=None):
+        """
+        Mimic original redis function but using user custom prefix.
+
+        Keys are returned in a list, so that errors are raised while scanning here.
+        """
+        try:
+            return [
+                _bytes_to_string(key)
+                for key in self._prefix_helper.remove_prefix(list(self._decorated.scan_iter(
+                    match=self._prefix_helper.add_prefix(match) if match is not None else None,
+                    count=count
+                )))
+            ]
+        except RedisError as exc:
+            raise_from(RedisAdapterException('Failed to execute scan operation'), exc)
+
     def set(self, name, value, *args, **kwargs):
         """Mimic original redis function but using user custom prefix."""
         try:
@@ -307,6 +324,13 @@ class RedisAdapter(object):  # pylint: disable=too-many-public-methods
         except RedisError as exc:
             raise_from(RedisAdapterException('Error executing lpop operation'), exc)
 
+    def register_script(self, script):
+        """Mimic original redis function but using user custom prefix."""
+        try:
+            return RedisScriptAdapter(self._decorated.register_script(script), self._prefix_helper)
+        except RedisError as exc:
+            raise_from(RedisAdapterException('Error registering script'), exc)
+
     def pipeline(self):
         """Mimic original redis pipeline."""
         try:
@@ -315,6 +339,45 @@ class RedisAdapter(object):  # pylint: disable=too-many-public-methods
             raise_from(RedisAdapterException('Error executing ttl operation'), exc)
 
 
+class RedisScriptAdapter(object):  # pylint: disable=too-few-public-methods
+    """
+    Instance decorator for Redis Scripts.
+
+    Scripts are run with EVALSHA using the cached SHA1, and loaded again if the server lost
+    them. Adds an extra layer handling addition of user prefix to keys.
+    """
+
+    def __init__(self, decorated, prefix_helper):
+        """
+        Store the user prefix and the redis script instance.
+
+        :param decorated: Instance of redis script to decorate.
+        :param _prefix_helper: PrefixHelper utility
+        """
+        self._script = decorated
+        self._prefix_helper = prefix_helper
+
+    def __call__(self, keys, args, client=None):
+        """
+        Run the script using user custom prefix on keys.
+
+        :param keys: Keys passed to the script.
+        :type keys: list
+        :param args: Arguments passed to the script.
+        :type args: list
+        :param client: Pipeline to queue the script on, instead of running it right away.
+        :type client: RedisPipelineAdapter
+        """
+        try:
+            keys = self._prefix_helper.add_prefix(list(keys))
+            if client is not None:
+                pipe = client._pipe  # pylint: disable=protected-access
+                return self._script(keys=keys, args=args, client=pipe)
+            return self._script(keys=keys, args=args)
+        except RedisError as exc:
+            raise_from(RedisAdapterException('Error executing script'), exc)
+
+
 class RedisPipelineAdapter(object):
     """
     Instance decorator for Redis Pipeline.
@@ -0,0 +1,242 @@
+"""On-disk cache of split & segment changes used to resume synchronization after a restart."""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import io
+import json
+import logging
+import os
+import threading
+
+from six.moves.urllib.parse import quote  # pylint: disable=import-error
+
+from splitio.models.splits import Status
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+_MAX_JOURNAL_ENTRIES = 100
+_replace = getattr(os, 'replace', os.rename)  # pylint: disable=invalid-name
+
+
+class DiskChangesCache(object):
+    """
+    Persistent cache of the last known splits and segments, with their change numbers.
+
+    Each snapshot is kept in a journal file: the first line holds a full snapshot (since -1) and
+    following ones the changes received afterwards. Appending keeps writes cheap, journals are
+    replayed when loaded, and compacted back into a single snapshot once they grow too long. A
+    torn trailing line (ie: the process died while writing) is ignored, and a journal whose
+    entries don't chain (each `since` matching the previous `till`) is discarded.
+    """
+
+    _SPLITS_FILE = 'splits.jsonl'
+    _SEGMENT_FILE = 'segment.{name}.jsonl'
+
+    def __init__(self, directory):
+        """
+        Class constructor.
+
+        :param directory: Directory holding the cache files. Created if missing.
+        :type directory: str
+        """
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def _path(self, filename):
+        """Return the full path of a cache file."""
+        return os.path.join(self._directory, filename)
+
+    def _segment_path(self, segment_name):
+        """Return the full path of a segment cache file."""
+        return self._path(self._SEGMENT_FILE.format(name=quote(segment_name, safe='')))
+
+    @staticmethod
+    def _read_entries(path):
+        """
+        Read the valid entries of a journal file.
+
+        :param path: Journal path.
+        :type path: str
+
+        :rtype: list(dict)
+        """
+        entries = []
+        with io.open(path, 'r', encoding='utf-8') as journal:
+            for line in journal:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    break
+        return entries
+
+    def _append(self, path, entry, replay):
+        """
+        Append an entry to a journal, compacting it if it grew too long.
+
+        :param path: Journal path.
+        :type path: str
+        :param entry: Entry to append.
+        :type entry: dict
+        :param replay: Function folding journal entries into a snapshot entry.
+        :type replay: callable
+        """
+        with self._lock:
+            try:
+                if not os.path.isdir(self._directory):
+                    os.makedirs(self._directory)
+                with io.open(path, 'a', encoding='utf-8') as journal:
+                    journal.write(json.dumps(entry) + '\n')
+                self._entries[path] = self._entries.get(path, 0) + 1
+                if self._entries[path] > _MAX_JOURNAL_ENTRIES:
+                    self._compact(path, replay(self._read_entries(path)))
+            except (IOError, OSError, ValueError):
+                _LOGGER.error('Error writing changes cache file %s', path)
+                _LOGGER.debug('Error: ', exc_info=True)
+
+    def _compact(self, path, snapshot):
+        """
+        Replace a journal with a single snapshot entry.
+
+        :param path: Journal path.
+        :type path: str
+        :param snapshot: Snapshot entry.
+        :type snapshot: dict
+        """
+        temp_path = path + '.tmp'
+        with io.open(temp_path, 'w', encoding='utf-8') as journal:
+            journal.write(json.dumps(snapshot) + '\n')
+        _replace(temp_path, path)
+        self._entries[path] = 1
+
+    def _load(self, path, replay):
+        """
+        Replay a journal, compacting it if it grew too long.
+
+        :param path: Journal path.
+        :type path: str
+        :param replay: Function folding journal entries into a snapshot entry.
+        :type replay: callable
+
+        :return: Snapshot entry, or None if there's nothing cached.
+        :rtype: dict
+        """
+        with self._lock:
+            try:
+                if not os.path.isfile(path):
+                    return None
+                entries = self._read_entries(path)
+                if not entries:
+                    return None
+                snapshot = replay(entries)
+                if len(entries) > _MAX_JOURNAL_ENTRIES:
+                    self._compact(path, snapshot)
+                else:
+                    self._entries[path] = len(entries)
+                return snapshot
+            except (IOError, OSError, ValueError, KeyError, TypeError):
+                _LOGGER.error('Error reading changes cache file %s. Discarding it.', path)
+                _LOGGER.debug('Error: ', exc_info=True)
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                return None
+
+    @staticmethod
+    def _check_chain(entries):
+        """Fail if the entries don't start from scratch or don't follow each other."""
+        expected = -1
+        for entry in entries:
+            if entry['since'] != expected:
+                raise ValueError('Changes cache journal is not consistent')
+            expected = entry['till']
+
+    @staticmethod
+    def _replay_splits(entries):
+        """Fold split journal entries into a single snapshot entry."""
+        DiskChangesCache._check_chain(entries)
+        raw_splits = {}
+        for entry in entries:
+            for raw_split in entry['splits']:
+                raw_splits[raw_split['name']] = raw_split
+        return {
+            'splits': [raw_split for raw_split in raw_splits.values()
+                       if raw_split['status'] == Status.ACTIVE.value],
+            'since': -1,
+            'till': entries[-1]['till']
+        }
+
+    @staticmethod
+    def _replay_segment(entries):
+        """Fold segment journal entries into a single snapshot entry."""
+        DiskChangesCache._check_chain(entries)
+        keys = set()
+        for entry in entries:
+            keys.update(entry['added'])
+            keys.difference_update(entry['removed'])
+        return {'added': list(keys), 'removed': [], 'since': -1, 'till': entries[-1]['till']}
+
+    def load_splits(self):
+        """
+        Return the cached splits.
+
+        :return: Tuple of raw active splits and their change number, or None.
+        :rtype: tuple(list(dict), int)
+        """
+        snapshot = self._load(self._path(self._SPLITS_FILE), self._replay_splits)
+        return (snapshot['splits'], snapshot['till']) if snapshot is not None else None
+
+    def save_split_changes(self, raw_splits, since, till):
+        """
+        Record split changes.
+
+        :param raw_splits: Raw splits received, either active or archived.
+        :type raw_splits: list(dict)
+        :param since: Change number the changes apply to.
+        :type since: int
+        :param till: Change number after applying the changes.
+        :type till: int
+        """
+        self._append(self._path(self._SPLITS_FILE),
+                     {'splits': raw_splits, 'since': since, 'till': till}, self._replay_splits)
+
+    def load_segment(self, segment_name):
+        """
+        Return the cached keys of a segment.
+
+        :param segment_name: Name of the segment.
+        :type segment_name: str
+
+        :return: Tuple of keys and change number, or None.
+        :rtype: tuple(list(str), int)
+        """
+        snapshot = self._load(self._segment_path(segment_name), self._replay_segment)
+        return (snapshot['added'], snapshot['till']) if snapshot is not None else None
+
+    def save_segment_changes(  # pylint: disable=too-many-arguments
+            self,
+            segment_name,
+            added,
+            removed,
+            since,
+            till
+    ):
+        """
+        Record segment changes.
+
+        :param segment_name: Name of the segment.
+        :type segment_name: str
+        :param added: Keys added.
+        :type added: list(str)
+        :param removed: Keys removed.
+        :type removed: list(str)
+        :param since: Change number the changes apply to.
+        :type since: int
+        :param till: Change number after applying the changes.
+        :type till: int
+        """
+        self._append(self._segment_path(segment_name),
+                     {'added': added, 'removed': removed, 'since': since, 'till': till},
+                     self._replay_segment)
@@ -1,12 +1,15 @@
 """In memory storage classes."""
 from __future__ import absolute_import
 
+import copy
 import logging
 import threading
-from collections import Counter
+from collections import Counter, namedtuple
 
 from six.moves import queue
-from splitio.models.segments import Segment
+from splitio.engine.dependencies import DependencyGraph
+from splitio.engine.plans import compile_split
+from splitio.models.segments import Segment, CompactSegment
 from splitio.storage import SplitStorage, SegmentStorage, ImpressionStorage, EventStorage, \
     TelemetryStorage
 
@@ -16,15 +19,28 @@ MAX_SIZE_BYTES = 5 * 1024 * 1024
 _LOGGER = logging.getLogger(__name__)
 
 
+_SplitsSnapshot = namedtuple('_SplitsSnapshot', ['splits', 'traffic_types', 'change_number'])
+
+
 class InMemorySplitStorage(SplitStorage):
-    """InMemory implementation of a split storage."""
+    """
+    InMemory implementation of a split storage.
 
-    def __init__(self):
-        """Constructor."""
+    Splits are kept in an immutable snapshot that writers copy, update and publish with a single
+    reference swap, so readers never lock and always see one consistent version of the splits.
+    """
+
+    def __init__(self, build_plans=False):
+        """
+        Constructor.
+
+        :param build_plans: Whether to precompile an evaluation plan for each stored split.
+        :type build_plans: bool
+        """
         self._lock = threading.RLock()
-        self._splits = {}
-        self._change_number = -1
-        self._traffic_types = Counter()
+        self._build_plans = build_plans
+        self._snapshot = _SplitsSnapshot({}, Counter(), -1)
+        self._dependency_graph = (None, None)
 
     def get(self, split_name):
         """
@@ -35,8 +51,7 @@ class InMemorySplitStorage(SplitStorage):
 
         :rtype: splitio.models.splits.Split
         """
-        with self._lock:
-            return self._splits.get(split_name)
+        return self._snapshot.splits.get(split_name)
 
     def fetch_many(self, split_names):
         """
@@ -48,20 +63,19 @@ class InMemorySplitStorage(SplitStorage):
         :return: A dict with split objects parsed from queue.
         :rtype: dict(split_name, splitio.models.splits.Split)
         """
-        return {split_name: self.get(split_name) for split_name in split_names}
+        stored = self._snapshot.splits
+        return {split_name: stored.get(split_name) for split_name in split_names}
 
     def put(self, split):
         """
         Store a split.
 
+        Each call publishes a new snapshot, use `update` to store many splits at once.
+
         :param split: Split object.
         :type split: splitio.models.split.Split
         """
-        with self._lock:
-            if split.name in self._splits:
-                self._decrease_traffic_type_count(self._splits[split.name].traffic_type_name)
-            self._splits[split.name] = split
-            self._increase_traffic_type_count(split.traffic_type_name)
+        self.update([split], [], None)
 
     def remove(self, split_name):
         """
@@ -74,23 +88,59 @@ class InMemorySplitStorage(SplitStorage):
         :rtype: bool
         """
         with self._lock:
-            split = self._splits.get(split_name)
-            if not split:
+            if split_name not in self._snapshot.splits:
                 _LOGGER.warning("Tried to delete nonexistant split %s. Skipping", split_name)
                 return False
-
-            self._splits.pop(split_name)
-            self._decrease_traffic_type_count(split.traffic_type_name)
+            self.update([], [split_name], None)
             return True
 
+    def update(self, to_add, to_delete, new_change_number):
+        """
+        Remove and store many splits publishing a single new snapshot.
+
+        :param to_add: Splits to store.
+        :type to_add: list(splitio.models.splits.Split)
+        :param to_delete: Names of the features to remove.
+        :type to_delete: list(str)
+        :param new_change_number: New change number, or None to keep the current one.
+        :type new_change_number: int
+        """
+        if self._build_plans:
+            for split in to_add:
+                split.plan = compile_split(split)
+
+        with self._lock:
+            current = self._snapshot
+            stored = dict(current.splits)
+            traffic_types = Counter(current.traffic_types)
+            for split_name in to_delete:
+                previous = stored.pop(split_name, None)
+                if previous is None:
+                    _LOGGER.warning("Tried to delete nonexistant split %s. Skipping", split_name)
+                    continue
+                traffic_types.subtract([previous.traffic_type_name])
+
+            for split in to_add:
+                previous = stored.get(split.name)
+                if previous is not None:
+                    traffic_types.subtract([previous.traffic_type_name])
+                stored[split.name] = split
+                traffic_types.update([split.traffic_type_name])
+
+            traffic_types += Counter()
+            self._snapshot = _SplitsSnapshot(
+                stored,
+                traffic_types,
+                current.change_number if new_change_number is None else new_change_number
+            )
+
     def get_change_number(self):
         """
         Retrieve latest split change number.
 
         :rtype: int
         """
-        with self._lock:
-            return self._change_number
+        return self._snapshot.change_number
 
     def set_change_number(self, new_change_number):
         """
@@ -100,7 +150,7 @@ class InMemorySplitStorage(SplitStorage):
         :type new_change_number: int
         """
         with self._lock:
-            self._change_number = new_change_number
+            self._snapshot = self._snapshot._replace(change_number=new_change_number)
 
     def get_split_names(self):
         """
@@ -109,8 +159,7 @@ class InMemorySplitStorage(SplitStorage):
         :return: List of split names.
         :rtype: list(str)
         """
-        with self._lock:
-            return list(self._splits.keys())
+        return list(self._snapshot.splits.keys())
 
     def get_all_splits(self):
         """
@@ -119,8 +168,7 @@ class InMemorySplitStorage(SplitStorage):
         :return: List of all the splits.
         :rtype: list
         """
-        with self._lock:
-            return list(self._splits.values())
+        return list(self._snapshot.splits.values())
 
     def is_valid_traffic_type(self, traffic_type_name):
         """
@@ -132,8 +180,20 @@ class InMemorySplitStorage(SplitStorage):
         :return: True if the traffic type is valid. False otherwise.
         :rtype: bool
         """
-        with self._lock:
-            return traffic_type_name in self._traffic_types
+        return traffic_type_name in self._snapshot.traffic_types
+
+    def get_dependency_graph(self):
+        """
+        Return the dependency graph of the stored splits, rebuilding it after splits change.
+
+        :rtype: splitio.engine.dependencies.DependencyGraph
+        """
+        stored = self._snapshot.splits
+        built_from, graph = self._dependency_graph
+        if built_from is not stored:
+            graph = DependencyGraph(stored.values())
+            self._dependency_graph = (stored, graph)
+        return graph
 
     def kill_locally(self, split_name, default_treatment, change_number):
         """
@@ -149,39 +209,32 @@ class InMemorySplitStorage(SplitStorage):
         with self._lock:
             if self.get_change_number() > change_number:
                 return
-            split = self._splits.get(split_name)
+            split = self._snapshot.splits.get(split_name)
             if not split:
                 return
-            split.local_kill(default_treatment, change_number)
-            self.put(split)
+            # Readers may still hold the stored split, so a killed copy is published instead.
+            killed = copy.copy(split)
+            killed.local_kill(default_treatment, change_number)
+            self.put(killed)
 
-    def _increase_traffic_type_count(self, traffic_type_name):
-        """
-        Increase by one the count for a specific traffic type name.
 
-        :param traffic_type_name: Traffic type to increase the count.
-        :type traffic_type_name: str
-        """
-        self._traffic_types.update([traffic_type_name])
+class InMemorySegmentStorage(SegmentStorage):
+    """
+    In-memory implementation of a segment storage.
 
-    def _decrease_traffic_type_count(self, traffic_type_name):
-        """
-        Decrease by one the count for a specific traffic type name.
+    Readers never lock: new segments are published by swapping the segments dict, and existing
+    ones are updated in place.
+    """
 
-        :param traffic_type_name: Traffic type to decrease the count.
-        :type traffic_type_name: str
+    def __init__(self, compact=False):
         """
-        self._traffic_types.subtract([traffic_type_name])
-        self._traffic_types += Counter()
-
-
-class InMemorySegmentStorage(SegmentStorage):
-    """In-memory implementation of a segment storage."""
+        Constructor.
 
-    def __init__(self):
-        """Constructor."""
+        :param compact: Whether to store segments as sorted arrays of key hashes.
+        :type compact: bool
+        """
         self._segments = {}
-        self._change_numbers = {}
+        self._compact = compact
         self._lock = threading.RLock()
 
     def get(self, segment_name):
@@ -193,24 +246,36 @@ class InMemorySegmentStorage(SegmentStorage):
 
         :rtype: str
         """
-        with self._lock:
-            fetched = self._segments.get(segment_name)
-            if fetched is None:
-                _LOGGER.warning(
-                    "Tried to retrieve nonexistant segment %s. Skipping",
-                    segment_name
-                )
-            return fetched
+        fetched = self._segments.get(segment_name)
+        if fetched is None:
+            _LOGGER.warning(
+                "Tried to retrieve nonexistant segment %s. Skipping",
+                segment_name
+            )
+        return fetched
 
     def put(self, segment):
         """
         Store a segment.
 
+        :param segment: Segment to store.
+        :type segment: splitio.models.segment.Segment
+        """
+        if self._compact and isinstance(segment, Segment):
+            segment = CompactSegment(segment.name, segment.keys, segment.change_number)
+        self._publish(segment)
+
+    def _publish(self, segment):
+        """
+        Make a segment visible to readers, replacing the previous one with the same name.
+
         :param segment: Segment to store.
         :type segment: splitio.models.segment.Segment
         """
         with self._lock:
-            self._segments[segment.name] = segment
+            segments = dict(self._segments)
+            segments[segment.name] = segment
+            self._segments = segments
 
     def update(self, segment_name, to_add, to_remove, change_number=None):
         """
@@ -224,13 +289,15 @@ class InMemorySegmentStorage(SegmentStorage):
         :type to_remove: Set
         """
         with self._lock:
-            if segment_name not in self._segments:
-                self._segments[segment_name] = Segment(segment_name, to_add, change_number)
+            segment = self._segments.get(segment_name)
+            if segment is None:
+                segment_class = CompactSegment if self._compact else Segment
+                self._publish(segment_class(segment_name, to_add, change_number))
                 return
 
-            self._segments[segment_name].update(to_add, to_remove)
+            segment.update(to_add, to_remove)
             if change_number is not None:
-                self._segments[segment_name].change_number = change_number
+                segment.change_number = change_number
 
     def get_change_number(self, segment_name):
         """
@@ -241,10 +308,10 @@ class InMemorySegmentStorage(SegmentStorage):
 
         :rtype: int
         """
-        with self._lock:
-            if segment_name not in self._segments:
-                return None
-            return self._segments[segment_name].change_number
+        segment = self._segments.get(segment_name)
+        if segment is None:
+            return None
+        return segment.change_number
 
     def set_change_number(self, segment_name, new_change_number):
         """
@@ -256,9 +323,10 @@ class InMemorySegmentStorage(SegmentStorage):
         :type new_change_number: int
         """
         with self._lock:
-            if segment_name not in self._segments:
+            segment = self._segments.get(segment_name)
+            if segment is None:
                 return
-            self._segments[segment_name].change_number = new_change_number
+            segment.change_number = new_change_number
 
     def segment_contains(self, segment_name, key):
         """
@@ -272,14 +340,14 @@ class InMemorySegmentStorage(SegmentStorage):
         :return: True if the segment contains the key. False otherwise.
         :rtype: bool
         """
-        with self._lock:
-            if segment_name not in self._segments:
-                _LOGGER.warning(
-                    "Tried to query members for nonexistant segment %s. Returning False",
-                    segment_name
-                )
-                return False
-            return self._segments[segment_name].contains(key)
+        segment = self._segments.get(segment_name)
+        if segment is None:
+            _LOGGER.warning(
+                "Tried to query members for nonexistant segment %s. Returning False",
+                segment_name
+            )
+            return False
+        return segment.contains(key)
 
 
 class InMemoryImpressionStorage(ImpressionStorage):
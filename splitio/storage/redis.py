@@ -4,6 +4,8 @@ from __future__ import absolute_import, division, print_function, \
 
 import json
 import logging
+import threading
+import time
 
 from splitio.models.impressions import Impression
 from splitio.models import splits, segments
@@ -11,10 +13,13 @@ from splitio.storage import SplitStorage, SegmentStorage, ImpressionStorage, Eve
     ImpressionPipelinedStorage, TelemetryStorage, TelemetryPipelinedStorage
 from splitio.storage.adapters.redis import RedisAdapterException
 from splitio.storage.adapters.cache_trait import decorate as add_cache, DEFAULT_MAX_AGE
+from splitio.util.bloom import SegmentFilters, DEFAULT_REFRESH_SECONDS
 
 
 _LOGGER = logging.getLogger(__name__)
 
+_SCAN_COUNT = 1000
+
 
 class RedisSplitStorage(SplitStorage):
     """Redis-based storage for splits."""
@@ -23,18 +28,36 @@ class RedisSplitStorage(SplitStorage):
     _SPLIT_TILL_KEY = 'SPLITIO.splits.till'
     _TRAFFIC_TYPE_KEY = 'SPLITIO.trafficType.{traffic_type_name}'
 
-    def __init__(self, redis_client, enable_caching=False, max_age=DEFAULT_MAX_AGE):
+    def __init__(self, redis_client, enable_caching=False, max_age=DEFAULT_MAX_AGE,  # pylint: disable=too-many-arguments
+                 versioned_cache=False, refresh_ahead=False):
         """
         Class constructor.
 
         :param redis_client: Redis client or compliant interface.
         :type redis_client: splitio.storage.adapters.redis.RedisAdapter
+        :param enable_caching: Whether to keep splits in a local cache.
+        :type enable_caching: bool
+        :param max_age: Seconds an item is cached, or between checks of the change number.
+        :type max_age: int
+        :param versioned_cache: Whether to reload splits only after the change number moves.
+        :type versioned_cache: bool
+        :param refresh_ahead: Whether to serve expired cached items while they're reloaded.
+        :type refresh_ahead: bool
         """
         self._redis = redis_client
+        self._max_age = max_age
+        self._snapshot = (None, {})
+        self._checked_at = None
+        self._refresh_attempts = 0
+        self._refresh_lock = threading.Lock()
         if enable_caching:
-            self.get = add_cache(lambda *p, **_: p[0], max_age)(self.get)
-            self.is_valid_traffic_type = add_cache(lambda *p, **_: p[0], max_age)(self.is_valid_traffic_type)  # pylint: disable=line-too-long
-            self.fetch_many = add_cache(lambda *p, **_: frozenset(p[0]), max_age)(self.fetch_many)
+            if versioned_cache:
+                self.get = self._get_cached
+                self.fetch_many = self._fetch_many_cached
+            else:
+                self.get = add_cache(lambda *p, **_: p[0], max_age, refresh_ahead=refresh_ahead)(self.get)  # pylint: disable=line-too-long
+                self.fetch_many = add_cache(lambda *p, **_: frozenset(p[0]), max_age, refresh_ahead=refresh_ahead)(self.fetch_many)  # pylint: disable=line-too-long
+            self.is_valid_traffic_type = add_cache(lambda *p, **_: p[0], max_age, refresh_ahead=refresh_ahead)(self.is_valid_traffic_type)  # pylint: disable=line-too-long
 
     def _get_key(self, split_name):
         """
@@ -105,6 +128,105 @@ class RedisSplitStorage(SplitStorage):
             _LOGGER.debug('Error: ', exc_info=True)
         return to_return
 
+    def _get_cached(self, split_name):
+        """
+        Retrieve a split from the local snapshot.
+
+        :param split_name: Name of the feature to fetch.
+        :type split_name: str
+
+        :return: A split object if it exists. None otherwise
+        :rtype: splitio.models.splits.Split
+        """
+        cached = self._get_snapshot().get(split_name)
+        return cached[1] if cached is not None else None
+
+    def _fetch_many_cached(self, split_names):
+        """
+        Retrieve splits from the local snapshot.
+
+        :param split_names: Names of the features to fetch.
+        :type split_name: list(str)
+
+        :return: A dict with split objects.
+        :rtype: dict(split_name, splitio.models.splits.Split)
+        """
+        snapshot = self._get_snapshot()
+        return {
+            split_name: snapshot[split_name][1] if split_name in snapshot else None
+            for split_name in split_names
+        }
+
+    def _get_snapshot(self):
+        """
+        Return the local snapshot of splits, checking the change number every `max_age` seconds.
+
+        Only one thread refreshes at a time while others keep reading the current snapshot.
+
+        :return: Raw & parsed split for each split name.
+        :rtype: dict(str, tuple(str, splitio.models.splits.Split))
+        """
+        checked_at = self._checked_at
+        if checked_at is not None and time.time() - checked_at < self._max_age:
+            return self._snapshot[1]
+
+        attempts = self._refresh_attempts
+
+        # Block only if there is nothing to serve yet.
+        if not self._refresh_lock.acquire(checked_at is None):
+            return self._snapshot[1]
+        try:
+            # Threads that waited for the lock reuse the outcome of the attempt made meanwhile,
+            # instead of querying redis one after another while it is failing.
+            if self._refresh_attempts == attempts:
+                self._refresh_attempts += 1
+                if self._refresh_snapshot():
+                    self._checked_at = time.time()
+        finally:
+            self._refresh_lock.release()
+        return self._snapshot[1]
+
+    def _refresh_snapshot(self):
+        """
+        Reload all the splits in a single MGET if the change number moved since last time.
+
+        :return: True if the snapshot is up to date. False if redis could not be queried.
+        :rtype: bool
+        """
+        till, current = self._snapshot
+        try:
+            new_till = self._redis.get(self._SPLIT_TILL_KEY)
+            if new_till is not None and new_till == till:
+                return True
+
+            keys = self._redis.scan_iter(self._get_key('*'), _SCAN_COUNT)
+            raw_splits = self._redis.mget(keys) if keys else []
+        except RedisAdapterException:
+            _LOGGER.error('Error fetching splits from storage')
+            _LOGGER.debug('Error: ', exc_info=True)
+            return False
+
+        snapshot = {}
+        prefix = self._get_key('')
+        for key, raw in zip(keys, raw_splits):
+            if raw is None:
+                continue
+            split_name = key.replace(prefix, '', 1)
+            cached = current.get(split_name)
+            if cached is not None and cached[0] == raw:
+                snapshot[split_name] = cached
+                continue
+            try:
+                snapshot[split_name] = (raw, splits.from_raw(json.loads(raw)))
+            except (ValueError, TypeError):
+                _LOGGER.error('Could not parse split. Skipping')
+                _LOGGER.debug("Raw split that failed parsing attempt: %s", raw)
+
+        # The change number was read before the splits, so changes made in between are picked
+        # up again on the next check.
+        self._snapshot = (new_till, snapshot)
+        return True
+
     def is_valid_traffic_type(self, traffic_type_name):  # pylint: disable=method-hidden
         """
         Return whether the traffic type exists in at least one split in cache.
@@ -225,14 +347,35 @@ class RedisSegmentStorage(SegmentStorage):
     _SEGMENTS_KEY = 'SPLITIO.segment.{segment_name}'
     _SEGMENTS_TILL_KEY = 'SPLITIO.segment.{segment_name}.till'
 
-    def __init__(self, redis_client):
+    def __init__(self, redis_client, bloom_filters_enabled=False,
+                 bloom_refresh_seconds=DEFAULT_REFRESH_SECONDS):
         """
         Class constructor.
 
         :param redis_client: Redis client or compliant interface.
         :type redis_client: splitio.storage.adapters.redis.RedisAdapter
+        :param bloom_filters_enabled: Whether to skip SISMEMBER for keys a local filter rules out.
+        :type bloom_filters_enabled: bool
+        :param bloom_refresh_seconds: Seconds between checks of a segment's change number.
+        :type bloom_refresh_seconds: int
         """
         self._redis = redis_client
+        self._filters = SegmentFilters(
+            self.get_change_number,
+            self._get_members,
+            bloom_refresh_seconds
+        ) if bloom_filters_enabled else None
+
+    def _get_members(self, segment_name):
+        """
+        Fetch all the members of a segment.
+
+        :param segment_name: Name of the segment.
+        :type segment_name: str
+
+        :rtype: set(str)
+        """
+        return self._redis.smembers(self._get_key(segment_name))
 
     def _get_till_key(self, segment_name):
         """
@@ -341,6 +484,9 @@ class RedisSegmentStorage(SegmentStorage):
         :return: True if the segment contains the key. False otherwise.
         :rtype: bool
         """
+        if self._filters is not None and not self._filters.might_contain(segment_name, key):
+            return False
+
         try:
             return self._redis.sismember(self._get_key(segment_name), key)
         except RedisAdapterException:
@@ -349,13 +495,44 @@ class RedisSegmentStorage(SegmentStorage):
             return None
 
 
+# Pushes ARGV[2..n] to KEYS[1] (in chunks, to stay within lua's stack limits) and, if ARGV[1] is
+# positive and the list was just created, sets its TTL. Returns the length of the list.
+_PUSH_WITH_TTL_SCRIPT = """
+local count = 0
+for first = 2, #ARGV, 1000 do
+    count = redis.call('RPUSH', KEYS[1], unpack(ARGV, first, math.min(first + 999, #ARGV)))
+end
+local ttl = tonumber(ARGV[1])
+if ttl > 0 and #ARGV > 1 and count == #ARGV - 1 then
+    redis.call('EXPIRE', KEYS[1], ttl)
+end
+return count
+"""
+
+
+def _serialize_metadata(sdk_metadata):
+    """
+    Serialize the SDK metadata portion shared by every impression and event.
+
+    :param sdk_metadata: SDK & Machine information.
+    :type sdk_metadata: splitio.client.util.SdkMetadata
+
+    :rtype: str
+    """
+    return json.dumps({
+        's': sdk_metadata.sdk_version,
+        'n': sdk_metadata.instance_name,
+        'i': sdk_metadata.instance_ip,
+    })
+
+
 class RedisImpressionsStorage(ImpressionStorage, ImpressionPipelinedStorage):
     """Redis based event storage class."""
 
     IMPRESSIONS_QUEUE_KEY = 'SPLITIO.impressions'
     IMPRESSIONS_KEY_DEFAULT_TTL = 3600
 
-    def __init__(self, redis_client, sdk_metadata):
+    def __init__(self, redis_client, sdk_metadata, scripted_writes=False):
         """
         Class constructor.
 
@@ -363,9 +540,15 @@ class RedisImpressionsStorage(ImpressionStorage, ImpressionPipelinedStorage):
         :type redis_client: splitio.storage.adapters.redis.RedisAdapter
         :param sdk_metadata: SDK & Machine information.
         :type sdk_metadata: splitio.client.util.SdkMetadata
+        :param scripted_writes: Whether to push and set the TTL in a single server-side script.
+        :type scripted_writes: bool
         """
         self._redis = redis_client
         self._sdk_metadata = sdk_metadata
+        # Serialized once, impressions are stored as '{"m": <metadata>, "i": <impression>}'
+        self._prefix = '{"m": ' + _serialize_metadata(sdk_metadata) + ', "i": '
+        self._push = redis_client.register_script(_PUSH_WITH_TTL_SCRIPT) if scripted_writes \
+            else None
 
     def _wrap_impressions(self, impressions):
         """
@@ -377,37 +560,33 @@ class RedisImpressionsStorage(ImpressionStorage, ImpressionPipelinedStorage):
         :return: Processed impressions.
         :rtype: list[splitio.models.impressions.Impression]
         """
-        bulk_impressions = []
-        for impression in impressions:
-            if isinstance(impression, Impression):
-                to_store = {
-                    'm': {  # METADATA PORTION
-                        's': self._sdk_metadata.sdk_version,
-                        'n': self._sdk_metadata.instance_name,
-                        'i': self._sdk_metadata.instance_ip,
-                    },
-                    'i': {  # IMPRESSION PORTION
-                        'k': impression.matching_key,
-                        'b': impression.bucketing_key,
-                        'f': impression.feature_name,
-                        't': impression.treatment,
-                        'r': impression.label,
-                        'c': impression.change_number,
-                        'm': impression.time,
-                    }
-                }
-            bulk_impressions.append(json.dumps(to_store))
-        return bulk_impressions
+        prefix = self._prefix
+        return [
+            prefix + json.dumps({
+                'k': impression.matching_key,
+                'b': impression.bucketing_key,
+                'f': impression.feature_name,
+                't': impression.treatment,
+                'r': impression.label,
+                'c': impression.change_number,
+                'm': impression.time,
+            }) + '}'
+            for impression in impressions
+            if isinstance(impression, Impression)
+        ]
 
     def expire_key(self, total_keys, inserted):
         """
-        Set expire
+        Set expire, unless writes are scripted.
 
         :param total_keys: length of keys.
         :type total_keys: int
         :param inserted: added keys.
         :type inserted: int
         """
+        if self._push is not None:
+            return  # The script already set the TTL when it created the queue.
+
         if total_keys == inserted:
             _LOGGER.debug("SET EXPIRE KEY FOR QUEUE")
             self._redis.expire(self.IMPRESSIONS_QUEUE_KEY, self.IMPRESSIONS_KEY_DEFAULT_TTL)
@@ -420,9 +599,20 @@ class RedisImpressionsStorage(ImpressionStorage, ImpressionPipelinedStorage):
         :type impressions: list
         :param pipe: Redis pipe.
         :type pipe: redis.pipe
+
+        :return: Number of impressions added to the pipeline.
+        :rtype: int
         """
         bulk_impressions = self._wrap_impressions(impressions)
-        pipe.rpush(self.IMPRESSIONS_QUEUE_KEY, *bulk_impressions)
+        if not bulk_impressions:
+            return 0
+
+        if self._push is not None:
+            self._push([self.IMPRESSIONS_QUEUE_KEY],
+                       [self.IMPRESSIONS_KEY_DEFAULT_TTL] + bulk_impressions, client=pipe)
+        else:
+            pipe.rpush(self.IMPRESSIONS_QUEUE_KEY, *bulk_impressions)
+        return len(bulk_impressions)
 
     def put(self, impressions):
         """
@@ -435,7 +625,14 @@ class RedisImpressionsStorage(ImpressionStorage, ImpressionPipelinedStorage):
         :rtype: bool
         """
         bulk_impressions = self._wrap_impressions(impressions)
+        if not bulk_impressions:
+            return True
+
         try:
+            if self._push is not None:
+                self._push([self.IMPRESSIONS_QUEUE_KEY],
+                           [self.IMPRESSIONS_KEY_DEFAULT_TTL] + bulk_impressions)
+                return True
             inserted = self._redis.rpush(self.IMPRESSIONS_QUEUE_KEY, *bulk_impressions)
             self.expire_key(inserted, len(bulk_impressions))
             return True
@@ -465,7 +662,7 @@ class RedisEventsStorage(EventStorage):
 
     _KEY_TEMPLATE = 'SPLITIO.events'
 
-    def __init__(self, redis_client, sdk_metadata):
+    def __init__(self, redis_client, sdk_metadata, scripted_writes=False):
         """
         Class constructor.
 
@@ -473,9 +670,15 @@ class RedisEventsStorage(EventStorage):
         :type redis_client: splitio.storage.adapters.redis.RedisAdapter
         :param sdk_metadata: SDK & Machine information.
         :type sdk_metadata: splitio.client.util.SdkMetadata
+        :param scripted_writes: Whether to push events using a server-side script.
+        :type scripted_writes: bool
         """
         self._redis = redis_client
         self._sdk_metadata = sdk_metadata
+        # Serialized once, events are stored as '{"e": <event>, "m": <metadata>}'
+        self._suffix = ', "m": ' + _serialize_metadata(sdk_metadata) + '}'
+        self._push = redis_client.register_script(_PUSH_WITH_TTL_SCRIPT) if scripted_writes \
+            else None
 
     def put(self, events):
         """
@@ -488,25 +691,22 @@ class RedisEventsStorage(EventStorage):
         :rtype: bool
         """
         key = self._KEY_TEMPLATE
+        suffix = self._suffix
         to_store = [
-            json.dumps({
-                'e': {
-                    'key': e.event.key,
-                    'trafficTypeName': e.event.traffic_type_name,
-                    'eventTypeId': e.event.event_type_id,
-                    'value': e.event.value,
-                    'timestamp': e.event.timestamp,
-                    'properties': e.event.properties,
-                },
-                'm': {
-                    's': self._sdk_metadata.sdk_version,
-                    'n': self._sdk_metadata.instance_name,
-                    'i': self._sdk_metadata.instance_ip,
-                }
-            })
+            '{"e": ' + json.dumps({
+                'key': e.event.key,
+                'trafficTypeName': e.event.traffic_type_name,
+                'eventTypeId': e.event.event_type_id,
+                'value': e.event.value,
+                'timestamp': e.event.timestamp,
+                'properties': e.event.properties,
+            }) + suffix
             for e in events
         ]
         try:
+            if self._push is not None:
+                self._push([key], [0] + to_store)  # events key has no TTL
+                return True
             self._redis.rpush(key, *to_store)
             return True
         except RedisAdapterException:
@@ -618,7 +818,7 @@ class RedisTelemetryStorage(TelemetryStorage, TelemetryPipelinedStorage):
 
         return self._get_latency_key(name, bucket)
 
-    def add_latency_to_pipe(self, name, bucket, pipe):
+    def add_latency_to_pipe(self, name, bucket, pipe, count=1):
         """
         Add latency operation to pipeline
 
@@ -628,11 +828,16 @@ class RedisTelemetryStorage(TelemetryStorage, TelemetryPipelinedStorage):
         :tyoe value: int
         :param pipe: Redis pipe.
         :type pipe: redis.pipe
+        :param count: Number of times the latency was seen.
+        :type count: int
         """
         key = self._wrap_latency(name, bucket)
         if key is None:
             return
-        pipe.incr(key)
+        if count == 1:
+            pipe.incr(key)
+        else:
+            pipe.incr(key, count)
 
     def inc_latency(self, name, bucket):
         """
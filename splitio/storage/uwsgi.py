@@ -1,6 +1,8 @@
 """UWSGI Cache based storages implementation module."""
+import copy
 import logging
 import json
+import uuid
 
 from splitio.storage import SplitStorage, SegmentStorage, ImpressionStorage, EventStorage, \
     TelemetryStorage
@@ -12,6 +14,7 @@ from splitio.storage.adapters.uwsgi_cache import _SPLITIO_CHANGE_NUMBERS, \
     _SPLITIO_METRICS_CACHE_NAMESPACE, _SPLITIO_MISC_NAMESPACE, UWSGILock, \
     _SPLITIO_SEGMENTS_CACHE_NAMESPACE, _SPLITIO_SPLITS_CACHE_NAMESPACE, \
     _SPLITIO_LOCK_CACHE_NAMESPACE
+from splitio.util.bloom import SegmentFilters, DEFAULT_REFRESH_SECONDS
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,6 +25,7 @@ class UWSGISplitStorage(SplitStorage):
 
     _KEY_TEMPLATE = 'split.{suffix}'
     _KEY_TILL = 'splits.till'
+    _KEY_VERSION = 'splits.version'
     _KEY_FEATURE_LIST = 'splits.list'
     _KEY_FEATURE_LIST_LOCK = 'splits.list.lock'
     _KEY_TRAFFIC_TYPES = 'splits.traffic_types'
@@ -36,6 +40,7 @@ class UWSGISplitStorage(SplitStorage):
         :type uwsgi_entrypoint: module
         """
         self._uwsgi = uwsgi_entrypoint
+        self._parsed = {}
 
     def get(self, split_name):
         """
@@ -46,6 +51,35 @@ class UWSGISplitStorage(SplitStorage):
 
         :rtype: str
         """
+        return self._get(split_name, self._get_version())
+
+    def _get_version(self):
+        """
+        Return the version of the stored splits, which changes whenever splits.till moves.
+
+        :rtype: str
+        """
+        return self._uwsgi.cache_get(self._KEY_VERSION, _SPLITIO_CHANGE_NUMBERS)
+
+    def _bump_version(self):
+        """Invalidate the splits parsed by every worker."""
+        self._uwsgi.cache_update(self._KEY_VERSION, uuid.uuid4().hex, 0, _SPLITIO_CHANGE_NUMBERS)
+
+    def _get(self, split_name, version):
+        """
+        Retrieve a split, reusing the one parsed by this worker if the splits version is the same.
+
+        :param split_name: Name of the feature to fetch.
+        :type split_name: str
+        :param version: Raw splits version read before the split.
+        :type version: str
+
+        :rtype: splitio.models.splits.Split
+        """
+        cached = self._parsed.get(split_name)
+        if cached is not None and version is not None and cached[0] == version:
+            return cached[1]
+
         raw = self._uwsgi.cache_get(
             self._KEY_TEMPLATE.format(suffix=split_name),
             _SPLITIO_SPLITS_CACHE_NAMESPACE
@@ -53,6 +87,11 @@ class UWSGISplitStorage(SplitStorage):
         to_return = splits.from_raw(json.loads(raw)) if raw is not None else None
         if not to_return:
             _LOGGER.warning("Trying to retrieve nonexistant split %s. Ignoring.", split_name)
+            self._parsed.pop(split_name, None)
+        elif version is not None:
+            # A split updated after reading the version gets cached with the old one and parsed
+            # again, since writers store splits before bumping it.
+            self._parsed[split_name] = (version, to_return)
         return to_return
 
     def fetch_many(self, split_names):
@@ -65,7 +104,8 @@ class UWSGISplitStorage(SplitStorage):
         :return: A dict with split objects parsed from queue.
         :rtype: dict(split_name, splitio.models.splits.Split)
         """
-        return {split_name: self.get(split_name) for split_name in split_names}
+        version = self._get_version()
+        return {split_name: self._get(split_name, version) for split_name in split_names}
 
     def put(self, split):
         """
@@ -74,6 +114,7 @@ class UWSGISplitStorage(SplitStorage):
         :param split: Split object to store
         :type split: splitio.models.splits.Split
         """
+        self._parsed.pop(split.name, None)
         self._uwsgi.cache_update(
             self._KEY_TEMPLATE.format(suffix=split.name),
             json.dumps(split.to_json()),
@@ -101,6 +142,7 @@ class UWSGISplitStorage(SplitStorage):
             )
             return
 
+        self._parsed.pop(split_name, None)
         result = self._uwsgi.cache_del(
             self._KEY_TEMPLATE.format(suffix=split_name),
             _SPLITIO_SPLITS_CACHE_NAMESPACE
@@ -131,7 +173,10 @@ class UWSGISplitStorage(SplitStorage):
         :param new_change_number: New change number.
         :type new_change_number: int
         """
+        changed = self.get_change_number() != new_change_number
         self._uwsgi.cache_update(self._KEY_TILL, str(new_change_number), 0, _SPLITIO_CHANGE_NUMBERS)
+        if changed:
+            self._bump_version()
 
     def get_split_names(self):
         """
@@ -284,8 +329,11 @@ class UWSGISplitStorage(SplitStorage):
         split = self.get(split_name)
         if not split:
             return
-        split.local_kill(default_treatment, change_number)
-        self.put(split)
+        # The split may be the one parsed & cached by this worker, so a killed copy is stored.
+        killed = copy.copy(split)
+        killed.local_kill(default_treatment, change_number)
+        self.put(killed)
+        self._bump_version()
 
 
 class UWSGISegmentStorage(SegmentStorage):
@@ -295,14 +343,40 @@ class UWSGISegmentStorage(SegmentStorage):
     _SEGMENT_DATA_KEY_TEMPLATE = 'segmentData.{segment_name}'
     _SEGMENT_CHANGE_NUMBER_KEY_TEMPLATE = 'segment.{segment_name}.till'
 
-    def __init__(self, uwsgi_entrypoint):
+    def __init__(self, uwsgi_entrypoint, bloom_filters_enabled=False,
+                 bloom_refresh_seconds=DEFAULT_REFRESH_SECONDS):
         """
         Class constructor.
 
         :param uwsgi_entrypoint: UWSGI module. Can be the actual module or a mock.
         :type uwsgi_entrypoint: module
+        :param bloom_filters_enabled: Whether to skip lookups for keys a local filter rules out.
+        :type bloom_filters_enabled: bool
+        :param bloom_refresh_seconds: Seconds between checks of a segment's change number.
+        :type bloom_refresh_seconds: int
         """
         self._uwsgi = uwsgi_entrypoint
+        self._decoded = {}
+        self._filters = SegmentFilters(
+            self.get_change_number,
+            self._get_members,
+            bloom_refresh_seconds
+        ) if bloom_filters_enabled else None
+
+    def _get_members(self, segment_name):
+        """
+        Fetch all the members of a segment.
+
+        :param segment_name: Name of the segment.
+        :type segment_name: str
+
+        :rtype: list(str)
+        """
+        key = self._SEGMENT_DATA_KEY_TEMPLATE.format(segment_name=segment_name)
+        try:
+            return json.loads(self._uwsgi.cache_get(key, _SPLITIO_SEGMENTS_CACHE_NAMESPACE))
+        except TypeError:
+            return None
 
     def get(self, segment_name):
         """
@@ -349,6 +423,7 @@ class UWSGISegmentStorage(SegmentStorage):
         except TypeError:
             segment_data = []
         updated = set(segment_data).union(set(to_add)).difference(to_remove)
+        self._decoded.pop(segment_name, None)
         self._uwsgi.cache_update(
             key,
             json.dumps(list(updated)),
@@ -367,6 +442,7 @@ class UWSGISegmentStorage(SegmentStorage):
         :type segment: splitio.models.segments.Segent
         """
         key = self._SEGMENT_DATA_KEY_TEMPLATE.format(segment_name=segment.name)
+        self._decoded.pop(segment.name, None)
         self._uwsgi.cache_update(
             key,
             json.dumps(list(segment.keys)),
@@ -415,9 +491,43 @@ class UWSGISegmentStorage(SegmentStorage):
         :return: True if the segment contains the key. False otherwise.
         :rtype: bool
         """
-        segment = self.get(segment_name)
+        if self._filters is not None and not self._filters.might_contain(segment_name, key):
+            return False
+
+        segment = self._get_decoded(segment_name)
         return segment.contains(key)
 
+    def _get_decoded(self, segment_name):
+        """
+        Return a segment decoded by this worker, parsing it again only if its change number moved.
+
+        :param segment_name: Name of the segment.
+        :type segment_name: str
+
+        :return: Parsed segment if present. None otherwise.
+        :rtype: splitio.models.segments.Segment
+        """
+        # The change number is read before the members, so a segment updated in between is
+        # cached with the old change number and parsed again on the next lookup.
+        change_number = self.get_change_number(segment_name)
+        cached = self._decoded.get(segment_name)
+        if cached is not None and change_number is not None \
+                and cached.change_number == change_number:
+            return cached
+
+        members = self._get_members(segment_name)
+        if members is None or change_number is None:
+            _LOGGER.warning(
+                "Trying to retrieve nonexistant segment %s. Ignoring.",
+                segment_name
+            )
+            self._decoded.pop(segment_name, None)
+            return None
+
+        segment = segments.Segment(segment_name, members, change_number)
+        self._decoded[segment_name] = segment
+        return segment
+
 
 class UWSGIImpressionStorage(ImpressionStorage):
     """Impressions storage interface."""
@@ -51,6 +51,9 @@ class Manager(object):  # pylint:disable=too-many-instance-attributes
     def start(self):
         """Start the SDK synchronization tasks."""
         try:
+            if self._synchronizer.load_cached():
+                # Serve the cached data right away while sync_all catches up with the changes.
+                self._ready_flag.set()
             self._synchronizer.sync_all()
             self._ready_flag.set()
             self._synchronizer.start_periodic_data_recording()
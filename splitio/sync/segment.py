@@ -1,4 +1,7 @@
 import logging
+import math
+import threading
+import time
 
 from splitio.api import APIException
 from splitio.models import splits
@@ -9,8 +12,55 @@ from splitio.models import segments
 _LOGGER = logging.getLogger(__name__)
 
 
+_MIN_WORKERS = 10
+_MAX_WORKERS = 50
+_TARGET_SYNC_SECONDS = 1.0
+_DURATION_WEIGHT = 0.2
+
+
+class _SegmentFetch(object):
+    """Segment changes request running in a background thread."""
+
+    def __init__(self, fetch_segment, segment_name, change_number):
+        """
+        Class constructor. Starts the request right away.
+
+        :param fetch_segment: Function fetching segment changes.
+        :type fetch_segment: callable
+        :param segment_name: Name of the segment.
+        :type segment_name: str
+        :param change_number: Change number to fetch changes since.
+        :type change_number: int
+        """
+        self._result = None
+        self._error = None
+        self._thread = threading.Thread(target=self._run,
+                                        args=(fetch_segment, segment_name, change_number))
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+    def _run(self, fetch_segment, segment_name, change_number):
+        """Perform the request and keep its outcome."""
+        try:
+            self._result = fetch_segment(segment_name, change_number)
+        except Exception as exc:  # pylint: disable=broad-except
+            self._error = exc
+
+    def result(self):
+        """
+        Wait for the request to finish.
+
+        :return: Json representation of a segmentChange response.
+        :rtype: dict
+        """
+        self._thread.join()
+        if self._error is not None:
+            raise self._error  # pylint: disable=raising-bad-type
+        return self._result
+
+
 class SegmentSynchronizer(object):
-    def __init__(self, segment_api, split_storage, segment_storage):
+    def __init__(self, segment_api, split_storage, segment_storage, changes_cache=None):
         """
         Class constructor.
 
@@ -23,11 +73,18 @@ class SegmentSynchronizer(object):
         :param segment_storage: Segment storage reference.
         :type segment_storage: splitio.storage.SegmentStorage
 
+        :param changes_cache: Optional on-disk cache to resume from and keep up to date.
+        :type changes_cache: splitio.storage.disk.DiskChangesCache
+
         """
         self._api = segment_api
         self._split_storage = split_storage
         self._segment_storage = segment_storage
-        self._worker_pool = workerpool.WorkerPool(10, self.synchronize_segment)
+        self._changes_cache = changes_cache
+        self._durations = {}
+        self._average_duration = None
+        self._durations_lock = threading.Lock()
+        self._worker_pool = workerpool.WorkerPool(_MIN_WORKERS, self.synchronize_segment)
         self._worker_pool.start()
 
     def recreate(self):
@@ -35,7 +92,7 @@ class SegmentSynchronizer(object):
         Create worker_pool on forked processes.
 
         """
-        self._worker_pool = workerpool.WorkerPool(10, self.synchronize_segment)
+        self._worker_pool = workerpool.WorkerPool(_MIN_WORKERS, self.synchronize_segment)
         self._worker_pool.start()
 
     def shutdown(self):
@@ -56,20 +113,43 @@ class SegmentSynchronizer(object):
         :type till: int
 
         """
+        start = time.time()
+        if self._fetch_until_synced(segment_name, till):
+            self._record_duration(segment_name, time.time() - start)
+
+    def _fetch_until_synced(self, segment_name, till):
+        """
+        Fetch and apply segment changes until the segment is up to date.
+
+        The request for the next page is issued as soon as the current one is received, so that
+        applying a page overlaps with fetching the next one.
+
+        :param segment_name: Name of the segment to update.
+        :type segment_name: str
+        :param till: ChangeNumber received.
+        :type till: int
+
+        :return: True if any changes were fetched. False otherwise.
+        :rtype: bool
+        """
+        change_number = self._segment_storage.get_change_number(segment_name)
+        if change_number is None:
+            change_number = -1
+        if change_number == -1 and self._changes_cache is not None:
+            change_number = self._load_cached_segment(segment_name)
+        if till is not None and till < change_number:
+            # the passed till is less than change_number, no need to perform updates
+            return False
+
+        segment_changes = self._wait_for_fetch(
+            segment_name, lambda: self._api.fetch_segment(segment_name, change_number)
+        )
         while True:
-            change_number = self._segment_storage.get_change_number(segment_name)
-            if change_number is None:
-                change_number = -1
-            if till is not None and till < change_number:
-                # the passed till is less than change_number, no need to perform updates
-                return
-
-            try:
-                segment_changes = self._api.fetch_segment(segment_name, change_number)
-            except APIException as exc:
-                _LOGGER.error('Exception raised while fetching segment %s', segment_name)
-                _LOGGER.debug('Exception information: ', exc_info=True)
-                raise exc
+            new_change_number = segment_changes['till']
+            done = new_change_number == segment_changes['since'] or \
+                (till is not None and till < new_change_number)
+            next_fetch = None if done else \
+                _SegmentFetch(self._api.fetch_segment, segment_name, new_change_number)
 
             if change_number == -1:  # first time fetching the segment
                 new_segment = segments.from_raw(segment_changes)
@@ -79,11 +159,122 @@ class SegmentSynchronizer(object):
                     segment_name,
                     segment_changes['added'],
                     segment_changes['removed'],
-                    segment_changes['till']
+                    new_change_number
                 )
 
-            if segment_changes['till'] == segment_changes['since']:
-                return
+            if new_change_number == segment_changes['since']:
+                return True
+
+            if self._changes_cache is not None:
+                self._changes_cache.save_segment_changes(segment_name,
+                                                         segment_changes['added'],
+                                                         segment_changes['removed'],
+                                                         segment_changes['since'],
+                                                         new_change_number)
+            if next_fetch is None:
+                return True
+
+            change_number = new_change_number
+            segment_changes = self._wait_for_fetch(segment_name, next_fetch.result)
+
+    @staticmethod
+    def _wait_for_fetch(segment_name, fetch):
+        """
+        Get the result of a segment changes request, logging API errors.
+
+        :param segment_name: Name of the segment.
+        :type segment_name: str
+        :param fetch: Function returning the response.
+        :type fetch: callable
+
+        :return: Json representation of a segmentChange response.
+        :rtype: dict
+        """
+        try:
+            return fetch()
+        except APIException as exc:
+            _LOGGER.error('Exception raised while fetching segment %s', segment_name)
+            _LOGGER.debug('Exception information: ', exc_info=True)
+            raise exc
+
+    def _record_duration(self, segment_name, duration):
+        """
+        Keep the time it took to synchronize a segment.
+
+        :param segment_name: Name of the segment.
+        :type segment_name: str
+        :param duration: Seconds elapsed.
+        :type duration: float
+        """
+        _LOGGER.debug('Segment %s synchronized in %.3f seconds', segment_name, duration)
+        with self._durations_lock:
+            self._durations[segment_name] = duration
+            if self._average_duration is None:
+                self._average_duration = duration
+            else:
+                self._average_duration += _DURATION_WEIGHT * (duration - self._average_duration)
+
+    def get_segment_sync_durations(self):
+        """
+        Return how long the last synchronization of each segment took.
+
+        :return: Seconds elapsed, by segment name.
+        :rtype: dict(str, float)
+        """
+        with self._durations_lock:
+            return dict(self._durations)
+
+    def _pool_size(self, segment_count):
+        """
+        Return the number of workers needed to synchronize all segments in about a second.
+
+        Until some segment has been synchronized, one worker per segment is used.
+
+        :param segment_count: Number of segments to synchronize.
+        :type segment_count: int
+
+        :rtype: int
+        """
+        with self._durations_lock:
+            average_duration = self._average_duration
+        if average_duration is None:
+            wanted = segment_count
+        else:
+            wanted = int(math.ceil(segment_count * average_duration / _TARGET_SYNC_SECONDS))
+        return min(max(wanted, _MIN_WORKERS), _MAX_WORKERS)
+
+    def _load_cached_segment(self, segment_name):
+        """
+        Fill the storage with a segment cached on disk, if any.
+
+        :param segment_name: Name of the segment.
+        :type segment_name: str
+
+        :return: Change number to resume from.
+        :rtype: int
+        """
+        cached = self._changes_cache.load_segment(segment_name)
+        if cached is None:
+            return -1
+        keys, till = cached
+        self._segment_storage.put(segments.Segment(segment_name, keys, till))
+        return till
+
+    def load_cached(self):
+        """
+        Fill the storage with the cached segments used by the splits in storage.
+
+        :return: True if all of those segments are now in storage. False otherwise.
+        :rtype: bool
+        """
+        if self._changes_cache is None:
+            return False
+        loaded = True
+        for segment_name in self._split_storage.get_segment_names():
+            change_number = self._segment_storage.get_change_number(segment_name)
+            if change_number is None or change_number == -1:
+                loaded = self._load_cached_segment(segment_name) != -1 and loaded
+        return loaded
 
     def synchronize_segments(self):
         """
@@ -93,6 +284,7 @@ class SegmentSynchronizer(object):
         :rtype: bool
         """
         segment_names = self._split_storage.get_segment_names()
+        self._worker_pool.resize(self._pool_size(len(segment_names)))
         for segment_name in segment_names:
             self._worker_pool.submit_work(segment_name)
         return not self._worker_pool.wait_for_completion()
@@ -20,7 +20,7 @@ _LOGGER = logging.getLogger(__name__)
 class SplitSynchronizer(object):
     """Split changes synchronizer."""
 
-    def __init__(self, split_api, split_storage):
+    def __init__(self, split_api, split_storage, changes_cache=None):
         """
         Class constructor.
 
@@ -29,9 +29,40 @@ class SplitSynchronizer(object):
 
         :param split_storage: Split Storage.
         :type split_storage: splitio.storage.InMemorySplitStorage
+
+        :param changes_cache: Optional on-disk cache to resume from and keep up to date.
+        :type changes_cache: splitio.storage.disk.DiskChangesCache
         """
         self._api = split_api
         self._split_storage = split_storage
+        self._changes_cache = changes_cache
+
+    def _load_cached_splits(self):
+        """
+        Fill the storage with the splits cached on disk, if any.
+
+        :return: Change number to resume from.
+        :rtype: int
+        """
+        cached = self._changes_cache.load_splits()
+        if cached is None:
+            return -1
+        raw_splits, till = cached
+        self._split_storage.update([splits.from_raw(raw) for raw in raw_splits], [], till)
+        _LOGGER.debug('Loaded %d cached splits up to change number %d', len(raw_splits), till)
+        return till
+
+    def load_cached(self):
+        """
+        Fill the storage with the splits cached on disk, if it holds none yet.
+
+        :return: True if cached splits were loaded. False otherwise.
+        :rtype: bool
+        """
+        if self._changes_cache is None \
+           or self._split_storage.get_change_number() not in (None, -1):
+            return False
+        return self._load_cached_splits() != -1
 
     def synchronize_splits(self, till=None):
         """
@@ -44,6 +75,8 @@ class SplitSynchronizer(object):
             change_number = self._split_storage.get_change_number()
             if change_number is None:
                 change_number = -1
+            if change_number == -1 and self._changes_cache is not None:
+                change_number = self._load_cached_splits()
             if till is not None and till < change_number:
                 # the passed till is less than change_number, no need to perform updates
                 return
@@ -55,13 +88,20 @@ class SplitSynchronizer(object):
                 _LOGGER.debug('Exception information: ', exc_info=True)
                 raise exc
 
+            to_add = []
+            to_delete = []
             for split in split_changes.get('splits', []):
                 if split['status'] == splits.Status.ACTIVE.value:
-                    self._split_storage.put(splits.from_raw(split))
+                    to_add.append(splits.from_raw(split))
                 else:
-                    self._split_storage.remove(split['name'])
-
-            self._split_storage.set_change_number(split_changes['till'])
+                    to_delete.append(split['name'])
+
+            self._split_storage.update(to_add, to_delete, split_changes['till'])
+            if self._changes_cache is not None \
+               and split_changes['till'] != split_changes['since']:
+                self._changes_cache.save_split_changes(split_changes.get('splits', []),
+                                                       split_changes['since'],
+                                                       split_changes['till'])
             if split_changes['till'] == split_changes['since'] \
                and (till is None or split_changes['till'] >= till):
                 return
@@ -248,8 +288,4 @@ class LocalSplitSynchronizer(object):
             fetched = self._read_splits_from_legacy_file(self._filename)
         to_delete = [name for name in self._split_storage.get_split_names()
                      if name not in fetched.keys()]
-        for split in fetched.values():
-            self._split_storage.put(split)
-
-        for split in to_delete:
-            self._split_storage.remove(split)
+        self._split_storage.update(list(fetched.values()), to_delete, None)
@@ -156,6 +156,16 @@ class BaseSynchronizer(object):
         """
         pass
 
+    @abc.abstractmethod
+    def load_cached(self):
+        """
+        Load split data cached locally.
+
+        :return: Whether the cached data is complete enough to serve evaluations.
+        :rtype: bool
+        """
+        pass
+
     @abc.abstractmethod
     def sync_all(self):
         """Synchronize all split data."""
@@ -259,6 +269,21 @@ class Synchronizer(BaseSynchronizer):
             _LOGGER.debug('Error: ', exc_info=True)
             return False
 
+    def load_cached(self):
+        """
+        Load splits and segments cached on disk.
+
+        :return: True if the splits and all their segments were cached. False otherwise.
+        :rtype: bool
+        """
+        try:
+            return self._split_synchronizers.split_sync.load_cached() \
+                and self._split_synchronizers.segment_sync.load_cached()
+        except Exception:  # pylint:disable=broad-except
+            _LOGGER.error('Exception caught when loading cached data')
+            _LOGGER.debug('Error: ', exc_info=True)
+            return False
+
     def sync_all(self):
         """Synchronize all split data."""
         attempts = 3
@@ -367,6 +392,15 @@ class LocalhostSynchronizer(BaseSynchronizer):
         self._split_synchronizers = split_synchronizers
         self._split_tasks = split_tasks
 
+    def load_cached(self):
+        """
+        Load split data cached locally.
+
+        :return: False, splits are always read from the split file.
+        :rtype: bool
+        """
+        return False
+
     def sync_all(self):
         """Synchronize all split data."""
         try:
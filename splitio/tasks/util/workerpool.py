@@ -1,13 +1,17 @@
 """Worker pool module."""
 
 import logging
-from threading import Thread, Event
+from threading import Thread, Event, Lock
 from six.moves import queue
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Message telling the worker that fetches it to exit.
+_STOP = object()
+
+
 class WorkerPool(object):
     """Worker pool class to implement single producer/multiple consumer."""
 
@@ -20,19 +24,64 @@ class WorkerPool(object):
         """
         self._failed = False
         self._incoming = queue.Queue()
-        self._should_be_working = [True for _ in range(0, worker_count)]
-        self._worker_events = [Event() for _ in range(0, worker_count)]
-        self._threads = [
-            Thread(target=self._wrapper, args=(i, worker_func), name="pool_worker_%d" % i)
-            for i in range(0, worker_count)
-        ]
-        for thread in self._threads:
+        self._worker_func = worker_func
+        self._lock = Lock()
+        self._started = False
+        self._worker_count = 0
+        self._workers = []
+        self._add_workers(worker_count)
+
+    @property
+    def worker_count(self):
+        """Return the number of workers the pool is sized for."""
+        return self._worker_count
+
+    def _add_workers(self, count):
+        """
+        Create new workers, starting them if the pool is already running.
+
+        :param count: Number of workers to add.
+        :type count: int
+        """
+        for _ in range(0, count):
+            event = Event()
+            thread = Thread(target=self._wrapper, args=(event, self._worker_func),
+                            name="pool_worker_%d" % len(self._workers))
             thread.setDaemon(True)
+            self._workers.append((thread, event))
+            if self._started:
+                thread.start()
+        self._worker_count += count
 
     def start(self):
         """Start the workers."""
-        for thread in self._threads:
-            thread.start()
+        with self._lock:
+            self._started = True
+            for thread, _ in self._workers:
+                thread.start()
+
+    def resize(self, worker_count):
+        """
+        Grow or shrink the pool.
+
+        New workers start right away, while extra ones exit as soon as they finish the
+        messages queued before the resize.
+
+        :param worker_count: Number of workers for the pool.
+        :type worker_count: int
+        """
+        worker_count = max(worker_count, 1)
+        with self._lock:
+            self._workers = [worker for worker in self._workers if not worker[1].is_set()]
+            if worker_count > self._worker_count:
+                self._add_workers(worker_count - self._worker_count)
+            elif worker_count < self._worker_count:
+                if self._started:
+                    for _ in range(worker_count, self._worker_count):
+                        self._incoming.put(_STOP)
+                else:
+                    del self._workers[worker_count:]
+                self._worker_count = worker_count
 
     @staticmethod
     def _safe_run(func, message):
@@ -55,45 +104,46 @@ class WorkerPool(object):
             _LOGGER.debug('Original traceback: ', exc_info=True)
             return False
 
-    def _wrapper(self, worker_number, func):
+    def _wrapper(self, finished_event, func):
         """
         Fetch message, execute tasks, and acknowledge results.
 
-        :param worker_number: # (id) of worker whose function will be executed.
-        :type worker_number: int
+        Idle workers block on the queue until a message arrives or they're told to stop.
+
+        :param finished_event: Event to set when the worker exits.
+        :type finished_event: threading.Event
         :param func: User defined function.
         :type func: callable.
         """
-        while self._should_be_working[worker_number]:
-            try:
-                message = self._incoming.get(True, 0.5)
-
-                # For some reason message can be None in python2 implementation of queue.
-                # This method must be both ignored and acknowledged with .task_done()
-                # otherwise .join() will halt.
-                if message is None:
-                    _LOGGER.debug('spurious message received. acking and ignoring.')
-                    self._incoming.task_done()
-                    continue
-
-                # If the task is successfully executed, the ack is done AFTERWARDS,
-                # to avoid race conditions on SDK initialization.
-                _LOGGER.debug("processing message '%s'", message)
-                ok = self._safe_run(func, message)  # pylint: disable=invalid-name
-                if not ok:
-                    self._failed = True
-                    _LOGGER.error(
-                        ("Something went wrong during the execution, "
-                         "removing message \"%s\" from queue."),
-                        message
-                    )
+        while True:
+            message = self._incoming.get()
+            if message is _STOP:
+                self._incoming.task_done()
+                break
+
+            # For some reason message can be None in python2 implementation of queue.
+            # This method must be both ignored and acknowledged with .task_done()
+            # otherwise .join() will halt.
+            if message is None:
+                _LOGGER.debug('spurious message received. acking and ignoring.')
                 self._incoming.task_done()
-            except queue.Empty:
-                # No message was fetched, just keep waiting.
-                pass
+                continue
+
+            # If the task is successfully executed, the ack is done AFTERWARDS,
+            # to avoid race conditions on SDK initialization.
+            _LOGGER.debug("processing message '%s'", message)
+            ok = self._safe_run(func, message)  # pylint: disable=invalid-name
+            if not ok:
+                self._failed = True
+                _LOGGER.error(
+                    ("Something went wrong during the execution, "
+                     "removing message \"%s\" from queue."),
+                    message
+                )
+            self._incoming.task_done()
 
         # Set my flag indicating that i have finished
-        self._worker_events[worker_number].set()
+        finished_event.set()
 
     def submit_work(self, message):
         """
@@ -128,10 +178,13 @@ class WorkerPool(object):
         :type event: threading.Event
         """
         self.wait_for_completion()
-        for index, _ in enumerate(self._should_be_working):
-            self._should_be_working[index] = False
+        with self._lock:
+            for _ in range(0, self._worker_count):
+                self._incoming.put(_STOP)
+            self._worker_count = 0
+            workers = list(self._workers)
 
         if event is not None:
-            for worker_event in self._worker_events:
+            for _, worker_event in workers:
                 worker_event.wait()
             event.set()
@@ -0,0 +1,217 @@
+"""Bloom filters used to skip remote segment lookups for keys that are surely not members."""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import logging
+import math
+import threading
+import time
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_ERROR_RATE = 0.01
+DEFAULT_REFRESH_SECONDS = 5
+
+_MASK32 = 0xFFFFFFFF
+_MIN_SIZE = 64
+
+
+class BloomFilter(object):
+    """
+    Fixed size Bloom filter.
+
+    Bit positions are derived from the two 32 bit halves of the builtin `hash`, so a filter is
+    only meaningful within the process that built it.
+    """
+
+    def __init__(self, capacity, error_rate=DEFAULT_ERROR_RATE):
+        """
+        Class constructor.
+
+        :param capacity: Expected number of items.
+        :type capacity: int
+        :param error_rate: Expected false positive rate when holding `capacity` items.
+        :type error_rate: float
+        """
+        capacity = max(capacity, 1)
+        optimal_size = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._hash_count = max(int(round(optimal_size / capacity * math.log(2))), 1)
+        # A power of two keeps the (odd) probing step coprime with the size, so that probes
+        # never repeat, and the minimum keeps tiny filters close to the expected error rate.
+        self._size = 1 << (max(optimal_size, _MIN_SIZE) - 1).bit_length()
+        self._bits = bytearray(self._size // 8)
+
+    def _positions(self, item):
+        """
+        Return the bit positions for an item.
+
+        :param item: Item to hash.
+        :type item: str
+
+        :rtype: generator(int)
+        """
+        hashed = hash(item)
+        first = hashed & _MASK32
+        second = (hashed >> 32) & _MASK32 | 1
+        mask = self._size - 1
+        return ((first + index * second) & mask for index in range(self._hash_count))
+
+    def add(self, item):
+        """
+        Add an item to the filter.
+
+        :param item: Item to add.
+        :type item: str
+        """
+        bits = self._bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, item):
+        """
+        Return whether an item may have been added to the filter.
+
+        :param item: Item to look for.
+        :type item: str
+
+        :return: False if the item was surely not added. True otherwise.
+        :rtype: bool
+        """
+        bits = self._bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+def build_filter(items, error_rate=DEFAULT_ERROR_RATE):
+    """
+    Build a Bloom filter holding the supplied items.
+
+    :param items: Items to add.
+    :type items: collection
+    :param error_rate: Expected false positive rate.
+    :type error_rate: float
+
+    :rtype: BloomFilter
+    """
+    bloom = BloomFilter(len(items), error_rate)
+    for item in items:
+        bloom.add(item)
+    return bloom
+
+
+class SegmentFilters(object):
+    """
+    Bloom filters of segments held by a remote or shared storage.
+
+    Filters are built in a background thread, and lookups answer that the key might be a member
+    until the filter of its segment exists, so that callers query the storage. Each filter keeps
+    the change number it was built from and when that change number was last verified against
+    the storage. Negative answers are given without touching the storage while the verification
+    is younger than `refresh_seconds`, so keys added to a segment can be hidden for at most that
+    long. Once it's older, lookups fall through to the storage while the change number is checked
+    again in the background, and the filter is rebuilt if the segment moved.
+    """
+
+    def __init__(self, fetch_change_number, fetch_members, refresh_seconds=DEFAULT_REFRESH_SECONDS,
+                 error_rate=DEFAULT_ERROR_RATE):
+        """
+        Class constructor.
+
+        :param fetch_change_number: Function returning the change number of a segment.
+        :type fetch_change_number: callable
+        :param fetch_members: Function returning all the members of a segment, or None.
+        :type fetch_members: callable
+        :param refresh_seconds: Seconds between checks of a segment's change number.
+        :type refresh_seconds: int
+        :param error_rate: Expected false positive rate of each filter.
+        :type error_rate: float
+        """
+        self._fetch_change_number = fetch_change_number
+        self._fetch_members = fetch_members
+        self._refresh_seconds = refresh_seconds
+        self._error_rate = error_rate
+        self._filters = {}
+        self._last_attempts = {}
+        self._building = set()
+        self._lock = threading.Lock()
+
+    def might_contain(self, segment_name, key):
+        """
+        Return whether a key might belong to a segment.
+
+        :param segment_name: Name of the segment.
+        :type segment_name: str
+        :param key: Key to look for.
+        :type key: str
+
+        :return: False if the key is surely not a member. True otherwise.
+        :rtype: bool
+        """
+        entry = self._filters.get(segment_name)
+        if entry is None:
+            self._schedule_build(segment_name)
+            return True
+
+        bloom, _, verified_at = entry
+        if bloom.might_contain(key):
+            return True
+
+        if time.time() - verified_at >= self._refresh_seconds:
+            self._schedule_build(segment_name)
+            return True
+        return False
+
+    def _schedule_build(self, segment_name):
+        """
+        Start refreshing the filter of a segment, unless it is in progress or was tried recently.
+
+        :param segment_name: Name of the segment.
+        :type segment_name: str
+        """
+        with self._lock:
+            if segment_name in self._building:
+                return
+            last_attempt = self._last_attempts.get(segment_name)
+            if last_attempt is not None and time.time() - last_attempt < self._refresh_seconds:
+                return
+            self._building.add(segment_name)
+
+        worker = threading.Thread(target=self._build, args=(segment_name,),
+                                  name='SegmentFilter::%s' % segment_name)
+        worker.daemon = True
+        worker.start()
+
+    def _build(self, segment_name):
+        """
+        Verify the filter of a segment is up to date, and build it again if it's not.
+
+        :param segment_name: Name of the segment.
+        :type segment_name: str
+        """
+        try:
+            # The change number is read before the members. Since writers store members first, a
+            # segment updated in between is tagged with the old change number and rebuilt later.
+            verified_at = time.time()
+            change_number = self._fetch_change_number(segment_name)
+            entry = self._filters.get(segment_name)
+            if entry is not None and change_number is not None and entry[1] == change_number:
+                self._filters[segment_name] = (entry[0], change_number, verified_at)
+                return
+
+            members = self._fetch_members(segment_name) if change_number is not None else None
+            if members is not None:
+                self._filters[segment_name] = (
+                    build_filter(members, self._error_rate),
+                    change_number,
+                    verified_at
+                )
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.error('Error building bloom filter for segment %s', segment_name)
+            _LOGGER.debug('Error: ', exc_info=True)
+        finally:
+            with self._lock:
+                self._last_attempts[segment_name] = time.time()
+                self._building.discard(segment_name)
@@ -1,4 +1,8 @@
 """HTTPClient test module."""
+#pylint: disable=protected-access
+import gzip
+import io
+import json
 
 from splitio.api import client
 
@@ -12,7 +16,7 @@ class HttpClientTests(object):
         response_mock.text = 'ok'
         get_mock = mocker.Mock()
         get_mock.return_value = response_mock
-        mocker.patch('splitio.api.client.requests.get', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.get', new=get_mock)
         httpclient = client.HttpClient()
         response = httpclient.get('sdk', '/test1', 'some_api_key', {'param1': 123}, {'h1': 'abc'})
         call = mocker.call(
@@ -44,7 +48,7 @@ class HttpClientTests(object):
         response_mock.text = 'ok'
         get_mock = mocker.Mock()
         get_mock.return_value = response_mock
-        mocker.patch('splitio.api.client.requests.get', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.get', new=get_mock)
         httpclient = client.HttpClient(sdk_url='https://sdk.com', events_url='https://events.com')
         response = httpclient.get('sdk', '/test1', 'some_api_key', {'param1': 123}, {'h1': 'abc'})
         call = mocker.call(
@@ -77,7 +81,7 @@ class HttpClientTests(object):
         response_mock.text = 'ok'
         get_mock = mocker.Mock()
         get_mock.return_value = response_mock
-        mocker.patch('splitio.api.client.requests.post', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.post', new=get_mock)
         httpclient = client.HttpClient()
         response = httpclient.post('sdk', '/test1', 'some_api_key', {'p1': 'a'}, {'param1': 123}, {'h1': 'abc'})
         call = mocker.call(
@@ -111,7 +115,7 @@ class HttpClientTests(object):
         response_mock.text = 'ok'
         get_mock = mocker.Mock()
         get_mock.return_value = response_mock
-        mocker.patch('splitio.api.client.requests.post', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.post', new=get_mock)
         httpclient = client.HttpClient(sdk_url='https://sdk.com', events_url='https://events.com')
         response = httpclient.post('sdk', '/test1', 'some_api_key', {'p1': 'a'}, {'param1': 123}, {'h1': 'abc'})
         call = mocker.call(
@@ -137,3 +141,45 @@ class HttpClientTests(object):
         assert response.status_code == 200
         assert response.body == 'ok'
         assert get_mock.mock_calls == [call]
+
+    def test_post_compressed(self, mocker):
+        """Test that bodies are gzipped only when allowed and enabled."""
+        response_mock = mocker.Mock()
+        response_mock.status_code = 200
+        response_mock.text = 'ok'
+        post_mock = mocker.Mock()
+        post_mock.return_value = response_mock
+        mocker.patch('splitio.api.client.requests.Session.post', new=post_mock)
+
+        httpclient = client.HttpClient(compression_enabled=True)
+        response = httpclient.post('events', '/test1', 'some_api_key', {'p1': 'a'}, compress=True)
+        assert response.status_code == 200
+        kwargs = post_mock.mock_calls[0][2]
+        assert kwargs['headers']['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.GzipFile(fileobj=io.BytesIO(kwargs['data'])).read().decode('utf-8')) \
+            == {'p1': 'a'}
+        post_mock.reset_mock()
+
+        httpclient.post('events', '/test1', 'some_api_key', {'p1': 'a'})
+        assert post_mock.mock_calls[0][2]['json'] == {'p1': 'a'}
+        assert 'Content-Encoding' not in post_mock.mock_calls[0][2]['headers']
+        post_mock.reset_mock()
+
+        httpclient = client.HttpClient()
+        httpclient.post('events', '/test1', 'some_api_key', {'p1': 'a'}, compress=True)
+        assert post_mock.mock_calls[0][2]['json'] == {'p1': 'a'}
+
+    def test_session(self, mocker):
+        """Test that a single session with the configured pool size is used per process."""
+        httpclient = client.HttpClient(pool_size=25)
+        session = httpclient._get_session()
+        assert httpclient._get_session() is session
+        adapter = session.get_adapter(client.HttpClient.SDK_URL)
+        assert adapter._pool_maxsize == 25
+        assert session.get_adapter('http://localhost') is not adapter
+        assert session.get_adapter('http://localhost')._pool_maxsize == 25
+
+        mocker.patch('splitio.api.client.os.getpid', new=lambda: -1)  # forked
+        forked_session = httpclient._get_session()
+        assert forked_session is not session
+        assert httpclient._get_session() is forked_session
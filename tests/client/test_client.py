@@ -5,7 +5,7 @@ import json
 import os
 from splitio.client.client import Client, _LOGGER as _logger, CONTROL
 from splitio.client.factory import SplitFactory
-from splitio.engine.evaluator import Evaluator
+from splitio.engine.evaluator import Evaluator, EvaluationResult
 from splitio.models.impressions import Impression, Label
 from splitio.models.events import Event, EventWrapper
 from splitio.storage import EventStorage, ImpressionStorage, SegmentStorage, SplitStorage, \
@@ -55,14 +55,7 @@ class ClientTests(object):  # pylint: disable=too-few-public-methods
                                     impression_storage)
         client = Client(factory, recorder, True)
         client._evaluator = mocker.Mock(spec=Evaluator)
-        client._evaluator.evaluate_feature.return_value = {
-            'treatment': 'on',
-            'configurations': None,
-            'impression': {
-                'label': 'some_label',
-                'change_number': 123
-            },
-        }
+        client._evaluator.evaluate_feature.return_value = EvaluationResult('on', 'some_label', 123)
         _logger = mocker.Mock()
 
         assert client.get_treatment('some_key', 'some_feature') == 'on'
@@ -84,7 +77,7 @@ class ClientTests(object):  # pylint: disable=too-few-public-methods
 
         # Test with exception:
         ready_property.return_value = True
-        split_storage.get_change_number.return_value = -1
+        split_storage.get.return_value.change_number = -1
 
         def _raise(*_):
             raise Exception('something')
@@ -128,14 +121,10 @@ class ClientTests(object):  # pylint: disable=too-few-public-methods
                                     impression_storage)
         client = Client(factory, recorder, True)
         client._evaluator = mocker.Mock(spec=Evaluator)
-        client._evaluator.evaluate_feature.return_value = {
-            'treatment': 'on',
-            'configurations': '{"some_config": True}',
-            'impression': {
-                'label': 'some_label',
-                'change_number': 123
-            }
-        }
+        split = mocker.Mock()
+        split.get_configurations_for.return_value = '{"some_config": True}'
+        client._evaluator.evaluate_feature.return_value = EvaluationResult('on', 'some_label', 123,
+                                                                           split)
         _logger = mocker.Mock()
         client._send_impression_to_listener = mocker.Mock()
 
@@ -162,7 +151,7 @@ class ClientTests(object):  # pylint: disable=too-few-public-methods
 
         # Test with exception:
         ready_property.return_value = True
-        split_storage.get_change_number.return_value = -1
+        split_storage.get.return_value.change_number = -1
 
         def _raise(*_):
             raise Exception('something')
@@ -206,14 +195,9 @@ class ClientTests(object):  # pylint: disable=too-few-public-methods
                                     impression_storage)
         client = Client(factory, recorder, True)
         client._evaluator = mocker.Mock(spec=Evaluator)
-        evaluation = {
-            'treatment': 'on',
-            'configurations': '{"color": "red"}',
-            'impression': {
-                'label': 'some_label',
-                'change_number': 123
-            }
-        }
+        split = mocker.Mock()
+        split.get_configurations_for.return_value = '{"color": "red"}'
+        evaluation = EvaluationResult('on', 'some_label', 123, split)
         client._evaluator.evaluate_features.return_value = {
             'f1': evaluation,
             'f2': evaluation
@@ -281,14 +265,9 @@ class ClientTests(object):  # pylint: disable=too-few-public-methods
                                     impression_storage)
         client = Client(factory, recorder, True)
         client._evaluator = mocker.Mock(spec=Evaluator)
-        evaluation = {
-            'treatment': 'on',
-            'configurations': '{"color": "red"}',
-            'impression': {
-                'label': 'some_label',
-                'change_number': 123
-            }
-        }
+        split = mocker.Mock()
+        split.get_configurations_for.return_value = '{"color": "red"}'
+        evaluation = EvaluationResult('on', 'some_label', 123, split)
         client._evaluator.evaluate_features.return_value = {
             'f1': evaluation,
             'f2': evaluation
@@ -328,6 +307,146 @@ class ClientTests(object):  # pylint: disable=too-few-public-methods
         }
         assert len(telemetry_storage.inc_latency.mock_calls) == 2
 
+    def test_get_treatments_bulk(self, mocker):
+        """Test get_treatments_bulk execution paths."""
+        split_storage = mocker.Mock(spec=SplitStorage)
+        segment_storage = mocker.Mock(spec=SegmentStorage)
+        impression_storage = mocker.Mock(spec=ImpressionStorage)
+        event_storage = mocker.Mock(spec=EventStorage)
+        telemetry_storage = mocker.Mock(spec=TelemetryStorage)
+
+        def _get_storage_mock(name):
+            return {
+                'splits': split_storage,
+                'segments': segment_storage,
+                'impressions': impression_storage,
+                'events': event_storage,
+                'telemetry': telemetry_storage
+            }[name]
+
+        destroyed_property = mocker.PropertyMock()
+        destroyed_property.return_value = False
+
+        factory = mocker.Mock(spec=SplitFactory)
+        factory._get_storage.side_effect = _get_storage_mock
+        factory._waiting_fork.return_value = False
+        type(factory).destroyed = destroyed_property
+
+        mocker.patch('splitio.client.client.utctime_ms', new=lambda: 1000)
+        mocker.patch('splitio.client.client.get_latency_bucket_index', new=lambda x: 5)
+
+        impmanager = mocker.Mock(spec=ImpressionManager)
+        recorder = StandardRecorder(impmanager, telemetry_storage, event_storage,
+                                    impression_storage)
+        client = Client(factory, recorder, True)
+        client._evaluator = mocker.Mock(spec=Evaluator)
+        split = mocker.Mock()
+        split.get_configurations_for.return_value = '{"color": "red"}'
+        evaluation = EvaluationResult('on', 'some_label', 123, split)
+        client._evaluator.evaluate_features_bulk.return_value = [
+            {'f1': evaluation, 'f2': evaluation},
+            {'f1': evaluation, 'f2': evaluation},
+        ]
+        assert client.get_treatments_bulk(['key1', '', 'key2'], ['f1', 'f2'],
+                                          [None, None, {'a': 1}]) == [
+            {'f1': 'on', 'f2': 'on'},
+            {'f1': 'control', 'f2': 'control'},
+            {'f1': 'on', 'f2': 'on'},
+        ]
+        assert client._evaluator.evaluate_features_bulk.mock_calls == [
+            mocker.call(mocker.ANY, [('key1', None), ('key2', None)], [None, {'a': 1}], mocker.ANY)
+        ]
+        assert set(client._evaluator.evaluate_features_bulk.mock_calls[0][1][0]) == set(['f1', 'f2'])
+
+        assert len(impmanager.process_impressions.mock_calls) == 1
+        impressions_called = impmanager.process_impressions.mock_calls[0][1][0]
+        assert len(impressions_called) == 4
+        assert (Impression('key1', 'f1', 'on', 'some_label', 123, None, 1000), None) in impressions_called
+        assert (Impression('key2', 'f2', 'on', 'some_label', 123, None, 1000), {'a': 1}) in impressions_called
+        assert telemetry_storage.inc_latency.mock_calls == [mocker.call('sdk.getTreatments', 5)]
+
+        # Test with mismatching attributes
+        assert client.get_treatments_bulk(['key1', 'key2'], ['f1'], [None]) == [
+            {'f1': 'control'}, {'f1': 'control'}
+        ]
+
+        # Test with client not ready
+        ready_property = mocker.PropertyMock()
+        ready_property.return_value = False
+        type(factory).ready = ready_property
+        impmanager.process_impressions.reset_mock()
+        assert client.get_treatments_bulk(['k1', 'k2'], ['some_feature']) == [
+            {'some_feature': 'control'}, {'some_feature': 'control'}
+        ]
+        assert mocker.call([
+            (Impression('k1', 'some_feature', 'control', Label.NOT_READY, None, None, 1000), None),
+            (Impression('k2', 'some_feature', 'control', Label.NOT_READY, None, None, 1000), None)
+        ]) in impmanager.process_impressions.mock_calls
+
+        # Test with exception:
+        ready_property.return_value = True
+
+        def _raise(*_):
+            raise Exception('something')
+        client._evaluator.evaluate_features_bulk.side_effect = _raise
+        assert client.get_treatments_bulk(['key'], ['f1', 'f2']) == [{'f1': 'control', 'f2': 'control'}]
+
+    def test_single_fetch(self, mocker):
+        """Test that each evaluation fetches split definitions from storage only once."""
+        split_storage = InMemorySplitStorage()
+        split_storage.put(splits.from_raw({
+            'name': 'some_feature',
+            'seed': 123,
+            'killed': False,
+            'defaultTreatment': 'off',
+            'trafficTypeName': 'user',
+            'status': 'ACTIVE',
+            'changeNumber': 7,
+            'algo': 2,
+            'conditions': []
+        }))
+        get_spy = mocker.spy(split_storage, 'get')
+        fetch_many_spy = mocker.spy(split_storage, 'fetch_many')
+        telemetry_storage = mocker.Mock(spec=TelemetryStorage)
+
+        def _get_storage_mock(name):
+            return {
+                'splits': split_storage,
+                'segments': mocker.Mock(spec=SegmentStorage),
+                'events': mocker.Mock(spec=EventStorage),
+            }[name]
+
+        destroyed_property = mocker.PropertyMock()
+        destroyed_property.return_value = False
+        ready_property = mocker.PropertyMock()
+        ready_property.return_value = True
+        factory = mocker.Mock(spec=SplitFactory)
+        factory._get_storage.side_effect = _get_storage_mock
+        factory._waiting_fork.return_value = False
+        type(factory).destroyed = destroyed_property
+        type(factory).ready = ready_property
+
+        impmanager = mocker.Mock(spec=ImpressionManager)
+        recorder = StandardRecorder(impmanager, telemetry_storage, mocker.Mock(spec=EventStorage),
+                                    mocker.Mock(spec=ImpressionStorage))
+        client = Client(factory, recorder, True)
+
+        assert client.get_treatment('some_key', 'some_feature') == 'off'
+        assert get_spy.mock_calls == [mocker.call('some_feature')]
+        assert fetch_many_spy.mock_calls == []
+
+        get_spy.reset_mock()
+        assert client.get_treatments('some_key', ['some_feature', 'missing']) == \
+            {'some_feature': 'off', 'missing': CONTROL}
+        assert len(fetch_many_spy.mock_calls) == 1
+        assert get_spy.mock_calls == []
+
+        # The change number of the fetched split is used when evaluation fails.
+        mocker.patch.object(client._evaluator, 'evaluate_feature', side_effect=Exception('x'))
+        impmanager.process_impressions.reset_mock()
+        assert client.get_treatment('some_key', 'some_feature') == CONTROL
+        assert impmanager.process_impressions.mock_calls[0][1][0][0][0].change_number == 7
+
     def test_destroy(self, mocker):
         """Test that destroy/destroyed calls are forwarded to the factory."""
         split_storage = mocker.Mock(spec=SplitStorage)
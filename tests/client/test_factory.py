@@ -21,7 +21,8 @@ from splitio.sync.manager import Manager
 from splitio.sync.synchronizer import Synchronizer, SplitSynchronizers, SplitTasks
 from splitio.sync.split import SplitSynchronizer
 from splitio.sync.segment import SegmentSynchronizer
-from splitio.recorder.recorder import PipelinedRecorder, StandardRecorder
+from splitio.recorder.recorder import PipelinedRecorder, StandardRecorder, AsyncRecorder
+from splitio.client.config import DropPolicy
 from splitio.storage.adapters.redis import RedisAdapter, RedisPipelineAdapter
 
 
@@ -63,6 +64,24 @@ class SplitFactoryTests(object):
         assert factory.ready
         factory.destroy()
 
+    def test_inmemory_client_async_recorder(self, mocker):
+        """Test that the async recorder is used when enabled."""
+        def _split_synchronizer(self, ready_flag, synchronizer, auth_api, streaming_enabled, sse_url=None):
+            self._ready_flag = ready_flag
+            self._synchronizer = mocker.Mock(spec=Synchronizer)
+            self._streaming_enabled = False
+        mocker.patch('splitio.sync.manager.Manager.__init__', new=_split_synchronizer)
+
+        factory = get_factory('some_api_key', config={'impressionsRecordingAsync': True,
+                                                      'impressionsRecordingDropPolicy': 'block'})
+        assert isinstance(factory._recorder, AsyncRecorder)
+        assert factory._recorder._drop_policy == DropPolicy.BLOCK
+        assert factory._recorder._impression_storage is factory._storages['impressions']
+        flush_mock = mocker.Mock()
+        factory._recorder.flush = flush_mock
+        factory.destroy()
+        assert flush_mock.mock_calls == [mocker.call()]
+
     def test_redis_client_creation(self, mocker):
         """Test that a client with redis storage is created correctly."""
         strict_redis_mock = mocker.Mock()
@@ -374,7 +393,7 @@ class SplitFactoryTests(object):
 
     def test_destroy_with_event_redis(self, mocker):
         def _make_factory_with_apikey(apikey, *_, **__):
-            return SplitFactory(apikey, {}, True, mocker.Mock(spec=ImpressionsManager), None)
+            return SplitFactory(apikey, {}, True, mocker.Mock(spec=PipelinedRecorder), None)
 
         factory_module_logger = mocker.Mock()
         build_redis = mocker.Mock()
@@ -422,7 +441,7 @@ class SplitFactoryTests(object):
         mockManager = Manager(sdk_ready_flag, mocker.Mock(), mocker.Mock(), False)
 
         def _make_factory_with_apikey(apikey, *_, **__):
-            return SplitFactory(apikey, {}, True, mocker.Mock(spec=ImpressionsManager), mockManager)
+            return SplitFactory(apikey, {}, True, mocker.Mock(spec=StandardRecorder), mockManager)
 
         factory_module_logger = mocker.Mock()
         build_in_memory = mocker.Mock()
@@ -1033,6 +1033,64 @@ class ClientInputValidationTests(object):
 
 
 
+class FastPathValidationTests(object):
+    """Fast validation paths test cases."""
+
+    def test_plain_string_keys(self, mocker):
+        """Test that well-formed string keys skip the regular checks."""
+        _logger = mocker.Mock()
+        mocker.patch('splitio.client.input_validator._LOGGER', new=_logger)
+        convert_spy = mocker.spy(input_validator, '_check_can_convert')
+        assert input_validator.validate_key('some_key', 'get_treatment') == ('some_key', None)
+        assert input_validator.validate_key(Key('matching', 'bucketing'), 'get_treatment') == \
+            ('matching', 'bucketing')
+        assert convert_spy.mock_calls == []
+
+        for key in ['', '   ', 'a' * 251]:
+            assert input_validator.validate_key(key, 'get_treatment') == (None, None)
+        assert len(_logger.error.mock_calls) == 3
+        assert input_validator.validate_key(12, 'get_treatment') == ('12', None)
+        assert len(convert_spy.mock_calls) == 4
+
+    def test_clean_feature_names_cached(self, mocker):
+        """Test that clean feature names are validated once, while bad ones keep logging."""
+        _logger = mocker.Mock()
+        mocker.patch('splitio.client.input_validator._LOGGER', new=_logger)
+        mocker.patch('splitio.client.input_validator._CLEAN_FEATURE_NAMES', new=set())
+        check_spy = mocker.spy(input_validator, '_is_valid_feature_name')
+        storage = mocker.Mock(spec=SplitStorage)
+
+        for _ in range(0, 3):
+            assert input_validator.validate_feature_name_and_fetch(
+                'some_feature', True, storage, 'get_treatment') == \
+                ('some_feature', storage.get.return_value)
+            assert input_validator.validate_feature_name_and_fetch(
+                ' other ', False, storage, 'get_treatment') == ('other', None)
+        assert len(check_spy.mock_calls) == 4
+        assert storage.get.mock_calls == [mocker.call('some_feature')] * 3
+        assert _logger.warning.mock_calls == [
+            mocker.call("%s: feature_name '%s' has extra whitespace, trimming.",
+                        'get_treatment', ' other ')
+        ] * 3
+
+        # Existence is checked with the name as passed, the split is fetched again once trimmed.
+        storage.reset_mock()
+        assert input_validator.validate_feature_name_and_fetch(
+            ' other ', True, storage, 'get_treatment') == ('other', None)
+        assert storage.get.mock_calls == [mocker.call(' other ')]
+        _logger.reset_mock()
+        check_spy.reset_mock()
+
+        assert input_validator.validate_features_and_fetch(
+            'get_treatments', ['some_feature', ' other ', None], False) == \
+            (set(['some_feature', 'other']), [], None)
+        assert len(_logger.warning.mock_calls) == 1
+
+        mocker.patch('splitio.client.input_validator._MAX_CACHED_FEATURE_NAMES', new=1)
+        input_validator.validate_feature_name('another', False, storage, 'get_treatment')
+        assert input_validator._CLEAN_FEATURE_NAMES == set(['another'])
+
+
 class ManagerInputValidationTests(object):  #pylint: disable=too-few-public-methods
     """Manager input validation test cases."""
 
@@ -1,6 +1,7 @@
 """LRU Cache unit tests."""
+#pylint: disable=protected-access
 
-from splitio.engine.cache.lru import SimpleLruCache
+from splitio.engine.cache.lru import SimpleLruCache, ShardedLruCache
 
 class SimpleLruCacheTests(object):
     """Test SimpleLruCache."""
@@ -36,3 +37,61 @@ class SimpleLruCacheTests(object):
         assert cache.test_and_set('j', 0) is None
         assert len(cache._data) is 5
         assert set(cache._data.keys()) == set(['f', 'g', 'h', 'i', 'j'])
+
+
+class ShardedLruCacheTests(object):
+    """Test ShardedLruCache."""
+
+    def test_basic_usage(self):
+        """Test that previous values are returned and updated."""
+        cache = ShardedLruCache(5)
+        for key in range(1, 6):
+            assert cache.test_and_set(key, key) is None
+        for key in range(1, 6):
+            assert cache.test_and_set(key, key * 10) == key
+        assert cache.test_and_set(1, 100) == 1
+        assert len(cache) == 5
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = ShardedLruCache(3)
+        assert cache.test_and_set(1, 1) is None
+        assert cache.test_and_set(2, 2) is None
+        assert cache.test_and_set(3, 3) is None
+        assert cache.test_and_set(1, 10) == 1  # 2 becomes the LRU
+        assert cache.test_and_set(4, 4) is None
+        assert len(cache) == 3
+        assert cache.test_and_set(3, 30) == 3
+        assert cache.test_and_set(1, 100) == 1
+        assert cache.test_and_set(2, 20) is None  # evicts 4
+        assert cache.test_and_set(4, 40) is None
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.test_and_set(1, 1) is None
+
+    def test_sharding(self):
+        """Test that big caches are split in shards keeping the total size bounded."""
+        cache = ShardedLruCache(4096, 16)
+        assert len(cache._shards) == 4
+        for key in range(10000):
+            cache.test_and_set((key * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF, key)
+        assert len(cache) == 4096
+        assert all(len(shard) == 1024 for shard in cache._shards)
+        assert cache.test_and_set((9999 * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF, 0) == 9999
+        assert cache.test_and_set(0, 0) is None  # evicted
+        assert len(ShardedLruCache(500000)._shards) == 16
+
+    def test_signed_keys(self):
+        """Test that negative keys are stored as their unsigned 64 bit counterpart."""
+        cache = ShardedLruCache(3)
+        assert cache.test_and_set(-1, 1) is None
+        assert cache.test_and_set(0xFFFFFFFFFFFFFFFF, 10) == 1
+        assert cache.test_and_set(-(2 ** 63), 2) is None
+        assert cache.test_and_set(2 ** 63, 20) == 2
+        assert len(cache) == 2
+
+        cache = ShardedLruCache(3072)  # 2**64 isn't a multiple of the shard count.
+        assert len(cache._shards) == 3
+        assert cache.test_and_set(-1, 1) is None
+        assert cache.test_and_set(0xFFFFFFFFFFFFFFFF, 10) == 1
@@ -0,0 +1,161 @@
+"""Split dependencies tests module."""
+# pylint: disable=no-self-use,protected-access
+from splitio.models import splits
+from splitio.models.impressions import Label
+from splitio.engine import evaluator, splitters
+from splitio.engine.dependencies import DependencyGraph
+from splitio.storage import SegmentStorage
+from splitio.storage.inmemmory import InMemorySplitStorage
+
+
+def _split(name, parents=(), treatment='on', whitelist=None):
+    """
+    Build a split that returns `treatment` when all its parents return 'on'.
+
+    Keys in `whitelist`, if any, get `treatment` before looking at the parents.
+    """
+    matchers = [{
+        'matcherType': 'IN_SPLIT_TREATMENT',
+        'negate': False,
+        'keySelector': None,
+        'dependencyMatcherData': {'split': parent, 'treatments': ['on']}
+    } for parent in parents] or [{'matcherType': 'ALL_KEYS', 'negate': False, 'keySelector': None}]
+    conditions = [{
+        'conditionType': 'ROLLOUT',
+        'matcherGroup': {'combiner': 'AND', 'matchers': matchers},
+        'partitions': [{'treatment': treatment, 'size': 100}],
+        'label': 'in dependencies'
+    }]
+    if whitelist:
+        conditions.insert(0, {
+            'conditionType': 'WHITELIST',
+            'matcherGroup': {'combiner': 'AND', 'matchers': [{
+                'matcherType': 'WHITELIST',
+                'negate': False,
+                'keySelector': None,
+                'whitelistMatcherData': {'whitelist': whitelist}
+            }]},
+            'partitions': [{'treatment': treatment, 'size': 100}],
+            'label': 'whitelisted'
+        })
+    return splits.from_raw({
+        'name': name,
+        'seed': 123,
+        'killed': False,
+        'defaultTreatment': 'off',
+        'trafficTypeName': 'user',
+        'status': 'ACTIVE',
+        'changeNumber': 1,
+        'algo': 2,
+        'conditions': conditions
+    })
+
+
+class DependencyGraphTests(object):
+    """Dependency graph test cases."""
+
+    def test_dependencies(self):
+        """Test that direct dependencies are collected from all conditions."""
+        graph = DependencyGraph([_split('a', ['b', 'c']), _split('b', ['c']), _split('c')])
+        assert graph.get_dependency_names('a') == frozenset(['b', 'c'])
+        assert graph.get_dependency_names('c') == frozenset()
+        assert graph.get_dependency_names('unknown') == frozenset()
+
+    def test_ancestors(self):
+        """Test that indirect dependencies are collected, walking cycles once."""
+        graph = DependencyGraph([
+            _split('root', ['a']),
+            _split('a', ['b']),
+            _split('b', ['c', 'missing']),
+            _split('c', ['a']),
+            _split('self', ['self']),
+            _split('d'),
+        ])
+        assert graph.get_ancestor_names('root') == set(['a', 'b', 'c', 'missing'])
+        assert graph.get_ancestor_names('c') == set(['a', 'b', 'c', 'missing'])
+        assert graph.get_ancestor_names('self') == set(['self'])
+        assert graph.get_ancestor_names('d') == set()
+        assert graph.get_ancestor_names('unknown') == set()
+
+
+class DependencyEvaluationTests(object):
+    """Evaluation of splits with dependencies test cases."""
+
+    def _build_evaluator(self, mocker, split_list):
+        """Build an evaluator on top of an in-memory storage holding the splits."""
+        split_storage = InMemorySplitStorage()
+        for split in split_list:
+            split_storage.put(split)
+        return evaluator.Evaluator(split_storage, mocker.Mock(spec=SegmentStorage),
+                                   splitters.Splitter())
+
+    def test_parents_evaluated_once(self, mocker):
+        """Test that a parent shared by many children is evaluated once per request."""
+        e = self._build_evaluator(mocker, [
+            _split('parent'), _split('child1', ['parent']), _split('child2', ['parent']),
+            _split('grandchild', ['child1', 'child2'])
+        ])
+        evaluate_mock = mocker.spy(e, '_get_treatment_for_split')
+        results = e.evaluate_features(['grandchild', 'child2', 'parent'], 'key', None)
+        assert {name: result['treatment'] for name, result in results.items()} == \
+            {'grandchild': 'on', 'child2': 'on', 'parent': 'on'}
+        assert sorted(c[1][0].name for c in evaluate_mock.mock_calls) == \
+            ['child1', 'child2', 'grandchild', 'parent']
+
+    def test_parents_prefetched(self, mocker):
+        """Test that a parent is fetched along with its own parents, once per request."""
+        e = self._build_evaluator(mocker, [
+            _split('parent'), _split('child1', ['parent']), _split('child2', ['parent']),
+            _split('grandchild', ['child1', 'child2'])
+        ])
+        get_spy = mocker.spy(e._split_storage, 'get')
+        fetch_many_spy = mocker.spy(e._split_storage, 'fetch_many')
+        results = e.evaluate_features_bulk(['grandchild'], [('k1', None), ('k2', None)],
+                                           [None, None])
+        assert [result['grandchild']['treatment'] for result in results] == ['on', 'on']
+        assert get_spy.mock_calls == []
+        assert len(fetch_many_spy.mock_calls) == 3
+        assert fetch_many_spy.mock_calls[0] == mocker.call(['grandchild'])
+        assert [sorted(c[1][0]) for c in fetch_many_spy.mock_calls[1:]] == \
+            [['child1', 'parent'], ['child2']]
+
+    def test_circular_dependencies(self, mocker):
+        """Test that circular dependencies yield control without recursing."""
+        e = self._build_evaluator(mocker, [_split('a', ['b']), _split('b', ['a']), _split('c')])
+        result = e.evaluate_feature('a', 'key', None)
+        assert result['treatment'] == 'off'
+        assert result['impression']['label'] == Label.NO_CONDITION_MATCHED
+
+        dependencies = {'a': None}  # 'a' is being evaluated further up in the chain.
+        context = {'dependencies': dependencies, 'bucket_cache': None}
+        assert e.evaluate_dependency('a', 'key', 'key', None, context)['treatment'] == \
+            evaluator.CONTROL
+        assert e.evaluate_dependency('b', 'key', 'key', None, context)['treatment'] == 'off'
+        assert dependencies['b']['impression']['label'] == Label.NO_CONDITION_MATCHED
+        assert dependencies['a'] is None
+        assert e.evaluate_dependency('c', 'key', 'key', None, context)['treatment'] == 'on'
+
+    def test_dependency_on_cycle_not_reached(self, mocker):
+        """Test that splits depending on a cycle match conditions evaluated before reaching it."""
+        e = self._build_evaluator(mocker, [
+            _split('a', ['b']), _split('b', ['a']),
+            _split('child', ['a'], whitelist=['vip']),
+            _split('grandchild', ['child'], whitelist=['other'])
+        ])
+        result = e.evaluate_feature('child', 'vip', None)
+        assert result['treatment'] == 'on'
+        assert result['impression']['label'] == 'whitelisted'
+        result = e.evaluate_feature('grandchild', 'vip', None)
+        assert result['treatment'] == 'on'
+        assert result['impression']['label'] == 'in dependencies'
+        result = e.evaluate_feature('child', 'key', None)
+        assert result['treatment'] == 'off'
+        assert result['impression']['label'] == Label.NO_CONDITION_MATCHED
+
+    def test_circular_dependencies_without_graph(self, mocker):
+        """Test that cycles are detected while evaluating when storage has no graph."""
+        e = self._build_evaluator(mocker, [_split('a', ['b']), _split('b', ['a'])])
+        e._split_storage.get_dependency_graph = lambda: None
+        results = e.evaluate_features(['a', 'b'], 'key', None)
+        assert results['a']['treatment'] == 'off'
+        assert results['b']['treatment'] == 'off'
@@ -47,6 +47,24 @@ class EvaluatorTests(object):
         assert result['impression']['label'] == Label.KILLED
         assert mocked_split.get_configurations_for.mock_calls == [mocker.call('off')]
 
+    def test_configurations_resolved_lazily(self, mocker):
+        """Test that configurations are only looked up when requested."""
+        e = self._build_evaluator_with_mocks(mocker)
+        mocked_split = mocker.Mock(spec=Split)
+        mocked_split.default_treatment = 'off'
+        mocked_split.killed = True
+        mocked_split.change_number = 123
+        mocked_split.get_configurations_for.return_value = '{"some_property": 123}'
+        e._split_storage.get.return_value = mocked_split
+        result = e.evaluate_feature('feature1', 'some_key', 'some_bucketing_key')
+        assert isinstance(result, evaluator.EvaluationResult)
+        assert (result.treatment, result.label, result.change_number) == \
+            ('off', Label.KILLED, 123)
+        assert mocked_split.get_configurations_for.mock_calls == []
+        assert result.configurations == '{"some_property": 123}'
+        assert mocked_split.get_configurations_for.mock_calls == [mocker.call('off')]
+        assert not hasattr(result, '__dict__')
+
     def test_evaluate_treatment_ok(self, mocker):
         """Test that a non-killed split returns the appropriate treatment."""
         e = self._build_evaluator_with_mocks(mocker)
@@ -111,6 +129,69 @@ class EvaluatorTests(object):
         assert result['impression']['change_number'] == 123
         assert result['impression']['label'] == 'some_label'
 
+    def test_evaluate_treatments_bulk(self, mocker):
+        """Test that splits are fetched once for all the keys."""
+        e = self._build_evaluator_with_mocks(mocker)
+        e._get_treatment_for_split = mocker.Mock()
+        e._get_treatment_for_split.side_effect = \
+            lambda s, k, b, a, c, d, p: (k + '_on', 'some_label')
+        mocked_split = mocker.Mock(spec=Split)
+        mocked_split.default_treatment = 'off'
+        mocked_split.killed = False
+        mocked_split.change_number = 123
+        mocked_split.traffic_allocation = 100
+        mocked_split.conditions = []
+        mocked_split.get_configurations_for.return_value = None
+        e._split_storage.fetch_many.return_value = {
+            'feature1': None,
+            'feature2': mocked_split,
+        }
+        results = e.evaluate_features_bulk(['feature1', 'feature2'],
+                                           [('key1', None), ('key2', 'bkey')],
+                                           [None, {'attr1': 1}])
+        assert e._split_storage.fetch_many.mock_calls == [mocker.call(['feature1', 'feature2'])]
+        assert len(results) == 2
+        assert results[0]['feature1']['treatment'] == evaluator.CONTROL
+        assert results[0]['feature1']['impression']['label'] == Label.SPLIT_NOT_FOUND
+        assert results[0]['feature2']['treatment'] == 'key1_on'
+        assert results[1]['feature2']['treatment'] == 'key2_on'
+        assert e._get_treatment_for_split.mock_calls == [
+            mocker.call(mocked_split, 'key1', None, None, mocker.ANY, mocker.ANY, mocker.ANY),
+            mocker.call(mocked_split, 'key2', 'bkey', {'attr1': 1}, mocker.ANY, mocker.ANY,
+                        mocker.ANY),
+        ]
+
+    def test_bulk_prefills_buckets(self, mocker):
+        """Test that buckets of all the keys are computed in batch for bulk evaluations."""
+        e = self._build_evaluator_with_mocks(mocker)
+        e._splitter.get_buckets.side_effect = lambda keys, seed, algo: [seed] * len(keys)
+        condition = mocker.Mock()
+        condition.partitions = [mocker.Mock(), mocker.Mock()]
+        mocked_split = mocker.Mock(spec=Split)
+        mocked_split.killed = False
+        mocked_split.traffic_allocation = 50
+        mocked_split.traffic_allocation_seed = 10
+        mocked_split.seed = 20
+        mocked_split.algo = 2
+        mocked_split.conditions = [condition]
+        bucket_cache = e._prefill_bucket_cache([None, mocked_split], ['k1', 'k2', 'k1'])
+        assert sorted(e._splitter.get_buckets.mock_calls[0][1][0]) == ['k1', 'k2']
+        assert [c[1][1:] for c in e._splitter.get_buckets.mock_calls] == [(10, 2), (20, 2)]
+        assert bucket_cache.get_bucket('k2', 10, 2) == 10
+        assert bucket_cache.get_bucket('k1', 20, 2) == 20
+        assert e._splitter.get_bucket.mock_calls == []
+
+    def test_bucket_cache(self, mocker):
+        """Test that a key is hashed only once per seed & algorithm during an evaluation."""
+        splitter = mocker.Mock(spec=splitters.Splitter)
+        splitter.get_bucket.side_effect = lambda key, seed, algo, hash_fn: seed
+        bucket_cache = evaluator.BucketCache(splitter)
+        assert bucket_cache.get_bucket('key', 1, 2) == 1
+        assert bucket_cache.get_bucket('key', 1, 2) == 1
+        assert bucket_cache.get_bucket('key', 3, 2, len) == 3
+        assert splitter.get_bucket.mock_calls == [mocker.call('key', 1, 2, None),
+                                                  mocker.call('key', 3, 2, len)]
+
     def test_get_gtreatment_for_split_no_condition_matches(self, mocker):
         """Test no condition matches."""
         e = self._build_evaluator_with_mocks(mocker)
@@ -119,6 +200,7 @@ class EvaluatorTests(object):
         conditions_mock.return_value = []
         mocked_split = mocker.Mock(spec=Split)
         mocked_split.killed = False
+        mocked_split.plan = None
         type(mocked_split).conditions = conditions_mock
         treatment, label = e._get_treatment_for_split(mocked_split, 'some_key', 'some_bucketing', {'attr1': 1})
         assert treatment == None
@@ -136,6 +218,7 @@ class EvaluatorTests(object):
         conditions_mock.return_value = [mocked_condition_1]
         mocked_split = mocker.Mock(spec=Split)
         mocked_split.killed = False
+        mocked_split.plan = None
         type(mocked_split).conditions = conditions_mock
         treatment, label = e._get_treatment_for_split(mocked_split, 'some_key', 'some_bucketing', {'attr1': 1})
         assert treatment == 'on'
@@ -155,6 +238,7 @@ class EvaluatorTests(object):
         mocked_split.traffic_allocation = 50
         mocked_split.default_treatment = 'almost-on'
         mocked_split.killed = False
+        mocked_split.plan = None
         type(mocked_split).conditions = conditions_mock
         treatment, label = e._get_treatment_for_split(mocked_split, 'some_key', 'some_bucketing', {'attr1': 1})
         assert treatment == 'almost-on'
@@ -20,6 +20,20 @@ class HashFunctionsTests(object):
         assert hashfns.get_hash_fn(splits.HashAlgorithm.LEGACY) == hashfns.legacy.legacy_hash
         assert hashfns.get_hash_fn(splits.HashAlgorithm.MURMUR) == hashfns._murmur_hash
 
+    def test_hash64_fields(self):
+        """Test that fields are hashed into stable 64 bit values keeping their boundaries."""
+        assert hashfns.hash64_fields(('key1', 'feature1', 'on', 'killed', 123), 0) == \
+            3639149618139046202
+        assert hashfns.hash64_fields(('key1', 'feature1', 'on', 'killed', 123), 5) == \
+            15409814540074148405
+        assert hashfns.hash64_fields((u'\xe1rbol', -1), 0) == 828724039397735193
+
+        fields = [('ab', 'c'), ('a', 'bc'), ('a',), ('\x00a',), ('',), ('', ''), (), ('', 'a'),
+                  ('a', ''), (1,), ('\x01',)]
+        hashes = set(hashfns.hash64_fields(item, 0) for item in fields)
+        assert len(hashes) == len(fields)
+        assert all(0 <= hashed < 1 << 64 for hashed in hashes)
+
     def test_legacy_hash_ascii_data(self):
         """Test legacy hash function against known results."""
         splitter = splitters.Splitter()
@@ -116,3 +130,61 @@ class HashFunctionsTests(object):
             seed = int(seed)
             hashed = int(hashed)
             assert murmur3_128_py(key, seed)[0] == hashed
+
+    def test_vectorized_murmur_hash(self):
+        """Test vectorized murmur hash function against known results."""
+        vectorized = pytest.importorskip('splitio.engine.hashfns.vectorized')
+        file_name = os.path.join(os.path.dirname(__file__), 'files', 'murmur3-sample-data-v2.csv')
+        with open(file_name, 'r') as flo:
+            lines = [line.split(',') for line in flo.read().split('\n') if line]
+
+        by_seed = {}
+        for seed, key, hashed, bucket in lines:
+            by_seed.setdefault(int(seed), []).append((key, int(hashed), int(bucket)))
+
+        for seed, rows in six.iteritems(by_seed):
+            keys = [key for key, _, _ in rows]
+            assert vectorized.murmur32(keys, seed).tolist() == [hashed for _, hashed, _ in rows]
+            assert vectorized.murmur32_buckets(keys, seed).tolist() == \
+                [bucket for _, _, bucket in rows]
+
+    def test_vectorized_legacy_hash(self):
+        """Test vectorized legacy hash function against known results."""
+        vectorized = pytest.importorskip('splitio.engine.hashfns.vectorized')
+        file_name = os.path.join(os.path.dirname(__file__), 'files', 'sample-data.jsonl')
+        with open(file_name, 'r') as flo:
+            lines = [json.loads(line) for line in flo.read().split('\n') if line]
+
+        by_seed = {}
+        for seed, key, hashed, bucket in lines:
+            by_seed.setdefault(seed, []).append((key, hashed, bucket))
+
+        for seed, rows in six.iteritems(by_seed):
+            keys = [key for key, _, _ in rows]
+            assert vectorized.legacy(keys, seed).tolist() == [hashed for _, hashed, _ in rows]
+            assert vectorized.legacy_buckets(keys, seed).tolist() == \
+                [bucket for _, _, bucket in rows]
+
+    def test_vectorized_matches_pure_python(self):
+        """Test vectorized hash functions against the pure python ones for mixed input."""
+        vectorized = pytest.importorskip('splitio.engine.hashfns.vectorized')
+        keys = ['', 'a', 'ab', 'abc', 'abcd', 'abcde', u'árbol', u'漢字key',
+                u'emoji\U0001F600', 'x' * 300]
+        for seed in [0, 1, -1, 123456789, -2147483648, 2147483647]:
+            assert vectorized.murmur32(keys, seed).tolist() == \
+                [hashfns.murmur3py.murmur32_py(key, seed) for key in keys]
+            assert vectorized.legacy(keys, seed).tolist() == \
+                [hashfns.legacy.legacy_hash(key, seed) for key in keys]
+        assert vectorized.murmur32([], 1).tolist() == []
+        assert vectorized.legacy([], 1).tolist() == []
+
+    def test_get_buckets_fn(self, mocker):
+        """Test that bulk bucketing falls back to hashing each key without numpy."""
+        keys = ['key1', 'key2', u'árbol']
+        for algo in [splits.HashAlgorithm.LEGACY, splits.HashAlgorithm.MURMUR]:
+            hash_fn = hashfns.get_hash_fn(algo)
+            expected = [abs(hash_fn(key, 123)) % 100 + 1 for key in keys]
+            assert hashfns.get_buckets_fn(algo)(keys, 123) == expected
+            mocker.patch('splitio.engine.hashfns._BUCKETS_ALGORITHMS', new={})
+            assert hashfns.get_buckets_fn(algo)(keys, 123) == expected
+            mocker.stopall()
@@ -2,6 +2,7 @@
 from datetime import datetime
 from splitio.engine.impressions import Hasher, Observer, Counter, Manager, \
     ImpressionsMode, truncate_time
+from splitio.engine.hashfns import murmur_128, hash64_fields
 from splitio.models.impressions import Impression
 from splitio.client.listener import ImpressionListenerWrapper
 
@@ -30,6 +31,25 @@ class ImpressionHasherTests(object):
         total.add(hasher.process(Impression('key1', 'feature1', 'on', 'killed', 123, None, 456)))
         assert len(total) == 6
 
+    def test_fields_hash(self):
+        """Test that the impression fields are hashed into 64 bits by default."""
+        hasher = Hasher()
+        imp = Impression('key1', 'feature1', 'on', 'killed', 123, None, 456)
+        assert hasher.process(imp) == hash64_fields(('key1', 'feature1', 'on', 'killed', 123), 0)
+        assert hasher.process(imp) == 3639149618139046202  # Same value in every process.
+        assert hasher.process(imp._replace(time=789)) == hasher.process(imp)
+        assert hasher.process(Impression(None, 'feature1', None, 'killed', None, None, 456)) == \
+            hasher.process(Impression('UNKNOWN', 'feature1', 'UNKNOWN', 'killed', 0, None, 456))
+
+    def test_murmur_hash(self):
+        """Test that the stringified impression is hashed with a supplied hash function."""
+        hasher = Hasher(murmur_128)
+        imp = Impression('key1', 'feature1', 'on', 'killed', 123, None, 456)
+        assert hasher.process(imp) == murmur_128('key1:feature1:on:killed:123', 0)
+        assert hasher.process(imp._replace(time=789)) == hasher.process(imp)
+        assert hasher.process(Impression(None, 'feature1', None, 'killed', None, None, 456)) == \
+            hasher.process(Impression('UNKNOWN', 'feature1', 'UNKNOWN', 'killed', 0, None, 456))
+
 
 class ImpressionObserverTests(object):
     """Test impression observer behaviour."""
@@ -58,6 +78,10 @@ class ImpressionObserverTests(object):
         assert (observer.test_and_set(Impression('key1', 'f1', 'on', 'killed', 123, None, 456))
                 == Impression('key1', 'f1', 'on', 'killed', 123, None, 456))
 
+        # Impressions seen for the first time are returned as is
+        imp = Impression('key7', 'f1', 'on', 'killed', 123, None, 456)
+        assert observer.test_and_set(imp) is imp
+
 
 class ImpressionCounterTests(object):
     """Impression counter test cases."""
@@ -136,7 +160,7 @@ class ImpressionManagerTests(object):
         assert imps == [Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1, old_utc-3),
                         Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2, old_utc-1)]
 
-        assert len(manager._observer._cache._data) == 3  # distinct impressions seen
+        assert len(manager._observer._cache) == 3  # distinct impressions seen
         assert len(manager._counter._data) == 3  # 2 distinct features. 1 seen in 2 different timeframes
 
         assert set(manager._counter.pop_all()) == set([
@@ -192,7 +216,7 @@ class ImpressionManagerTests(object):
         assert imps == [Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1, old_utc-3),
                         Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2, old_utc-1)]
 
-        assert len(manager._observer._cache._data) == 3  # distinct impressions seen
+        assert len(manager._observer._cache) == 3  # distinct impressions seen
 
     def test_non_standalone_optimized(self, mocker):
         """Test impressions manager in optimized mode with sdk in standalone mode."""
@@ -335,7 +359,7 @@ class ImpressionManagerTests(object):
         assert imps == [Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1, old_utc-3),
                         Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2, old_utc-1)]
 
-        assert len(manager._observer._cache._data) == 3  # distinct impressions seen
+        assert len(manager._observer._cache) == 3  # distinct impressions seen
         assert len(manager._counter._data) == 3  # 2 distinct features. 1 seen in 2 different timeframes
 
         assert set(manager._counter.pop_all()) == set([
@@ -402,7 +426,7 @@ class ImpressionManagerTests(object):
         assert imps == [Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1, old_utc-3),
                         Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2, old_utc-1)]
 
-        assert len(manager._observer._cache._data) == 3  # distinct impressions seen
+        assert len(manager._observer._cache) == 3  # distinct impressions seen
 
         assert listener.log_impression.mock_calls == [
             mocker.call(Impression('k1', 'f1', 'on', 'l1', 123, None, old_utc-3), None),
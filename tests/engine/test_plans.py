@@ -0,0 +1,134 @@
+"""Evaluation plans tests module."""
+# pylint: disable=no-self-use,protected-access
+from splitio.models import splits
+from splitio.models.impressions import Label
+from splitio.engine import evaluator, splitters
+from splitio.engine.plans import compile_split, TrafficAllocationCheck, ConditionCheck
+from splitio.storage import SplitStorage, SegmentStorage
+
+
+def _matcher(matcher_type, negate=False, attribute=None, **data):
+    """Build a raw matcher."""
+    raw = {
+        'matcherType': matcher_type,
+        'negate': negate,
+        'keySelector': {'trafficType': 'user', 'attribute': attribute} if attribute else None,
+    }
+    raw.update(data)
+    return raw
+
+
+def _condition(matchers, partitions, label, condition_type='ROLLOUT'):
+    """Build a raw condition."""
+    return {
+        'conditionType': condition_type,
+        'matcherGroup': {'combiner': 'AND', 'matchers': matchers},
+        'partitions': [{'treatment': t, 'size': s} for t, s in partitions],
+        'label': label
+    }
+
+
+def _split(conditions, traffic_allocation=100, algo=2):
+    """Build a split from raw conditions."""
+    return splits.from_raw({
+        'name': 'some_split',
+        'seed': 123456,
+        'killed': False,
+        'defaultTreatment': 'def',
+        'trafficTypeName': 'user',
+        'status': 'ACTIVE',
+        'changeNumber': 1,
+        'algo': algo,
+        'trafficAllocation': traffic_allocation,
+        'trafficAllocationSeed': -987654,
+        'conditions': conditions
+    })
+
+
+class EvaluationPlanTests(object):
+    """Evaluation plan test cases."""
+
+    def _build_split(self, traffic_allocation=100, algo=2):
+        """Build a split using whitelist, attribute, segment & rollout conditions."""
+        return _split([
+            _condition(
+                [_matcher('WHITELIST', whitelistMatcherData={'whitelist': ['wl_key']})],
+                [('wl', 100)], 'whitelisted', 'WHITELIST'
+            ),
+            _condition(
+                [_matcher('EQUAL_TO_BOOLEAN', attribute='flag', booleanMatcherData=True),
+                 _matcher('IN_SEGMENT', negate=True,
+                          userDefinedSegmentMatcherData={'segmentName': 'some_segment'})],
+                [('on', 30), ('off', 50), ('maybe', 20)], 'flagged'
+            ),
+            _condition(
+                [_matcher('STARTS_WITH', negate=True, attribute='email',
+                          whitelistMatcherData={'whitelist': ['admin']})],
+                [('on', 0), ('off', 100)], 'not admin'
+            ),
+            _condition([_matcher('ALL_KEYS')], [('on', 50), ('off', 50)], 'default rule'),
+        ], traffic_allocation, algo)
+
+    def _build_evaluator(self, mocker):
+        """Build an evaluator with an actual splitter and a mocked segment storage."""
+        segment_storage = mocker.Mock(spec=SegmentStorage)
+        segment_storage.segment_contains.side_effect = lambda _, key: key.endswith('7')
+        return evaluator.Evaluator(mocker.Mock(spec=SplitStorage), segment_storage,
+                                   splitters.Splitter())
+
+    def test_compile(self):
+        """Test that checks are flattened and partitions accumulated."""
+        plan = compile_split(self._build_split(traffic_allocation=40))
+        assert [type(c) for c in plan.checks] == [
+            ConditionCheck, TrafficAllocationCheck, ConditionCheck, ConditionCheck, ConditionCheck
+        ]
+        assert plan.checks[0].treatment == 'wl'
+        assert plan.checks[1] == TrafficAllocationCheck(-987654, 40)
+        assert plan.checks[2].boundaries == (30, 80, 100)
+        assert plan.checks[2].treatments == ('on', 'off', 'maybe')
+        assert [m.attribute_name for m in plan.checks[2].matchers] == ['flag', None]
+        assert [m.negate for m in plan.checks[2].matchers] == [False, True]
+
+        plan = compile_split(self._build_split())
+        assert TrafficAllocationCheck not in [type(c) for c in plan.checks]
+
+    def test_plan_matches_interpreted_evaluation(self, mocker):
+        """Test that running the plan yields the same results as walking the conditions."""
+        evaluator_instance = self._build_evaluator(mocker)
+        attribute_sets = [None, {}, {'flag': True}, {'flag': 'false'}, {'email': 'admin@x.com'},
+                          {'email': 'user@x.com'}, {'flag': True, 'email': None}]
+        keys = ['wl_key'] + ['key_%d' % i for i in range(200)]
+        for traffic_allocation in [100, 40, 0]:
+            for algo in [1, 2]:
+                interpreted = self._build_split(traffic_allocation, algo)
+                compiled = self._build_split(traffic_allocation, algo)
+                compiled.plan = compile_split(compiled)
+                for attributes in attribute_sets:
+                    for key in keys:
+                        assert evaluator_instance._get_treatment_for_split(
+                            compiled, key, None, attributes
+                        ) == evaluator_instance._get_treatment_for_split(
+                            interpreted, key, None, attributes
+                        )
+
+    def test_traffic_allocation(self, mocker):
+        """Test that keys out of the allocation get the default treatment."""
+        evaluator_instance = self._build_evaluator(mocker)
+        split = self._build_split(traffic_allocation=0)
+        split.plan = compile_split(split)
+        assert evaluator_instance._get_treatment_for_split(split, 'wl_key', None) == \
+            ('wl', 'whitelisted')
+        assert evaluator_instance._get_treatment_for_split(split, 'key', None) == \
+            ('def', Label.NOT_IN_SPLIT)
+
+    def test_no_partitions_and_no_match(self, mocker):
+        """Test conditions without partitions return control & no match returns None."""
+        evaluator_instance = self._build_evaluator(mocker)
+        split = _split([
+            _condition([_matcher('WHITELIST', whitelistMatcherData={'whitelist': ['k1']})],
+                       [], 'empty', 'WHITELIST'),
+        ])
+        split.plan = compile_split(split)
+        assert evaluator_instance._get_treatment_for_split(split, 'k1', None) == \
+            (evaluator.CONTROL, 'empty')
+        assert evaluator_instance._get_treatment_for_split(split, 'k2', None) == (None, None)
@@ -1,6 +1,10 @@
 """Splitter test module."""
 
+from splitio.models.grammar.condition import Condition
 from splitio.models.grammar.partitions import Partition
+from splitio.models.splits import HashAlgorithm, Split
+from splitio.engine import splitters
+from splitio.engine.hashfns import get_hash_fn
 from splitio.engine.splitters import Splitter, CONTROL
 
 
@@ -32,6 +36,43 @@ class SplitterTests(object):
         assert get_hash_fn_mock.mock_calls == [mocker.call(1)]
         assert hash_fn.mock_calls == [mocker.call(1, 123)]
 
+    def test_get_buckets(self, mocker):
+        """Test get_buckets method."""
+        get_buckets_fn_mock = mocker.Mock()
+        buckets_fn = mocker.Mock()
+        buckets_fn.return_value = [1, 2]
+        get_buckets_fn_mock.side_effect = lambda x: buckets_fn
+        mocker.patch('splitio.engine.splitters.get_buckets_fn', new=get_buckets_fn_mock)
+        splitter = Splitter()
+        assert splitter.get_buckets(['k1', 'k2'], 123, 1) == [1, 2]
+        assert get_buckets_fn_mock.mock_calls == [mocker.call(1)]
+        assert buckets_fn.mock_calls == [mocker.call(['k1', 'k2'], 123)]
+
+    def test_get_treatment_with_bucket_table(self, mocker):
+        """Test that precomputed bucket tables and hash functions are used when supplied."""
+        splitter = Splitter()
+        partitions = [Partition('on', 30), Partition('off', 50)]
+        table = Condition([], None, partitions, 'label').bucket_treatments
+        assert len(table) == 100
+        assert table[:30] == ('on',) * 30
+        assert table[30:80] == ('off',) * 50
+        assert table[80:] == (None,) * 20
+
+        get_hash_fn_mock = mocker.patch('splitio.engine.splitters.get_hash_fn')
+        for key_hash, expected in [(29, 'on'), (30, 'off'), (79, 'off'), (80, CONTROL)]:
+            assert splitter.get_treatment('key', 123, partitions, 1, None, table,
+                                          lambda key, seed, h=key_hash: h) == expected
+            assert splitter.get_treatment_for_bucket(key_hash + 1, partitions) == expected
+        assert get_hash_fn_mock.mock_calls == []
+
+    def test_split_hash_fn(self, mocker):
+        """Test that the hash function of a split is resolved only once."""
+        split = Split('some_split', 123, False, 'off', 'user', 'ACTIVE', 1, algo=2)
+        get_hash_fn_spy = mocker.spy(splitters, 'get_hash_fn')
+        assert Splitter.get_split_hash_fn(split) is get_hash_fn(HashAlgorithm.MURMUR)
+        assert Splitter.get_split_hash_fn(split) is split.hash_fn
+        assert len(get_hash_fn_spy.mock_calls) == 1
+
     def test_treatment_for_bucket(self, mocker):
         """Test treatment for bucket method."""
         splitter = Splitter()
@@ -236,6 +236,34 @@ class InMemoryIntegrationTests(object):
             ('sample_feature', 'invalidKey', 'off'),
         )
 
+    def test_get_treatments_bulk(self):
+        """Test client.get_treatments_bulk()."""
+        client = self.factory.client()
+
+        result = client.get_treatments_bulk(
+            ['user1', 'invalidKey'],
+            ['all_feature', 'killed_feature', 'invalid_feature', 'sample_feature']
+        )
+        assert result == [
+            {'all_feature': 'on', 'killed_feature': 'defTreatment',
+             'invalid_feature': 'control', 'sample_feature': 'on'},
+            {'all_feature': 'on', 'killed_feature': 'defTreatment',
+             'invalid_feature': 'control', 'sample_feature': 'off'},
+        ]
+        self._validate_last_impressions(
+            client,
+            ('all_feature', 'user1', 'on'),
+            ('killed_feature', 'user1', 'defTreatment'),
+            ('sample_feature', 'user1', 'on'),
+            ('all_feature', 'invalidKey', 'on'),
+            ('killed_feature', 'invalidKey', 'defTreatment'),
+            ('sample_feature', 'invalidKey', 'off'),
+        )
+
+        result = client.get_treatments_bulk(['True', 'abc4'], ['boolean_test', 'regex_test'])
+        assert result[0]['boolean_test'] == 'on'
+        assert result[1]['regex_test'] == 'on'
+
     def test_manager_methods(self):
         """Test manager.split/splits."""
         manager = self.factory.manager()
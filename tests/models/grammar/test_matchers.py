@@ -11,7 +11,7 @@ from datetime import datetime
 
 from splitio.models.grammar import matchers
 from splitio.storage import SegmentStorage
-from splitio.engine.evaluator import Evaluator
+from splitio.engine.evaluator import Evaluator, EvaluationResult
 
 
 class MatcherTestsBase(object):
@@ -787,15 +787,16 @@ class DependencyMatcherTests(MatcherTestsBase):
         parsed = matchers.DependencyMatcher(self.raw)
         evaluator = mocker.Mock(spec=Evaluator)
 
-        evaluator.evaluate_feature.return_value = {'treatment': 'on'}
-        assert parsed.evaluate('test1', {}, {'bucketing_key': 'buck', 'evaluator': evaluator}) is True
+        context = {'bucketing_key': 'buck', 'evaluator': evaluator}
+        evaluator.evaluate_dependency.return_value = EvaluationResult('on', 'label', 1)
+        assert parsed.evaluate('test1', {}, context) is True
 
-        evaluator.evaluate_feature.return_value = {'treatment': 'off'}
-        assert parsed.evaluate('test1', {}, {'bucketing_key': 'buck', 'evaluator': evaluator}) is False
+        evaluator.evaluate_dependency.return_value = EvaluationResult('off', 'label', 1)
+        assert parsed.evaluate('test1', {}, context) is False
 
-        assert evaluator.evaluate_feature.mock_calls == [
-            mocker.call('some_split', 'test1', 'buck', {}),
-            mocker.call('some_split', 'test1', 'buck', {})
+        assert evaluator.evaluate_dependency.mock_calls == [
+            mocker.call('some_split', 'test1', 'buck', {}, context),
+            mocker.call('some_split', 'test1', 'buck', {}, context)
         ]
 
         assert parsed.evaluate([], {}, {'bucketing_key': 'buck', 'evaluator': evaluator}) is False
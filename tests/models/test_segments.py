@@ -0,0 +1,57 @@
+"""Segment model tests module."""
+# pylint: disable=protected-access
+import pytest
+
+from splitio.models import segments
+
+
+class SegmentTests(object):
+    """Segment model tests."""
+
+    def test_update_in_place(self):
+        """Test that updates modify the existing key set."""
+        segment = segments.Segment('some_segment', ['k1', 'k2'], 1)
+        keys = segment.keys
+        segment.update(['k3', 'k4'], ['k1', 'k4'])
+        assert segment.keys is keys
+        assert keys == set(['k2', 'k3'])
+
+
+class CompactSegmentTests(object):
+    """Compact segment model tests."""
+
+    def test_contains(self):
+        """Test membership on the initial keys."""
+        segment = segments.CompactSegment('some_segment', ['k%d' % i for i in range(1000)], 1)
+        assert all(segment.contains('k%d' % i) for i in range(1000))
+        assert not any(segment.contains('x%d' % i) for i in range(1000))
+        assert len(segment) == 1000
+        assert segment.name == 'some_segment'
+        assert segment.change_number == 1
+
+    def test_update_and_merge(self, mocker):
+        """Test that pending changes are honored before and after being merged."""
+        mocker.patch('splitio.models.segments._COMPACT_MIN_PENDING', new=2)
+        segment = segments.CompactSegment('some_segment', ['k1', 'k2', 'k3'], 1)
+        hashes = segment._state[0]
+
+        segment.update(['k4', 'k1'], ['k2', 'k5'])
+        assert segment._state[0] is hashes
+        assert [segment.contains(k) for k in ['k1', 'k2', 'k3', 'k4', 'k5']] == \
+            [True, False, True, True, False]
+
+        segment.update(['k6'], ['k3'])
+        assert segment._state[0] is not hashes
+        assert segment._state[1:] == (set(), set())
+        assert [segment.contains(k) for k in ['k1', 'k2', 'k3', 'k4', 'k5', 'k6']] == \
+            [True, False, False, True, False, True]
+        assert list(segment._state[0]) == \
+            sorted(segments._hash_key(k) for k in ['k1', 'k4', 'k6'])
+        assert len(segment) == 3
+
+    def test_stable_hashes(self):
+        """Test that keys are stored as unsigned 64 bit murmur hashes, without the keys."""
+        segment = segments.CompactSegment('some_segment', ['abc'], 1)
+        assert list(segment._state[0]) == [13012657714217449575]
+        with pytest.raises(NotImplementedError):
+            segment.keys  # pylint: disable=pointless-statement
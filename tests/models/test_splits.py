@@ -80,6 +80,21 @@ class SplitTests(object):
         assert parsed.get_configurations_for('on') == '{"color": "blue", "size": 13}'
         assert parsed._configurations == {'on': '{"color": "blue", "size": 13}'}
 
+    def test_configurations(self):
+        """Test that configurations are precomputed and cannot be altered through the split."""
+        raw = dict(self.raw, configurations=dict(self.raw['configurations']))
+        parsed = splits.from_raw(raw)
+        assert parsed.has_configurations
+        raw['configurations']['off'] = '{}'
+        assert parsed.get_configurations_for('off') is None
+        assert parsed.get_configurations_for('on') == '{"color": "blue", "size": 13}'
+
+        for configurations in [None, {}]:
+            raw['configurations'] = configurations
+            parsed = splits.from_raw(raw)
+            assert not parsed.has_configurations
+            assert parsed.get_configurations_for('on') is None
+
     def test_get_segment_names(self, mocker):
         """Test fetching segment names."""
         cond1 = mocker.Mock(spec=Condition)
@@ -1,11 +1,17 @@
 """Recorder unit tests."""
 
+import threading
+import time
+
 import pytest
 
-from splitio.recorder.recorder import StandardRecorder, PipelinedRecorder
+from splitio.recorder.recorder import StandardRecorder, PipelinedRecorder, AsyncRecorder, \
+    BatchedPipelinedRecorder
+from splitio.client.config import DropPolicy
 from splitio.engine.impressions import Manager as ImpressionsManager
 from splitio.storage.inmemmory import TelemetryStorage, EventStorage, ImpressionStorage
-from splitio.storage.redis import TelemetryPipelinedStorage, ImpressionPipelinedStorage, EventStorage
+from splitio.storage.redis import TelemetryPipelinedStorage, ImpressionPipelinedStorage, EventStorage, \
+    RedisImpressionsStorage
 from splitio.storage.adapters.redis import RedisAdapter
 from splitio.models.impressions import Impression
 
@@ -46,3 +52,134 @@ class StandardRecorderTests(object):
         assert recorder._impression_storage.add_impressions_to_pipe.mock_calls[0][1][0] == impressions
         assert recorder._telemetry_storage.add_latency_to_pipe.mock_calls[0][1][0] == 'some'
         assert recorder._telemetry_storage.add_latency_to_pipe.mock_calls[0][1][1] == 1
+
+
+class AsyncRecorderTests(object):
+    """AsyncRecorder test cases."""
+
+    def _build(self, mocker, **kwargs):
+        impmanager = mocker.Mock(spec=ImpressionsManager)
+        impmanager.process_impressions.side_effect = lambda imps: imps
+        telemetry = mocker.Mock(spec=TelemetryStorage)
+        impression = mocker.Mock(spec=ImpressionStorage)
+        impression.put.return_value = True
+        recorder = AsyncRecorder(impmanager, telemetry, mocker.Mock(spec=EventStorage),
+                                 impression, **kwargs)
+        recorder._start_worker = lambda: None  # flushed explicitly
+        return recorder
+
+    def test_batches(self, mocker):
+        """Test that queued evaluations are processed in batches."""
+        recorder = self._build(mocker, batch_size=2)
+        imps = [Impression('k%d' % i, 'f1', 'on', 'l1', 123, None, None) for i in range(3)]
+        for index, imp in enumerate(imps):
+            recorder.record_treatment_stats([imp], index, 'some')
+        assert recorder.pending == 3
+        assert recorder._impression_storage.put.mock_calls == []
+
+        recorder.flush()
+        assert recorder.pending == 0
+        assert recorder._impressions_manager.process_impressions.mock_calls == [
+            mocker.call(imps[:2]), mocker.call(imps[2:])
+        ]
+        assert recorder._impression_storage.put.mock_calls == [
+            mocker.call(imps[:2]), mocker.call(imps[2:])
+        ]
+        assert recorder._telemetry_storage.inc_latency.mock_calls == [
+            mocker.call('some', 0), mocker.call('some', 1), mocker.call('some', 2)
+        ]
+
+    def test_drop_policies(self, mocker):
+        """Test that items are dropped according to the policy when the queue is full."""
+        recorder = self._build(mocker, queue_size=2)
+        for latency in range(4):
+            recorder.record_treatment_stats([], latency, 'some')
+        assert recorder.dropped == 2
+        assert [item[1] for item in recorder._queue] == [0, 1]
+
+        recorder = self._build(mocker, queue_size=2, drop_policy=DropPolicy.DROP_OLDEST)
+        for latency in range(4):
+            recorder.record_treatment_stats([], latency, 'some')
+        assert recorder.dropped == 2
+        assert [item[1] for item in recorder._queue] == [2, 3]
+
+    def test_concurrent_drops(self, mocker):
+        """Test that every evaluation is either queued or counted as dropped."""
+        for policy in (DropPolicy.DROP_NEWEST, DropPolicy.DROP_OLDEST):
+            recorder = self._build(mocker, queue_size=50, drop_policy=policy)
+
+            def record():
+                for latency in range(200):
+                    recorder.record_treatment_stats([], latency, 'some')
+
+            threads = [threading.Thread(target=record) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert recorder.pending == 50
+            assert recorder.dropped == 8 * 200 - 50
+
+    def test_block_policy(self, mocker):
+        """Test that a full queue is drained by the worker before queueing."""
+        recorder = self._build(mocker, queue_size=2, drop_policy=DropPolicy.BLOCK)
+        del recorder._start_worker
+        for latency in range(5):
+            recorder.record_treatment_stats([], latency, 'some')
+        recorder.flush()
+        assert recorder.dropped == 0
+        assert [c[1][1] for c in recorder._telemetry_storage.inc_latency.mock_calls] == \
+            [0, 1, 2, 3, 4]
+
+
+class BatchedPipelinedRecorderTests(object):
+    """BatchedPipelinedRecorder test cases."""
+
+    def test_buffered_flush(self, mocker):
+        """Test that stats are buffered and sent in a single pipeline."""
+        pipe = mocker.Mock()
+        pipe.execute.return_value = [3, 2, 1]
+        impmanager = mocker.Mock(spec=ImpressionsManager)
+        impmanager.process_impressions.side_effect = lambda imps: imps
+        telemetry = mocker.Mock(spec=TelemetryPipelinedStorage)
+        impression = mocker.Mock(spec=RedisImpressionsStorage)
+        impression.add_impressions_to_pipe.return_value = 3
+        recorder = BatchedPipelinedRecorder(lambda: pipe, impmanager, telemetry,
+                                            mocker.Mock(spec=EventStorage), impression, 100, 60000)
+        recorder._start_worker = lambda: None  # flushed explicitly
+
+        imps = [Impression('k%d' % i, 'f1', 'on', 'l1', 123, None, None) for i in range(3)]
+        recorder.record_treatment_stats(imps[:1], 1, 'some')
+        recorder.record_treatment_stats(imps[1:], 1, 'some')
+        recorder.record_treatment_stats([], 2, 'some')
+        assert pipe.execute.mock_calls == []
+
+        recorder.flush()
+        assert impression.add_impressions_to_pipe.mock_calls == [mocker.call(imps, pipe)]
+        assert sorted(telemetry.add_latency_to_pipe.mock_calls) == sorted([
+            mocker.call('some', 1, pipe, 2), mocker.call('some', 2, pipe, 1)
+        ])
+        assert len(pipe.execute.mock_calls) == 1
+        assert impression.expire_key.mock_calls == [mocker.call(3, 3)]
+
+        # Nothing buffered, nothing sent.
+        recorder.flush()
+        assert len(pipe.execute.mock_calls) == 1
+
+    def test_flush_size(self, mocker):
+        """Test that the worker flushes as soon as enough impressions are buffered."""
+        pipe = mocker.Mock()
+        pipe.execute.return_value = [2, 1]
+        impmanager = mocker.Mock(spec=ImpressionsManager)
+        impmanager.process_impressions.side_effect = lambda imps: imps
+        recorder = BatchedPipelinedRecorder(
+            lambda: pipe, impmanager, mocker.Mock(spec=TelemetryPipelinedStorage),
+            mocker.Mock(spec=EventStorage), mocker.Mock(spec=RedisImpressionsStorage), 2, 60000
+        )
+        imps = [Impression('k%d' % i, 'f1', 'on', 'l1', 123, None, None) for i in range(2)]
+        recorder.record_treatment_stats(imps, 1, 'some')
+        for _ in range(100):
+            if pipe.execute.mock_calls:
+                break
+            time.sleep(0.01)
+        assert len(pipe.execute.mock_calls) == 1
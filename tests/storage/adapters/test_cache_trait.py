@@ -1,5 +1,6 @@
 """Cache testing module."""
 #pylint: disable=protected-access,no-self-use,line-too-long
+import threading
 import time
 from random import choice
 
@@ -130,3 +131,82 @@ class  CacheTraitTests(object):
         assert cache_trait.decorate(key_func, 0, 10)(user_func) is user_func
         assert cache_trait.decorate(key_func, 10, 0)(user_func) is user_func
         assert cache_trait.decorate(key_func, 0, 0)(user_func) is user_func
+
+
+class RefreshAheadCacheTests(object):
+    """Refresh-ahead cache test cases."""
+
+    def test_serves_stale_while_refreshing(self, mocker):
+        """Test that expired items are served while a background thread reloads them."""
+        values = {'key': 1}
+        user_func = mocker.Mock()
+        user_func.side_effect = lambda *p, **kw: values[p[0]]
+        cache = cache_trait.RefreshAheadCache(lambda *p, **kw: p[0], user_func, 1, 5)
+
+        assert cache.get('key') == 1
+        values['key'] = 2
+        time.sleep(1.1)
+        assert cache.get('key') == 1  # expired item is served while reloading
+        for _ in range(50):
+            if cache.get('key') == 2:
+                break
+            time.sleep(0.01)
+        assert cache.get('key') == 2
+        assert len(user_func.mock_calls) == 2
+
+        # a failing refresh keeps the stale value.
+        user_func.side_effect = Exception('something')
+        time.sleep(1.1)
+        assert cache.get('key') == 2
+        time.sleep(0.1)
+        assert cache.get('key') == 2
+
+    def test_coalesced_misses(self, mocker):
+        """Test that concurrent misses for a key call the user function once."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def _user_func(key):
+            calls.append(key)
+            if key == 'slow':
+                started.set()
+                release.wait(1)
+            return len(key)
+
+        cache = cache_trait.RefreshAheadCache(lambda *p, **kw: p[0], _user_func, 10, 5)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get('slow')))
+                   for _ in range(5)]
+        threads[0].start()
+        started.wait(1)
+        for thread in threads[1:]:
+            thread.start()
+
+        # misses for other keys don't wait for the slow one.
+        assert cache.get('other') == 5
+
+        release.set()
+        for thread in threads:
+            thread.join(1)
+        assert results == [4] * 5
+        assert calls == ['slow', 'other']
+
+    def test_failed_miss(self, mocker):
+        """Test that a failing load is raised and not cached."""
+        user_func = mocker.Mock()
+        user_func.side_effect = [Exception('something'), 3]
+        cache = cache_trait.RefreshAheadCache(lambda *p, **kw: p[0], user_func, 10, 5)
+        with pytest.raises(Exception):
+            cache.get('key')
+        assert cache.get('key') == 3
+        assert cache._pending == {}
+
+    def test_decorate_refresh_ahead(self, mocker):
+        """Test that the decorator builds a refresh-ahead cache when requested."""
+        cache_mock = mocker.Mock(spec=cache_trait.RefreshAheadCache)
+        mocker.patch('splitio.storage.adapters.cache_trait.RefreshAheadCache', new=cache_mock)
+        key_func = mocker.Mock()
+        user_func = mocker.Mock()
+        cache_trait.decorate(key_func, 10, 5, refresh_ahead=True)(user_func)
+        assert cache_mock.mock_calls[0] == mocker.call(key_func, user_func, 10, 5)
@@ -18,6 +18,10 @@ class RedisStorageAdapterTests(object):
         adapter.keys('*')
         assert redis_mock.keys.mock_calls[0] == mocker.call('some_prefix.*')
 
+        redis_mock.scan_iter.return_value = iter(['some_prefix.key1', 'some_prefix.key2'])
+        assert adapter.scan_iter('*', 100) == ['key1', 'key2']
+        assert redis_mock.scan_iter.mock_calls[0] == mocker.call(match='some_prefix.*', count=100)
+
         adapter.set('key1', 'value1')
         assert redis_mock.set.mock_calls[0] == mocker.call('some_prefix.key1', 'value1')
 
@@ -70,6 +74,12 @@ class RedisStorageAdapterTests(object):
         adapter.ttl('key1')
         assert redis_mock.ttl.mock_calls[0] == mocker.call('some_prefix.key1')
 
+        script = adapter.register_script('some_script')
+        assert redis_mock.register_script.mock_calls[0] == mocker.call('some_script')
+        script(['key1'], [1, 'value1'])
+        assert redis_mock.register_script.return_value.mock_calls[0] == \
+            mocker.call(keys=['some_prefix.key1'], args=[1, 'value1'])
+
     def test_adapter_building(self, mocker):
         """Test buildin different types of client according to parameters received."""
         strict_redis_mock = mocker.Mock(spec=StrictRedis)
@@ -197,3 +207,8 @@ class RedisPipelineAdapterTests(object):
 
         adapter.incr('key1')
         assert redis_mock_2.incr.mock_calls[0] == mocker.call('some_prefix.key1', 1)
+
+        script = redis.RedisScriptAdapter(mocker.Mock(), prefix_helper)
+        script(['key1'], [1, 'value1'], client=adapter)
+        assert script._script.mock_calls[0] == \
+            mocker.call(keys=['some_prefix.key1'], args=[1, 'value1'], client=redis_mock_2)
@@ -0,0 +1,85 @@
+"""On-disk changes cache tests."""
+# pylint: disable=no-self-use,protected-access
+import io
+import os
+
+from splitio.storage import disk
+from splitio.storage.disk import DiskChangesCache
+
+
+def _split(name, status='ACTIVE'):
+    """Build a minimal raw split."""
+    return {'name': name, 'status': status}
+
+
+class DiskChangesCacheTests(object):
+    """Disk changes cache test cases."""
+
+    def test_splits(self, tmpdir):
+        """Test that split changes are replayed."""
+        directory = os.path.join(str(tmpdir), 'cache')
+        cache = DiskChangesCache(directory)
+        assert cache.load_splits() is None
+
+        cache.save_split_changes([_split('a'), _split('b')], -1, 10)
+        cache.save_split_changes([_split('b', 'ARCHIVED'), _split('c')], 10, 20)
+
+        cache = DiskChangesCache(directory)
+        raw_splits, till = cache.load_splits()
+        assert till == 20
+        assert sorted(raw['name'] for raw in raw_splits) == ['a', 'c']
+        with io.open(os.path.join(directory, 'splits.jsonl')) as journal:
+            assert len(journal.readlines()) == 2  # not compacted below the threshold
+
+        cache.save_split_changes([_split('d')], 20, 30)
+        raw_splits, till = cache.load_splits()
+        assert till == 30
+        assert sorted(raw['name'] for raw in raw_splits) == ['a', 'c', 'd']
+
+    def test_segments(self, tmpdir, mocker):
+        """Test that segment changes are replayed and journals compacted when too long."""
+        mocker.patch('splitio.storage.disk._MAX_JOURNAL_ENTRIES', new=2)
+        cache = DiskChangesCache(str(tmpdir))
+        cache.save_segment_changes('some/segment', ['k1', 'k2', 'k3'], [], -1, 10)
+        cache.save_segment_changes('some/segment', ['k4'], ['k1'], 10, 20)
+        cache.save_segment_changes('some/segment', [], ['k2'], 20, 30)
+        assert cache._entries[cache._segment_path('some/segment')] == 1
+        keys, till = cache.load_segment('some/segment')
+        assert sorted(keys) == ['k3', 'k4']
+        assert till == 30
+        assert cache.load_segment('other') is None
+
+        # Journals grown by several processes are compacted when loaded past the threshold.
+        DiskChangesCache(str(tmpdir)).save_segment_changes('some/segment', ['k5'], [], 30, 40)
+        DiskChangesCache(str(tmpdir)).save_segment_changes('some/segment', ['k6'], [], 40, 50)
+        cache = DiskChangesCache(str(tmpdir))
+        keys, till = cache.load_segment('some/segment')
+        assert sorted(keys) == ['k3', 'k4', 'k5', 'k6']
+        assert till == 50
+        with io.open(cache._segment_path('some/segment')) as journal:
+            assert len(journal.readlines()) == 1
+
+    def test_broken_journals(self, tmpdir):
+        """Test that torn lines are ignored and inconsistent journals discarded."""
+        cache = DiskChangesCache(str(tmpdir))
+        cache.save_segment_changes('s1', ['k1'], [], -1, 10)
+        path = cache._segment_path('s1')
+        with io.open(path, 'a', encoding='utf-8') as journal:
+            journal.write(u'{"added": ["k2"], "remo')
+        assert cache.load_segment('s1') == (['k1'], 10)
+
+        cache.save_segment_changes('s2', ['k1'], [], 5, 10)  # missing the initial snapshot
+        assert cache.load_segment('s2') is None
+        assert not os.path.exists(cache._segment_path('s2'))
+
+    def test_write_errors(self, tmpdir, mocker):
+        """Test that write errors are logged and swallowed."""
+        logger = mocker.Mock()
+        mocker.patch('splitio.storage.disk._LOGGER', new=logger)
+        blocker = os.path.join(str(tmpdir), 'file')
+        with io.open(blocker, 'w') as handle:
+            handle.write(u'')
+        cache = DiskChangesCache(os.path.join(blocker, 'cache'))
+        cache.save_split_changes([], -1, 10)
+        assert len(logger.error.mock_calls) == 1
+        assert disk.DiskChangesCache(str(tmpdir)).load_splits() is None
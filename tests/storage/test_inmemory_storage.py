@@ -1,7 +1,7 @@
 """In-Memory storage test module."""
 # pylint: disable=no-self-use
 from splitio.models.splits import Split
-from splitio.models.segments import Segment
+from splitio.models.segments import Segment, CompactSegment
 from splitio.models.impressions import Impression
 from splitio.models.events import Event, EventWrapper
 
@@ -192,6 +192,66 @@ class InMemorySplitStorageTests(object):
 
         storage.kill_locally('some_split', 'default_treatment', 3)
         assert storage.get('some_split').change_number == 3
+        assert storage.get('some_split').killed is True
+        assert split.killed is False  # Splits already read are left untouched.
+        assert split.change_number == 1
+
+    def test_build_plans(self, mocker):
+        """Test that evaluation plans are compiled on put only when enabled."""
+        compile_mock = mocker.Mock()
+        mocker.patch('splitio.storage.inmemmory.compile_split', new=compile_mock)
+
+        split = Split('some_split', 123456789, False, 'some', 'traffic_type', 'ACTIVE', 1)
+        InMemorySplitStorage().put(split)
+        assert split.plan is None
+        assert compile_mock.mock_calls == []
+
+        storage = InMemorySplitStorage(build_plans=True)
+        storage.put(split)
+        assert compile_mock.mock_calls == [mocker.call(split)]
+        assert storage.get('some_split').plan is compile_mock.return_value
+
+    def test_update(self, mocker):
+        """Test that batch updates publish a new snapshot without altering previous reads."""
+        split1 = mocker.Mock()
+        split1.name = 'split1'
+        split1.traffic_type_name = 'user'
+        split2 = mocker.Mock()
+        split2.name = 'split2'
+        split2.traffic_type_name = 'account'
+        storage = InMemorySplitStorage()
+        storage.update([split1, split2], [], 10)
+        assert storage.get_change_number() == 10
+        assert storage.is_valid_traffic_type('account')
+
+        snapshot = storage._snapshot
+        all_splits = storage.get_all_splits()
+        storage.update([], ['split2', 'nonexistant'], None)
+        assert storage.get_change_number() == 10
+        assert storage.get('split2') is None
+        assert not storage.is_valid_traffic_type('account')
+        assert storage.is_valid_traffic_type('user')
+        assert snapshot.splits == {'split1': split1, 'split2': split2}
+        assert all_splits == [split1, split2]
+
+        storage.update([split2], ['split2'], None)  # Deletes are applied first.
+        assert storage.get('split2') is split2
+        assert storage.is_valid_traffic_type('account')
+
+    def test_dependency_graph(self, mocker):
+        """Test that the dependency graph is rebuilt only after splits change."""
+        graph_mock = mocker.Mock()
+        mocker.patch('splitio.storage.inmemmory.DependencyGraph', new=graph_mock)
+        storage = InMemorySplitStorage()
+        split = Split('some_split', 123456789, False, 'some', 'traffic_type', 'ACTIVE', 1)
+        storage.put(split)
+        assert storage.get_dependency_graph() is graph_mock.return_value
+        storage.get_dependency_graph()
+        assert len(graph_mock.mock_calls) == 1
+
+        storage.remove('some_split')
+        storage.get_dependency_graph()
+        assert len(graph_mock.mock_calls) == 2
 
 
 class InMemorySegmentStorageTests(object):
@@ -254,6 +314,22 @@ class InMemorySegmentStorageTests(object):
         assert not storage.segment_contains('some_segment', 'key3')
         assert storage.get_change_number('some_segment') == 456
 
+    def test_compact_segments(self):
+        """Test that segments are stored compacted when enabled."""
+        storage = InMemorySegmentStorage(compact=True)
+        storage.put(Segment('some_segment', ['key1', 'key2', 'key3'], 123))
+        assert isinstance(storage.get('some_segment'), CompactSegment)
+
+        storage.update('some_segment', ['key4'], ['key2'], 456)
+        storage.update('other_segment', ['key1'], [], 789)
+        assert isinstance(storage.get('other_segment'), CompactSegment)
+        assert storage.segment_contains('some_segment', 'key1')
+        assert storage.segment_contains('some_segment', 'key4')
+        assert not storage.segment_contains('some_segment', 'key2')
+        assert storage.segment_contains('other_segment', 'key1')
+        assert storage.get_change_number('some_segment') == 456
+        assert storage.get_change_number('other_segment') == 789
+
 
 class InMemoryImpressionsStorageTests(object):
     """InMemory impressions storage test cases."""
@@ -90,6 +90,65 @@ class RedisSplitStorageTests(object):
         assert result['split2'] is not None
         assert 'split3' in result
 
+    def test_versioned_cache(self, mocker):
+        """Test that splits are reloaded in bulk only after the change number moves."""
+        adapter = mocker.Mock(spec=RedisAdapter)
+        from_raw = mocker.Mock(side_effect=lambda raw: raw['name'] + str(raw.get('v', '')))
+        mocker.patch('splitio.storage.redis.splits.from_raw', new=from_raw)
+        time_mock = mocker.Mock(return_value=100)
+        mocker.patch('splitio.storage.redis.time.time', new=time_mock)
+        redis = {
+            'SPLITIO.splits.till': '1',
+            'SPLITIO.split.split1': '{"name": "split1"}',
+            'SPLITIO.split.split2': '{"name": "split2"}',
+        }
+        adapter.get.side_effect = redis.get
+        adapter.scan_iter.side_effect = \
+            lambda *_: [k for k in redis if k.startswith('SPLITIO.split.')]
+        adapter.mget.side_effect = lambda keys: [redis.get(k) for k in keys]
+
+        storage = RedisSplitStorage(adapter, True, 5, True)
+        assert storage.get('split1') == 'split1'
+        assert storage.fetch_many(['split1', 'split2', 'split3']) == \
+            {'split1': 'split1', 'split2': 'split2', 'split3': None}
+        assert adapter.get.mock_calls == [mocker.call('SPLITIO.splits.till')]
+        assert len(adapter.mget.mock_calls) == 1
+        assert len(from_raw.mock_calls) == 2
+
+        # Change number didn't move: nothing is fetched again.
+        time_mock.return_value = 106
+        assert storage.get('split2') == 'split2'
+        assert len(adapter.get.mock_calls) == 2
+        assert len(adapter.mget.mock_calls) == 1
+
+        # Change number moved: only the updated split is parsed again.
+        redis['SPLITIO.splits.till'] = '2'
+        redis['SPLITIO.split.split2'] = '{"name": "split2", "v": 2}'
+        del redis['SPLITIO.split.split1']
+        assert storage.get('split2') == 'split2'
+        time_mock.return_value = 112
+        assert storage.fetch_many(['split1', 'split2']) == {'split1': None, 'split2': 'split22'}
+        assert len(adapter.mget.mock_calls) == 2
+        assert len(from_raw.mock_calls) == 3
+        assert adapter.scan_iter.mock_calls[0] == mocker.call('SPLITIO.split.*', 1000)
+        assert adapter.keys.mock_calls == []
+
+    def test_versioned_cache_errors(self, mocker):
+        """Test that a failed first load is retried on the next lookup."""
+        adapter = mocker.Mock(spec=RedisAdapter)
+        mocker.patch('splitio.storage.redis.splits.from_raw', new=lambda raw: raw['name'])
+        mocker.patch('splitio.storage.redis.time.time', new=lambda: 100)
+        adapter.get.side_effect = RedisAdapterException('something')
+        adapter.scan_iter.return_value = ['SPLITIO.split.split1']
+        adapter.mget.return_value = ['{"name": "split1"}']
+
+        storage = RedisSplitStorage(adapter, True, 5, True)
+        assert storage.get('split1') is None
+        adapter.get.side_effect = None
+        adapter.get.return_value = '1'
+        assert storage.get('split1') == 'split1'
+        assert len(adapter.get.mock_calls) == 2
+
     def test_get_changenumber(self, mocker):
         """Test fetching changenumber."""
         adapter = mocker.Mock(spec=RedisAdapter)
@@ -220,6 +279,34 @@ class RedisSegmentStorageTests(object):
             mocker.call('SPLITIO.segment.some_segment', 'some_key')
         ]
 
+    def test_segment_contains_with_bloom_filters(self, mocker):
+        """Test that keys ruled out by the segment filter skip redis."""
+        adapter = mocker.Mock(spec=RedisAdapter)
+        adapter.get.return_value = '100'
+        adapter.smembers.return_value = set(['key1', 'key2'])
+        adapter.sismember.return_value = True
+        storage = RedisSegmentStorage(adapter, True)
+        storage._filters._build('some_segment')
+        assert storage.segment_contains('some_segment', 'key1') is True
+        assert storage.segment_contains('some_segment', 'key3') is False
+        assert storage.segment_contains('some_segment', 'key2') is True
+        assert adapter.smembers.mock_calls == [mocker.call('SPLITIO.segment.some_segment')]
+        assert adapter.sismember.mock_calls == [
+            mocker.call('SPLITIO.segment.some_segment', 'key1'),
+            mocker.call('SPLITIO.segment.some_segment', 'key2')
+        ]
+
+        assert adapter.get.mock_calls == [mocker.call('SPLITIO.segment.some_segment.till')]
+
+        # Once the change number is due for a check, keys are looked up in redis meanwhile.
+        adapter.get.return_value = '101'
+        storage._filters._filters['some_segment'] = \
+            storage._filters._filters['some_segment'][:2] + (0,)
+        mocker.patch('splitio.util.bloom.threading.Thread')
+        assert storage.segment_contains('some_segment', 'key3') is True
+        assert adapter.sismember.mock_calls[-1] == \
+            mocker.call('SPLITIO.segment.some_segment', 'key3')
+
 
 class RedisImpressionsStorageTests(object):  # pylint: disable=too-few-public-methods
     """Redis Impressions storage test cases."""
@@ -298,6 +385,45 @@ class RedisImpressionsStorageTests(object):  # pylint: disable=too-few-public-me
         adapter.rpush.side_effect = _raise_exc
         assert storage.put(impressions) is False
 
+    def test_add_impressions_scripted(self, mocker):
+        """Test that impressions are pushed with a TTL using a server-side script."""
+        adapter = mocker.Mock(spec=RedisAdapter)
+        script = mocker.Mock()
+        adapter.register_script.return_value = script
+        metadata = get_metadata({})
+        storage = RedisImpressionsStorage(adapter, metadata, True)
+        impressions = [
+            Impression('key1', 'feature1', 'on', 'some_label', 123456, 'buck1', 321654),
+            Impression('key2', 'feature2', 'on', 'some_label', 123456, 'buck1', 321654)
+        ]
+        assert storage.put(impressions) is True
+        assert script.mock_calls == [mocker.call(
+            ['SPLITIO.impressions'],
+            [RedisImpressionsStorage.IMPRESSIONS_KEY_DEFAULT_TTL] + storage._wrap_impressions(impressions)
+        )]
+        assert adapter.rpush.mock_calls == []
+        assert adapter.expire.mock_calls == []
+
+        pipe = mocker.Mock()
+        assert storage.add_impressions_to_pipe(impressions, pipe) == 2
+        assert script.mock_calls[-1] == mocker.call(
+            ['SPLITIO.impressions'],
+            [RedisImpressionsStorage.IMPRESSIONS_KEY_DEFAULT_TTL] + storage._wrap_impressions(impressions),
+            client=pipe
+        )
+        assert pipe.rpush.mock_calls == []
+        storage.expire_key(2, 2)
+        assert adapter.expire.mock_calls == []
+
+        # Empty batches never reach the script, which would shorten the queue's TTL.
+        script.reset_mock()
+        assert storage.put([]) is True
+        assert storage.add_impressions_to_pipe([], pipe) == 0
+        assert script.mock_calls == []
+
+        script.side_effect = RedisAdapterException('something')
+        assert storage.put(impressions) is False
+
     def test_add_impressions_to_pipe(self, mocker):
         """Test that adding impressions to storage works."""
         adapter = mocker.Mock(spec=RedisAdapter)
@@ -328,7 +454,7 @@ class RedisImpressionsStorageTests(object):  # pylint: disable=too-few-public-me
             }
         }) for impression in impressions]
 
-        storage.add_impressions_to_pipe(impressions, adapter)
+        assert storage.add_impressions_to_pipe(impressions, adapter) == 4
         assert adapter.rpush.mock_calls == [mocker.call('SPLITIO.impressions', *to_validate)]
 
 
@@ -382,6 +508,19 @@ class RedisEventsStorageTests(object):  # pylint: disable=too-few-public-methods
         adapter.rpush.side_effect = _raise_exc
         assert storage.put(events) is False
 
+    def test_add_events_scripted(self, mocker):
+        """Test that events are pushed using a server-side script."""
+        adapter = mocker.Mock(spec=RedisAdapter)
+        script = mocker.Mock()
+        adapter.register_script.return_value = script
+        storage = RedisEventsStorage(adapter, get_metadata({}), True)
+        events = [EventWrapper(event=Event('key1', 'user', 'purchase', 10, 123456, None), size=1)]
+        assert storage.put(events) is True
+        assert script.mock_calls[0][1][0] == ['SPLITIO.events']
+        assert script.mock_calls[0][1][1][0] == 0
+        assert json.loads(script.mock_calls[0][1][1][1])['e']['key'] == 'key1'
+        assert adapter.rpush.mock_calls == []
+
 
 class RedisTelemetryStorageTests(object):
     """Redis-based telemetry storage test cases."""
@@ -422,6 +561,15 @@ class RedisTelemetryStorageTests(object):
             mocker.call('SPLITIO/' + metadata.sdk_version + '/' + metadata.instance_name + '/latency.some_latency.bucket.5')
         ]
 
+        pipe = mocker.Mock()
+        storage.add_latency_to_pipe('some_latency', 1, pipe)
+        storage.add_latency_to_pipe('some_latency', 5, pipe, 3)
+        storage.add_latency_to_pipe('some_latency', 22, pipe, 3)
+        assert pipe.incr.mock_calls == [
+            mocker.call('SPLITIO/' + metadata.sdk_version + '/' + metadata.instance_name + '/latency.some_latency.bucket.1'),
+            mocker.call('SPLITIO/' + metadata.sdk_version + '/' + metadata.instance_name + '/latency.some_latency.bucket.5', 3)
+        ]
+
     def test_inc_counter(self, mocker):
         """Test incrementing latency."""
         adapter = mocker.Mock(spec=RedisAdapter)
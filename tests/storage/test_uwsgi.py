@@ -76,6 +76,29 @@ class UWSGISplitStorageTests(object):
         assert splits['some_split_2'].name == 'some_split_2'
         assert 'some_split_3' in splits
 
+    def test_parsed_splits_cache(self, mocker):
+        """Test that splits are parsed again only after the splits version moves."""
+        uwsgi = get_uwsgi(True)
+        storage = UWSGISplitStorage(uwsgi)
+        from_raw_mock = self._get_from_raw_mock(mocker)
+        mocker.patch('splitio.models.splits.from_raw', new=from_raw_mock)
+        storage.put(from_raw_mock({'name': 'some_split', 'trafficTypeName': 'user'}))
+        storage.set_change_number(1)
+        from_raw_mock.reset_mock()
+
+        first = storage.get('some_split')
+        assert storage.get('some_split') is first
+        assert storage.fetch_many(['some_split'])['some_split'] is first
+        assert len(from_raw_mock.mock_calls) == 1
+        storage.set_change_number(1)
+        assert storage.get('some_split') is first
+
+        other = UWSGISplitStorage(uwsgi)  # Same cache as seen from another worker.
+        other.put(from_raw_mock({'name': 'some_split', 'trafficTypeName': 'account'}))
+        other.set_change_number(2)
+        assert storage.get('some_split').traffic_type_name == 'account'
+        assert storage.get('some_split') is not first
+
     def test_set_get_changenumber(self, mocker):
         """Test setting and retrieving changenumber."""
         uwsgi = get_uwsgi(True)
@@ -172,8 +195,19 @@ class UWSGISplitStorageTests(object):
         assert storage.get('some_split').killed is False
         assert storage.get('some_split').default_treatment == 'some'
 
+        reader = UWSGISplitStorage(uwsgi)  # Same cache as seen from another worker.
+        parsed = reader.get('some_split')
+        assert reader.get('some_split') is parsed
+
         storage.kill_locally('some_split', 'default_treatment', 3)
         assert storage.get('some_split').change_number == 3
+        assert storage.get_change_number() == 1
+        assert reader.get('some_split').killed is True
+        assert reader.get('some_split').default_treatment == 'default_treatment'
+        assert parsed.killed is False  # Splits already read are left untouched.
+
+        storage.set_change_number(1)
+        assert reader.get('some_split').killed is True
 
 
 class UWSGISegmentStorageTests(object):
@@ -235,6 +269,39 @@ class UWSGISegmentStorageTests(object):
         assert storage.segment_contains('some_segment', 'abc')
         assert not storage.segment_contains('some_segment', 'qwe')
 
+    def test_segment_contains_decodes_once(self, mocker):
+        """Test that segments are parsed again only when their change number moves."""
+        uwsgi = get_uwsgi(True)
+        storage = UWSGISegmentStorage(uwsgi)
+        storage.put(Segment('some_segment', ['abc'], 123))
+        loads_mock = mocker.spy(json, 'loads')
+
+        assert storage.segment_contains('some_segment', 'abc')
+        assert not storage.segment_contains('some_segment', 'def')
+        assert len([c for c in loads_mock.mock_calls if c[1][0].startswith('[')]) == 1
+
+        other = UWSGISegmentStorage(uwsgi)  # Same cache as seen from another worker.
+        other.update('some_segment', ['def'], ['abc'], 124)
+        assert storage.segment_contains('some_segment', 'def')
+        assert not storage.segment_contains('some_segment', 'abc')
+
+    def test_segment_contains_with_bloom_filters(self, mocker):
+        """Test that keys ruled out by the segment filter skip decoding the segment."""
+        uwsgi = get_uwsgi(True)
+        storage = UWSGISegmentStorage(uwsgi, True)
+        storage.put(Segment('some_segment', ['abc', 'def'], 123))
+        storage._filters._build('some_segment')
+        get_mock = mocker.spy(storage, '_get_decoded')
+
+        assert storage.segment_contains('some_segment', 'abc')
+        assert not storage.segment_contains('some_segment', 'qwe')
+        assert [c[1][0] for c in get_mock.mock_calls] == ['some_segment']
+
+        other = UWSGISegmentStorage(uwsgi)  # Same cache as seen from another worker.
+        other.update('some_segment', ['qwe'], [], 124)
+        storage._filters._build('some_segment')
+        assert storage.segment_contains('some_segment', 'qwe')
+
 
 class UWSGIImpressionsStorageTests(object):
     """UWSGI Impressions storage test cases."""
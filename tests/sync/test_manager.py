@@ -58,3 +58,22 @@ class ManagerTests(object):
         assert len(synchronizer.sync_all.mock_calls) == 1
         assert len(synchronizer.start_periodic_fetching.mock_calls) == 1
         assert len(synchronizer.start_periodic_data_recording.mock_calls) == 1
+
+    def test_ready_from_cache(self, mocker):
+        """Test that the sdk is ready before syncing when cached data was loaded."""
+        splits_ready_event = threading.Event()
+        synchronizer = mocker.Mock(spec=Synchronizer)
+        synchronizer.load_cached.return_value = True
+        ready_when_syncing = []
+        synchronizer.sync_all.side_effect = lambda: \
+            ready_when_syncing.append(splits_ready_event.is_set())
+        manager = Manager(splits_ready_event, synchronizer, mocker.Mock(), False)
+        manager.start()
+        assert ready_when_syncing == [True]
+
+        splits_ready_event.clear()
+        synchronizer.load_cached.return_value = False
+        del ready_when_syncing[:]
+        manager.start()
+        assert ready_when_syncing == [False]
+        assert splits_ready_event.is_set()
@@ -9,6 +9,8 @@ from splitio.storage import SplitStorage, SegmentStorage
 from splitio.models.splits import Split
 from splitio.sync.segment import SegmentSynchronizer
 from splitio.models.segments import Segment
+from splitio.storage.disk import DiskChangesCache
+from splitio.storage.inmemmory import InMemorySegmentStorage
 
 
 class SegmentsSynchronizerTests(object):
@@ -129,6 +131,114 @@ class SegmentsSynchronizerTests(object):
         assert mocker.call('segmentA', -1) in api_calls
         assert mocker.call('segmentA', 123) in api_calls
 
+    def test_resume_from_changes_cache(self, mocker, tmpdir):
+        """Test that a new synchronizer resumes from the segments cached on disk."""
+        def fetch_segment_mock(segment_name, change_number):
+            if change_number == -1:
+                return {'name': segment_name, 'added': ['key1', 'key2'], 'removed': [],
+                        'since': -1, 'till': 123}
+            if change_number == 123:
+                return {'name': segment_name, 'added': ['key3'], 'removed': ['key1'],
+                        'since': 123, 'till': 456}
+            return {'added': [], 'removed': [], 'since': 456, 'till': 456}
+
+        api = mocker.Mock()
+        api.fetch_segment.side_effect = fetch_segment_mock
+        segments_synchronizer = SegmentSynchronizer(api, mocker.Mock(), InMemorySegmentStorage(),
+                                                    DiskChangesCache(str(tmpdir)))
+        segments_synchronizer.synchronize_segment('segmentA')
+        segments_synchronizer.shutdown()
+        assert [c[1][1] for c in api.fetch_segment.mock_calls] == [-1, 123, 456]
+
+        api.reset_mock()
+        storage = InMemorySegmentStorage()
+        segments_synchronizer = SegmentSynchronizer(api, mocker.Mock(), storage,
+                                                    DiskChangesCache(str(tmpdir)))
+        segments_synchronizer.synchronize_segment('segmentA')
+        segments_synchronizer.shutdown()
+        assert [c[1][1] for c in api.fetch_segment.mock_calls] == [456]
+        assert storage.get_change_number('segmentA') == 456
+        assert storage.segment_contains('segmentA', 'key2')
+        assert storage.segment_contains('segmentA', 'key3')
+        assert not storage.segment_contains('segmentA', 'key1')
+
+        api.reset_mock()
+        split_storage = mocker.Mock()
+        split_storage.get_segment_names.return_value = ['segmentA']
+        storage = InMemorySegmentStorage()
+        segments_synchronizer = SegmentSynchronizer(api, split_storage, storage,
+                                                    DiskChangesCache(str(tmpdir)))
+        assert segments_synchronizer.load_cached()
+        split_storage.get_segment_names.return_value = ['segmentA', 'segmentB']
+        assert not segments_synchronizer.load_cached()
+        segments_synchronizer.shutdown()
+        assert storage.get_change_number('segmentA') == 456
+        assert api.fetch_segment.mock_calls == []
+
+    def test_pipelined_pages(self, mocker):
+        """Test that the next page is requested before the current one is applied."""
+        fetched = []
+        next_page_requested = threading.Event()
+
+        def fetch_segment_mock(segment_name, change_number):
+            fetched.append(change_number)
+            if change_number == 1:
+                next_page_requested.set()
+            if change_number < 3:
+                return {'name': segment_name, 'added': ['key%d' % change_number], 'removed': [],
+                        'since': change_number, 'till': change_number + 1}
+            return {'added': [], 'removed': [], 'since': 3, 'till': 3}
+
+        api = mocker.Mock()
+        api.fetch_segment.side_effect = fetch_segment_mock
+        storage = InMemorySegmentStorage()
+        applied = []
+        original_update = storage.update
+
+        def update_mock(segment_name, to_add, to_remove, change_number):
+            if change_number == 1:
+                applied.append(next_page_requested.wait(1))
+            original_update(segment_name, to_add, to_remove, change_number)
+        storage.update = update_mock
+
+        segments_synchronizer = SegmentSynchronizer(api, mocker.Mock(), storage)
+        segments_synchronizer.synchronize_segment('segmentA')
+        assert fetched == [-1, 0, 1, 2, 3]
+        assert applied == [True]
+        assert storage.get_change_number('segmentA') == 3
+        assert all(storage.segment_contains('segmentA', 'key%d' % num) for num in range(0, 3))
+        assert list(segments_synchronizer.get_segment_sync_durations()) == ['segmentA']
+
+        # A till older than the changes received stops fetching.
+        fetched[:] = []
+        storage.put(Segment('segmentB', [], 0))
+        segments_synchronizer.synchronize_segment('segmentB', 0)
+        assert fetched == [0]
+
+    def test_pool_size(self, mocker):
+        """Test that the worker pool is sized after the segments and their sync duration."""
+        split_storage = mocker.Mock(spec=SplitStorage)
+        split_storage.get_segment_names.return_value = ['segment%d' % i for i in range(0, 200)]
+        api = mocker.Mock()
+        api.fetch_segment.return_value = {'added': [], 'removed': [], 'since': 1, 'till': 1}
+        storage = mocker.Mock(spec=SegmentStorage)
+        storage.get_change_number.return_value = 1
+        segments_synchronizer = SegmentSynchronizer(api, split_storage, storage)
+        assert segments_synchronizer._worker_pool.worker_count == 10
+        assert segments_synchronizer._pool_size(3) == 10
+        assert segments_synchronizer._pool_size(30) == 30
+        assert segments_synchronizer._pool_size(300) == 50
+
+        assert segments_synchronizer.synchronize_segments()
+        assert segments_synchronizer._worker_pool.worker_count == 50
+        assert len(segments_synchronizer.get_segment_sync_durations()) == 200
+
+        segments_synchronizer._average_duration = 0.1
+        assert segments_synchronizer._pool_size(200) == 20
+        segments_synchronizer._average_duration = 0.001
+        assert segments_synchronizer._pool_size(200) == 10
+        segments_synchronizer.shutdown()
+
     def test_recreate(self, mocker):
         """Test recreate logic."""
         segments_synchronizer = SegmentSynchronizer(mocker.Mock(), mocker.Mock(), mocker.Mock())
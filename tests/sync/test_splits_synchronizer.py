@@ -9,6 +9,8 @@ from splitio.tasks import split_sync
 from splitio.storage import SplitStorage
 from splitio.models.splits import Split
 from splitio.sync.split import SplitSynchronizer
+from splitio.storage.disk import DiskChangesCache
+from splitio.storage.inmemmory import InMemorySplitStorage
 
 
 class SplitsSynchronizerTests(object):
@@ -102,7 +104,7 @@ class SplitsSynchronizerTests(object):
         assert mocker.call(-1) in api.fetch_splits.mock_calls
         assert mocker.call(123) in api.fetch_splits.mock_calls
 
-        inserted_split = storage.put.mock_calls[0][1][0]
+        inserted_split = storage.update.mock_calls[0][1][0][0]
         assert isinstance(inserted_split, Split)
         assert inserted_split.name == 'some_name'
 
@@ -127,3 +129,35 @@ class SplitsSynchronizerTests(object):
         split_synchronizer.synchronize_splits(1)
 
         assert get_changes.called == 0
+
+    def test_resume_from_changes_cache(self, mocker, tmpdir):
+        """Test that a new synchronizer resumes from the splits cached on disk."""
+        raw_split = {
+            'changeNumber': 123, 'trafficTypeName': 'user', 'name': 'some_name',
+            'trafficAllocation': 100, 'trafficAllocationSeed': 123456, 'seed': 321654,
+            'status': 'ACTIVE', 'killed': False, 'defaultTreatment': 'off', 'algo': 2,
+            'conditions': []
+        }
+        api = mocker.Mock()
+        api.fetch_splits.side_effect = lambda since: \
+            {'splits': [raw_split], 'since': -1, 'till': 123} if since == -1 \
+            else {'splits': [], 'since': since, 'till': since}
+
+        SplitSynchronizer(api, InMemorySplitStorage(), DiskChangesCache(str(tmpdir))) \
+            .synchronize_splits()
+        assert api.fetch_splits.mock_calls == [mocker.call(-1), mocker.call(123)]
+
+        api.reset_mock()
+        storage = InMemorySplitStorage()
+        SplitSynchronizer(api, storage, DiskChangesCache(str(tmpdir))).synchronize_splits()
+        assert api.fetch_splits.mock_calls == [mocker.call(123)]
+        assert storage.get_change_number() == 123
+        assert storage.get('some_name').default_treatment == 'off'
+
+        api.reset_mock()
+        storage = InMemorySplitStorage()
+        split_synchronizer = SplitSynchronizer(api, storage, DiskChangesCache(str(tmpdir)))
+        assert split_synchronizer.load_cached()
+        assert not split_synchronizer.load_cached()  # Storage isn't empty anymore.
+        assert storage.get_change_number() == 123
+        assert api.fetch_splits.mock_calls == []
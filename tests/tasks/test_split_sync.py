@@ -90,7 +90,7 @@ class SplitSynchronizationTests(object):
         assert mocker.call(-1) in api.fetch_splits.mock_calls
         assert mocker.call(123) in api.fetch_splits.mock_calls
 
-        inserted_split = storage.put.mock_calls[0][1][0]
+        inserted_split = storage.update.mock_calls[0][1][0][0]
         assert isinstance(inserted_split, Split)
         assert inserted_split.name == 'some_name'
 
@@ -1,5 +1,5 @@
 """Workerpool test module."""
-# pylint: disable=no-self-use,too-few-public-methods,missing-docstring
+# pylint: disable=no-self-use,too-few-public-methods,missing-docstring,protected-access
 import time
 import threading
 from splitio.tasks.util import workerpool
@@ -71,3 +71,26 @@ class WorkerPoolTests(object):
 
         wpool.wait_for_completion()
         assert len(worker.worked) == 100
+
+    def test_resize(self):
+        """Test that the pool can grow and shrink while running."""
+        worked = []
+        wpool = workerpool.WorkerPool(2, worked.append)
+        wpool.start()
+        wpool.resize(5)
+        assert wpool.worker_count == 5
+        for num in range(0, 20):
+            wpool.submit_work(str(num))
+        wpool.wait_for_completion()
+        wpool.resize(1)
+        assert wpool.worker_count == 1
+        wpool.wait_for_completion()
+        assert len([thread for thread, _ in wpool._workers if thread.is_alive()]) == 1
+
+        for num in range(20, 40):
+            wpool.submit_work(str(num))
+        stop_event = threading.Event()
+        wpool.stop(stop_event)
+        stop_event.wait(5)
+        assert stop_event.is_set()
+        assert sorted(worked) == sorted(str(num) for num in range(0, 40))
@@ -0,0 +1,122 @@
+"""Bloom filter test module."""
+# pylint: disable=no-self-use,protected-access
+import threading
+import time
+
+from splitio.util import bloom
+
+
+class BloomFilterTests(object):
+    """Bloom filter test cases."""
+
+    def test_membership(self):
+        """Test that added items are always found and others rarely are."""
+        members = ['member_%d' % index for index in range(10000)]
+        bloom_filter = bloom.build_filter(members, 0.01)
+        assert all(bloom_filter.might_contain(member) for member in members)
+        false_positives = sum(
+            1 for index in range(10000) if bloom_filter.might_contain('other_%d' % index)
+        )
+        assert false_positives < 300
+
+    def test_empty(self):
+        """Test that an empty filter contains nothing."""
+        bloom_filter = bloom.build_filter([])
+        assert not bloom_filter.might_contain('some_key')
+
+
+class _SyncThread(object):  # pylint: disable=too-few-public-methods
+    """Thread replacement running its target on start."""
+
+    def __init__(self, target, args, name=None):  # pylint: disable=unused-argument
+        self._target = target
+        self._args = args
+        self.daemon = False
+
+    def start(self):
+        """Run the target in the calling thread."""
+        self._target(*self._args)
+
+
+class SegmentFiltersTests(object):
+    """Segment filters test cases."""
+
+    def test_build_and_stale_filters(self, mocker):
+        """Test that filters hide members added after they were built for a bounded time."""
+        mocker.patch('splitio.util.bloom.threading.Thread', new=_SyncThread)
+        time_mock = mocker.Mock()
+        time_mock.return_value = 100
+        mocker.patch('splitio.util.bloom.time.time', new=time_mock)
+        change_numbers = {'segment': 1}
+        members = {'segment': ['k1', 'k2']}
+        fetch_change_number = mocker.Mock(side_effect=change_numbers.get)
+        fetch_members = mocker.Mock(side_effect=members.get)
+        filters = bloom.SegmentFilters(fetch_change_number, fetch_members, 5)
+
+        assert filters.might_contain('segment', 'k3')  # No filter yet, one is built.
+        assert fetch_members.mock_calls == [mocker.call('segment')]
+        fetch_change_number.reset_mock()
+        fetch_members.reset_mock()
+        assert not filters.might_contain('segment', 'k3')
+        assert filters.might_contain('segment', 'k1')
+        assert fetch_change_number.mock_calls == []
+        assert fetch_members.mock_calls == []
+
+        change_numbers['segment'] = 2
+        members['segment'] = ['k3']
+        time_mock.return_value = 104
+        assert not filters.might_contain('segment', 'k3')  # Stale, but verified recently.
+        assert fetch_change_number.mock_calls == []
+        time_mock.return_value = 106
+        assert filters.might_contain('segment', 'k3')  # Verification due, rebuilt.
+        assert fetch_change_number.mock_calls == [mocker.call('segment')]
+        assert fetch_members.mock_calls == [mocker.call('segment')]
+        assert filters.might_contain('segment', 'k3')
+        assert not filters.might_contain('segment', 'k1')
+        assert len(fetch_change_number.mock_calls) == 1
+
+        time_mock.return_value = 112
+        assert filters.might_contain('segment', 'k1')  # Verified again, nothing to rebuild.
+        assert len(fetch_change_number.mock_calls) == 2
+        assert len(fetch_members.mock_calls) == 1
+        assert not filters.might_contain('segment', 'k1')
+        assert len(fetch_change_number.mock_calls) == 2
+
+    def test_missing_segment(self, mocker):
+        """Test that keys might be members of segments that cannot be found."""
+        mocker.patch('splitio.util.bloom.threading.Thread', new=_SyncThread)
+        fetch_members = mocker.Mock()
+        filters = bloom.SegmentFilters(lambda _: None, fetch_members, 5)
+        assert filters.might_contain('missing', 'k1')
+        assert filters.might_contain('missing', 'k1')
+        assert fetch_members.mock_calls == []
+
+    def test_background_build(self, mocker):
+        """Test that lookups are answered while the filter is being built."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch_members(_):
+            started.set()
+            release.wait()
+            return ['k1']
+
+        filters = bloom.SegmentFilters(lambda _: 1, fetch_members, 5)
+        assert filters.might_contain('segment', 'k2')
+        assert started.wait(5)
+        assert filters.might_contain('segment', 'k2')
+        release.set()
+        for _ in range(500):
+            if filters.might_contain('segment', 'k2') is False:
+                break
+            time.sleep(0.01)
+        assert filters.might_contain('segment', 'k2') is False
+
+    def test_errors(self, mocker):
+        """Test that keys might be members when filters cannot be built."""
+        mocker.patch('splitio.util.bloom.threading.Thread', new=_SyncThread)
+        fetch_members = mocker.Mock(side_effect=Exception('something'))
+        filters = bloom.SegmentFilters(lambda _: 1, fetch_members, 5)
+        assert filters.might_contain('segment', 'k1')
+        assert filters.might_contain('segment', 'k2')
+        assert len(fetch_members.mock_calls) == 1